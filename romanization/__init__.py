@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+حزمة الرومنة القابلة للاستيراد: المحرك المشترك وسجل الأنظمة.
+
+    import romanization
+    romanization.romanize("الشَّمْس", "ala-lc")
+    romanization.romanize_all("الشَّمْس")
+
+جداول كل نظام تُحمَّل وتُترجم عند أول استخدام له فقط.
+للاستخدام من تطبيقات asyncio دون حجب حلقة الأحداث: romanization.aio
+وللبحث بالرومنة والعودة إلى الأصول العربية: romanization.index
+الملفان رومنة.py و أنظمة_الرومنة.py واجهتا توافق فوق هذه الحزمة.
+"""
+
+from .engine import (
+    Alignment,
+    CompiledSystem,
+    Profiler,
+    StreamRomanizer,
+    compile_system,
+    normalize_text,
+    romanize_text_multi,
+)
+from .systems import (
+    ROMANIZATION_SYSTEMS,
+    SYSTEM_DEFINITIONS,
+    SYSTEM_KEYS,
+    disable_profiling,
+    enable_profiling,
+    get_cache_info,
+    get_compiled_system,
+    get_definition,
+    get_profiler,
+    get_romanization_system,
+    loaded_systems,
+    resolve_system_name,
+    romanize_all,
+    romanize_stream,
+    set_lexicon,
+    set_word_cache_size,
+)
+
+
+def romanize(text, system='current'):
+    """رومنة نص بالنظام المختار (اسم مختصر مثل ala-lc، أو الاسم الكامل)"""
+    return get_compiled_system(resolve_system_name(system)).romanize_text(text)
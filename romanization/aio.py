@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+واجهة asyncio للرومنة: نسخ قابلة للانتظار (awaitable) من دوال الرومنة
+تنقل العمل إلى منفِّذ قابل للتهيئة بدل حجب حلقة الأحداث.
+
+    from romanization import aio
+    result = await aio.romanize_ala_lc(text)
+    async for part in aio.iter_romanize(text, 'dmg'):
+        ...
+
+النص الكبير يُقسم عند حدود آمنة (chunk_spans) إلى أجزاء محدودة الحجم،
+فلا تشغل أي مهمة واحدة عاملاً طويلاً، والنتيجة مطابقة لرومنة النص دفعة واحدة.
+"""
+
+import asyncio
+import weakref
+
+from .engine import chunk_spans
+from .systems import (
+    get_compiled_system,
+    resolve_system_name,
+    romanize_all as _romanize_all,
+)
+
+# حجم الجزء الواحد (بالأحرف): بضع عشرات من الميلي ثانية على الأكثر لكل مهمة
+DEFAULT_CHUNK_SIZE = 1 << 15
+
+# الحد الافتراضي للأجزاء قيد التنفيذ في وقت واحد (لكل حلقة أحداث)
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+def _romanize_chunk(system_name, text):
+    """رومنة جزء واحد (دالة على مستوى الوحدة حتى تصلح لمنفِّذ العمليات أيضاً)"""
+    return get_compiled_system(system_name).romanize_text(text)
+
+
+def _romanize_all_chunk(system_names, text):
+    """رومنة جزء واحد بعدة أنظمة في مرور واحد"""
+    return _romanize_all(text, system_names)
+
+
+class AsyncRomanizer:
+    """
+    مُرومن غير متزامن:
+      - executor: المنفِّذ الذي تُنقل إليه الأجزاء (None = المنفِّذ الافتراضي لحلقة الأحداث)؛
+        يصلح ThreadPoolExecutor أو ProcessPoolExecutor.
+      - max_concurrency: أقصى عدد أجزاء قيد التنفيذ في وقت واحد لكل حلقة أحداث.
+      - chunk_size: حجم الجزء بالأحرف.
+    """
+
+    def __init__(self, executor=None, max_concurrency=DEFAULT_MAX_CONCURRENCY,
+                 chunk_size=DEFAULT_CHUNK_SIZE):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency يجب أن يكون 1 على الأقل")
+        if chunk_size < 1:
+            raise ValueError("chunk_size يجب أن يكون 1 على الأقل")
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self.chunk_size = chunk_size
+        # إشارة (Semaphore) لكل حلقة أحداث، تُنشأ داخل الحلقة عند أول استخدام
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def _semaphore(self, loop):
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def _run(self, function, *args):
+        """تنفيذ مهمة واحدة على المنفِّذ ضمن حد التزامن"""
+        loop = asyncio.get_running_loop()
+        async with self._semaphore(loop):
+            return await loop.run_in_executor(self.executor, function, *args)
+
+    def _chunks(self, text):
+        return [text[start:end] for start, end in chunk_spans(text, self.chunk_size)]
+
+    async def romanize(self, text, system='current'):
+        """رومنة نص بالنظام المختار (اسم مختصر مثل ala-lc أو الاسم الكامل)"""
+        system_name = resolve_system_name(system)
+        chunks = self._chunks(text)
+        if len(chunks) == 1:
+            return await self._run(_romanize_chunk, system_name, chunks[0])
+        results = await asyncio.gather(*(
+            self._run(_romanize_chunk, system_name, chunk) for chunk in chunks
+        ))
+        return "".join(results)
+
+    async def romanize_all(self, text, system_names=None):
+        """رومنة النص بعدة أنظمة في مرور واحد (الكل افتراضياً): {اسم النظام: النتيجة}"""
+        names = list(system_names) if system_names else None
+        results = await asyncio.gather(*(
+            self._run(_romanize_all_chunk, names, chunk) for chunk in self._chunks(text)
+        ))
+        merged = {}
+        for result in results:
+            for name, romanized in result.items():
+                merged.setdefault(name, []).append(romanized)
+        return {name: "".join(parts) for name, parts in merged.items()}
+
+    async def iter_romanize(self, text, system='current'):
+        """
+        مُكرِّر غير متزامن يُنتج رومنة الأجزاء بترتيبها فور اكتمال كل جزء،
+        مع max_concurrency جزءاً على الأكثر قيد التنفيذ مسبقاً.
+        """
+        system_name = resolve_system_name(system)
+        loop = asyncio.get_running_loop()
+        chunks = self._chunks(text)
+        pending = []
+        submitted = 0
+        try:
+            while pending or submitted < len(chunks):
+                while submitted < len(chunks) and len(pending) < self.max_concurrency:
+                    pending.append(loop.create_task(
+                        self._run(_romanize_chunk, system_name, chunks[submitted])
+                    ))
+                    submitted += 1
+                yield await pending.pop(0)
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+# المُرومن الافتراضي الذي تستخدمه الدوال أدناه (انظر configure)
+_default = AsyncRomanizer()
+
+
+def configure(executor=None, max_concurrency=DEFAULT_MAX_CONCURRENCY, chunk_size=DEFAULT_CHUNK_SIZE):
+    """استبدال المُرومن الافتراضي (المنفِّذ، حد التزامن، حجم الجزء) وإرجاعه"""
+    global _default
+    _default = AsyncRomanizer(executor, max_concurrency, chunk_size)
+    return _default
+
+
+def get_async_romanizer():
+    """المُرومن الافتراضي الحالي"""
+    return _default
+
+
+async def romanize(text, system='current'):
+    """نسخة غير متزامنة من romanization.romanize"""
+    return await _default.romanize(text, system)
+
+
+async def romanize_all(text, system_names=None):
+    """نسخة غير متزامنة من romanize_all"""
+    return await _default.romanize_all(text, system_names)
+
+
+def iter_romanize(text, system='current'):
+    """مُكرِّر غير متزامن لرومنة النص جزءاً جزءاً بالترتيب"""
+    return _default.iter_romanize(text, system)
+
+
+async def romanize_text(text):
+    """نسخة غير متزامنة من romanize_text (النظام الحالي)"""
+    return await _default.romanize(text, 'النظام الحالي')
+
+
+async def romanize_current(text):
+    """نسخة غير متزامنة من romanize_current"""
+    return await _default.romanize(text, 'النظام الحالي')
+
+
+async def romanize_ala_lc(text):
+    """نسخة غير متزامنة من romanize_ala_lc"""
+    return await _default.romanize(text, 'ALA-LC (مكتبة الكونغرس)')
+
+
+async def romanize_dmg(text):
+    """نسخة غير متزامنة من romanize_dmg"""
+    return await _default.romanize(text, 'DMG (الجمعية الألمانية)')
+
+
+async def romanize_iso233(text):
+    """نسخة غير متزامنة من romanize_iso233"""
+    return await _default.romanize(text, 'ISO 233 (المعيار الدولي)')
+
+
+async def romanize_ijmes(text):
+    """نسخة غير متزامنة من romanize_ijmes"""
+    return await _default.romanize(text, 'IJMES (المجلة الدولية)')
@@ -0,0 +1,955 @@
+# -*- coding: utf-8 -*-
+"""
+المحرك المشترك: ترجمة تعريفات الأنظمة (قواميس بيانات) إلى جداول، والرومنة بها.
+لا يحتوي جداول أي نظام؛ الجداول في romanization.tables وتُحمَّل عند أول استخدام.
+"""
+
+import re
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+
+# الأسماء العامة (ما يعيد رومنة.py تصديره)
+__all__ = [
+    'SHADDA_REPEAT', 'SHADDA_DOUBLE', 'SHADDA_DROP',
+    'is_arabic_letter', 'strip_diacritics',
+    'IGNORABLE_CHARS', 'PRESENTATION_FORMS', 'NORMALIZATION_PATTERN',
+    'normalize_text', 'normalize_text_with_offsets',
+    'TOKEN_PATTERN', 'DEFAULT_WORD_CACHE_SIZE', 'CONTEXT_CHARS', 'CONTEXT_SPLIT_PATTERN',
+    'analyze_word',
+    'Profiler', 'enable_profiling', 'disable_profiling', 'get_profiler',
+    'Alignment', 'CompiledSystem', 'romanize_text_multi',
+    'StreamRomanizer', 'chunk_spans', 'compile_system',
+]
+
+########################################
+# 1) ثوابت تعريفات الأنظمة
+########################################
+
+# أوضاع معالجة الشدة (ّ) في تعريفات الأنظمة
+SHADDA_REPEAT = 'repeat'  # تكرار رومنة الحرف السابق، أو الحرف نفسه إن لم تكن له رومنة
+SHADDA_DOUBLE = 'double'  # تكرار رومنة الحرف السابق إن وُجدت، وتبقى الشدة كما هي في أول الجذع
+SHADDA_DROP = 'drop'      # حذف الشدة تماماً
+
+########################################
+# 2) دوال مساعدة
+########################################
+
+def is_arabic_letter(ch):
+    """يتحقق إن كان الحرف ضمن نطاق الحروف العربية."""
+    return '\u0600' <= ch <= '\u06FF'
+
+def strip_diacritics(text):
+    """
+    دالّة اختيارية لإزالة كل التشكيل (الحركات) من النص
+    إذا كنت تريد معالجة نص غير مشكّل بشكل مبدئي.
+    """
+    arabic_diacritics = re.compile(r"[ًٌٍَُِّْ]")
+    return re.sub(arabic_diacritics, '', text)
+
+########################################
+# 3) التطبيع قبل التقسيم
+########################################
+
+# ما يُحذف قبل الرومنة: التطويل، وعلامات الاتجاه والتحكم غير المرئية
+# (ALM، LRM/RLM، التضمين والتجاوز والعزل، ZWSP و ZWJ، BOM، الواصلة اللينة).
+# ZWNJ يبقى لأنه فاصل ذو معنى في الكتابة الفارسية والأردية.
+IGNORABLE_CHARS = (
+    '\u0640\u061c\u00ad\u200b\u200d\u200e\u200f'
+    '\u202a\u202b\u202c\u202d\u202e\u2066\u2067\u2068\u2069\ufeff'
+)
+
+# نطاقات أشكال العرض العربية (Presentation Forms-A و -B)
+PRESENTATION_FORMS = ((0xFB50, 0xFDFF), (0xFE70, 0xFEFF))
+
+# سلاسل الأحرف التي تحتاج تطبيعاً؛ ما بينها يُنسخ كما هو داخل re.sub نفسه
+NORMALIZATION_PATTERN = re.compile(
+    '[' + IGNORABLE_CHARS + ''.join(f'{chr(a)}-{chr(b)}' for a, b in PRESENTATION_FORMS) + ']+'
+)
+
+_normalization_table = None
+
+# أشكال العرض التي يحتوي تطبيعها حروف كلمة وإن لم تكن هي حرف كلمة (﷼ -> ریال)،
+# تُبنى مع الجدول ويستعملها _is_word_char
+_word_forms = None
+
+
+def _build_normalization_table():
+    """
+    جدول str.translate محسوب مرة واحدة: كل شكل عرض إلى حروفه المعيارية (NFKC)
+    بلا المسافة والتطويل اللذين يضيفهما NFKC لأشكال الحركات المعزولة،
+    وكل حرف في IGNORABLE_CHARS إلى لا شيء.
+    """
+    import unicodedata
+
+    table = {}
+    for first, last in PRESENTATION_FORMS:
+        for code in range(first, last + 1):
+            ch = chr(code)
+            folded = unicodedata.normalize('NFKC', ch)
+            if folded != ch:
+                table[code] = folded.lstrip(' ').replace('\u0640', '')
+    for ch in IGNORABLE_CHARS:
+        table[ord(ch)] = None
+    return table
+
+
+def _load_normalization_table():
+    global _normalization_table, _word_forms
+    table = _build_normalization_table()
+    _word_forms = frozenset(
+        chr(code) for code, folded in table.items()
+        if folded and not _is_plain_word_char(chr(code))
+        and any(_is_plain_word_char(c) for c in folded)
+    )
+    _normalization_table = table
+
+
+def _normalize_run(match):
+    if _normalization_table is None:
+        _load_normalization_table()
+    return match.group().translate(_normalization_table)
+
+
+def normalize_text(text):
+    """
+    تطبيع النص قبل التقسيم: طي أشكال العرض العربية إلى حروفها (ﻻ -> لا، ﷲ -> الله)،
+    وحذف التطويل وعلامات الاتجاه والتحكم.
+    مرور واحد بـ NORMALIZATION_PATTERN: لا تُترجم بالجدول إلا السلاسل المطابقة،
+    والنص النظيف يُعاد كما هو دون نسخ.
+    """
+    return NORMALIZATION_PATTERN.sub(_normalize_run, text)
+
+
+def normalize_text_with_offsets(text):
+    """
+    normalize_text مع ما يلزم لإرجاع المواضع إلى النص الأصلي:
+    تُرجع (النص المطبَّع، السلاسل المطبَّعة) وكل سلسلة
+    (بدايتها في المطبَّع، نهايتها في المطبَّع، بدايتها في الأصل، نهايتها في الأصل).
+    النص النظيف يُعاد كما هو مع قائمة فارغة.
+    """
+    pieces = []
+    runs = []
+    pos = 0
+    normalized_pos = 0
+    for match in NORMALIZATION_PATTERN.finditer(text):
+        start, end = match.span()
+        pieces.append(text[pos:start])
+        normalized_pos += start - pos
+        folded = _normalize_run(match)
+        pieces.append(folded)
+        runs.append((normalized_pos, normalized_pos + len(folded), start, end))
+        normalized_pos += len(folded)
+        pos = end
+    if not runs:
+        return text, runs
+    pieces.append(text[pos:])
+    return "".join(pieces), runs
+
+########################################
+# 4) المحرك المشترك المترجَم مسبقاً
+########################################
+
+# المقسّم المترجَم الوحيد (tokenizer)، يحدد صنف الكلمة من المطابقة نفسها:
+#   arabic: سلسلة من نطاق الحروف العربية
+#   mixed:  كلمة \w تبدأ بحرف غير عربي وتحتوي حروفاً عربية (تُرومن أيضاً)
+#   latin:  كلمة \w بلا حروف عربية (تُنسخ كما هي)
+# المسافات وعلامات الترقيم لا تطابق أصلاً، فتُنسخ كشرائح بين المطابقات
+# دون فحصها مرة أخرى.
+TOKEN_PATTERN = re.compile(
+    r'(?P<arabic>[\u0600-\u06FF]+)'
+    r'|(?P<mixed>[^\W\u0600-\u06FF]+(?=[\u0600-\u06FF])\w+)'
+    r'|(?P<latin>\w+)'
+)
+
+# الحجم الافتراضي لذاكرة الكلمات المؤقتة (LRU) لكل نظام
+# النص العربي يتكرر فيه عدد قليل من الكلمات كثيراً (الله، في، من، على...)
+DEFAULT_WORD_CACHE_SIZE = 4096
+
+# الأحرف ذات القواعد السياقية: الشدة (تعتمد على الحرف السابق)،
+# والتاء المربوطة والألف الممدودة (تعتمدان على موقعهما في الجذع)
+CONTEXT_CHARS = 'ّةآ'
+CONTEXT_SPLIT_PATTERN = re.compile('([ّةآ])')
+
+def analyze_word(word):
+    """
+    التحليل المستقل عن النظام لكلمة واحدة، يُحسب مرة واحدة ويُستخدم لكل الأنظمة.
+    يُرجع tuple بسيطاً (أسرع إنشاءً من namedtuple) بالترتيب:
+      - word: الكلمة نفسها
+      - has_article: هل تبدأ الكلمة بـ "ال" التعريف
+      - stem: الجذع بعد فصل "ال"
+      - segments: مقاطع الجذع [سلسلة عادية، حرف سياقي، سلسلة عادية، ...]
+        أي مواقع الشدة والتاء المربوطة والألف الممدودة
+    """
+    has_article = len(word) > 2 and word.startswith('ال')
+    stem = word[2:] if has_article else word
+    return word, has_article, stem, CONTEXT_SPLIT_PATTERN.split(stem)
+
+
+def _make_shadda_rule(mode, letters):
+    """
+    تبني قاعدة الشدة حسب وضع النظام.
+    تكرار الحرف يعتمد على الحرف العربي السابق في الجذع (لا على آخر ما أُضيف للرومنة).
+    """
+    if mode == SHADDA_REPEAT:
+        def rule(stem, i):
+            if i > 0:
+                prev_ch = stem[i - 1]
+                return letters.get(prev_ch, prev_ch), i + 1
+            return '', i + 1
+    elif mode == SHADDA_DOUBLE:
+        def rule(stem, i):
+            if i > 0:
+                return letters.get(stem[i - 1], ''), i + 1
+            return 'ّ', i + 1
+    else:
+        raise ValueError(f"وضع شدة غير معروف: {mode}")
+    return rule
+
+
+def _make_positional_rule(final_or_initial, other, at_start):
+    """
+    قاعدة تعتمد على موقع الحرف في الجذع:
+      - التاء المربوطة: آخر الجذع -> القيمة الأولى، وإلا -> الثانية
+      - الألف الممدودة: أول الجذع -> القيمة الأولى، وإلا -> الثانية
+    """
+    if at_start:
+        def rule(stem, i):
+            return (final_or_initial if i == 0 else other), i + 1
+    else:
+        def rule(stem, i):
+            return (final_or_initial if i == len(stem) - 1 else other), i + 1
+    return rule
+
+
+def _make_longest_match_rule(candidates, fallback):
+    """
+    قاعدة أطول مطابقة للمفاتيح متعددة الأحرف (مثل 'لا').
+    candidates مرتبة من الأطول إلى الأقصر، و fallback هو إجراء الحرف المفرد.
+    """
+    def rule(stem, i):
+        for key, value in candidates:
+            if stem.startswith(key, i):
+                return value, i + len(key)
+        if fallback is None:
+            return stem[i], i + 1
+        if type(fallback) is str:
+            return fallback, i + 1
+        return fallback(stem, i)
+    return rule
+
+
+class Profiler:
+    """
+    قياس اختياري لمراحل الرومنة: الزمن التراكمي وعدد الاستدعاءات لكل مرحلة
+    (التطبيع، التقسيم، الذاكرة المؤقتة، التحليل، الكلمات الخاصة، المعجم، القواعد، التجميع)،
+    وعدد مرات المرور بكل فرع من فروع القواعد (أداة التعريف، الشدة، التاء المربوطة،
+    التنوين، النسخ كما هو...).
+    العدّادات غير محمية بقفل: هي للتشخيص وليست للمحاسبة الدقيقة بين الخيوط.
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.branches = {}
+
+    def add(self, stage, seconds, calls=1):
+        """إضافة زمن إلى مرحلة."""
+        entry = self.stages.get(stage)
+        if entry is None:
+            self.stages[stage] = [calls, seconds]
+        else:
+            entry[0] += calls
+            entry[1] += seconds
+
+    def count(self, branch, n=1):
+        """زيادة عدّاد فرع من فروع القواعد."""
+        self.branches[branch] = self.branches.get(branch, 0) + n
+
+    def reset(self):
+        """تصفير كل العدّادات."""
+        self.stages.clear()
+        self.branches.clear()
+
+    def as_dict(self):
+        """البيانات بصيغة قابلة للتحويل إلى JSON."""
+        return {
+            'stages': {
+                stage: {'calls': calls, 'seconds': seconds}
+                for stage, (calls, seconds) in self.stages.items()
+            },
+            'branches': dict(self.branches),
+        }
+
+    def report(self):
+        """تقرير نصي: المراحل مرتبة حسب الزمن، ثم عدّادات الفروع."""
+        lines = [f"{'المرحلة':<16} {'الاستدعاءات':>12} {'الزمن (ms)':>12} {'المتوسط (µs)':>13}"]
+        for stage, (calls, seconds) in sorted(self.stages.items(), key=lambda item: -item[1][1]):
+            average = seconds / calls * 1e6 if calls else 0.0
+            lines.append(f"{stage:<16} {calls:>12} {seconds * 1e3:>12.2f} {average:>13.2f}")
+        if self.branches:
+            lines.append("")
+            lines.append(f"{'الفرع':<16} {'العدد':>12}")
+            for branch, n in sorted(self.branches.items(), key=lambda item: -item[1]):
+                lines.append(f"{branch:<16} {n:>12}")
+        return "\n".join(lines)
+
+
+# القياس معطّل افتراضياً؛ romanize_text يفحص هذا المتغير مرة واحدة لكل استدعاء
+_profiler = None
+
+
+def enable_profiling(profiler=None):
+    """تفعيل القياس (بمقياس جديد أو مُمرَّر) وإرجاع المقياس المستخدم."""
+    global _profiler
+    _profiler = profiler or Profiler()
+    return _profiler
+
+
+def disable_profiling():
+    """إيقاف القياس وإرجاع المقياس الأخير (أو None)."""
+    global _profiler
+    profiler, _profiler = _profiler, None
+    return profiler
+
+
+def get_profiler():
+    """المقياس المفعّل حالياً (أو None)."""
+    return _profiler
+
+
+def _restore_source_offsets(offsets, runs):
+    """
+    تحويل مواضع تصاعدية في النص المطبَّع (من normalize_text_with_offsets) إلى مواضع في الأصل، في مكانها.
+    الموضع داخل سلسلة مطبَّعة يُحصر فيها، والموضع عند حرف محذوف يقع بعده.
+    """
+    current = None
+    next_run = 0
+    for k, p in enumerate(offsets):
+        while next_run < len(runs) and runs[next_run][0] <= p:
+            current = runs[next_run]
+            next_run += 1
+        if current is None:
+            continue
+        normalized_start, normalized_end, source_start, source_end = current
+        if p >= normalized_end:
+            offsets[k] = source_end + p - normalized_end
+        else:
+            offsets[k] = min(source_start + p - normalized_start, source_end)
+
+
+class Alignment:
+    """
+    محاذاة بين النص الأصلي ورومنته: مقطع لكل token بالترتيب، بما فيها ما يُنسخ كما هو
+    (المسافات وعلامات الترقيم والكلمات اللاتينية)، في ثلاث مصفوفات array متوازية:
+    source_starts و source_ends و output_starts. المقاطع متتالية تغطي النصين،
+    فنهاية المقطع في الرومنة بداية المقطع التالي (أو output_length للأخير).
+    الموضع داخل مقطع متساوي الطول في الجهتين يُنقل حرفاً بحرف، وداخل غيره يُوسَّع إلى المقطع كله.
+    """
+
+    __slots__ = ('source_starts', 'source_ends', 'output_starts', 'source_length', 'output_length')
+
+    def __init__(self, source_starts, source_ends, output_starts, source_length, output_length):
+        self.source_starts = source_starts
+        self.source_ends = source_ends
+        self.output_starts = output_starts
+        self.source_length = source_length
+        self.output_length = output_length
+
+    def __len__(self):
+        return len(self.output_starts)
+
+    def __repr__(self):
+        return f"Alignment({len(self)} مقطع، {self.source_length} -> {self.output_length})"
+
+    def _output_end(self, i):
+        return self.output_starts[i + 1] if i + 1 < len(self.output_starts) else self.output_length
+
+    def _source_end(self, i):
+        return self.source_ends[i]
+
+    def _is_literal(self, i):
+        return self.source_ends[i] - self.source_starts[i] == self._output_end(i) - self.output_starts[i]
+
+    def to_source(self, start, end=None):
+        """المجال في الأصل المقابل للمجال [start, end) من الرومنة (end الافتراضي = start)"""
+        return self._map(start, start if end is None else end,
+                         self.output_starts, self.source_starts, self._source_end)
+
+    def to_output(self, start, end=None):
+        """المجال في الرومنة المقابل للمجال [start, end) من الأصل (end الافتراضي = start)"""
+        return self._map(start, start if end is None else end,
+                         self.source_starts, self.output_starts, self._output_end)
+
+    def _map(self, start, end, from_starts, to_starts, to_end):
+        if not from_starts:
+            return 0, 0
+        i = max(0, bisect_right(from_starts, start) - 1)
+        if self._is_literal(i):
+            mapped_start = min(to_starts[i] + max(0, start - from_starts[i]), to_end(i))
+        else:
+            mapped_start = to_starts[i]
+        if end <= start:
+            return mapped_start, mapped_start
+        j = max(0, bisect_left(from_starts, end) - 1)
+        if self._is_literal(j):
+            mapped_end = min(to_starts[j] + max(0, end - from_starts[j]), to_end(j))
+        else:
+            mapped_end = to_end(j)
+        return mapped_start, max(mapped_start, mapped_end)
+
+
+class CompiledSystem:
+    """
+    نظام رومنة مترجَم من تعريف بياني (قاموس).
+    تُبنى الجداول مرة واحدة، ثم تمر كل كلمة عبر حلقة واحدة:
+    لكل حرف إجراء واحد في الجدول، إما نص يُضاف مباشرة أو قاعدة سياقية.
+
+    مفاتيح التعريف:
+      - letters: الحروف (قد تحتوي مفاتيح متعددة الأحرف)
+      - vowels: الحركات القصيرة والتنوين
+      - special_words: كلمات خاصة تُرجع كما هي
+      - sun_letters: الحروف الشمسية
+      - article: (بادئة الشمسية، بادئة القمرية) لـ "ال" التعريف
+      - shadda: أحد أوضاع الشدة أعلاه
+      - ta_marbuta: (آخر الجذع، غير ذلك) - اختياري
+      - alif_madda: (أول الجذع، غير ذلك) - اختياري
+      - lexicon: معجم رومنات معروفة (Lexicon أو أي كائن له get) - اختياري،
+        يُبحث فيه بعد الكلمات الخاصة وقبل القواعد
+
+    لكل نظام ذاكرة مؤقتة للكلمات (LRU) محدودة بـ cache_size كلمة،
+    مع عدّادات للإصابات والإخفاقات والطرد (انظر cache_info).
+    """
+
+    def __init__(self, definition, cache_size=DEFAULT_WORD_CACHE_SIZE):
+        letters = definition['letters']
+        single_letters = {k: v for k, v in letters.items() if len(k) == 1}
+
+        # الجدول: حرف -> نص أو قاعدة
+        actions = dict(single_letters)
+        actions.update(definition.get('vowels', {}))
+
+        shadda_mode = definition.get('shadda', SHADDA_DOUBLE)
+        if shadda_mode == SHADDA_DROP:
+            actions['ّ'] = ''
+        else:
+            actions['ّ'] = _make_shadda_rule(shadda_mode, single_letters)
+
+        if definition.get('ta_marbuta'):
+            final, medial = definition['ta_marbuta']
+            actions['ة'] = _make_positional_rule(final, medial, at_start=False)
+
+        if definition.get('alif_madda'):
+            initial, medial = definition['alif_madda']
+            actions['آ'] = _make_positional_rule(initial, medial, at_start=True)
+
+        # المفاتيح متعددة الأحرف: أطول مطابقة أولاً
+        # (لا يجوز أن تحتوي حرفاً سياقياً لأن المقاطع تُقسم عنده)
+        # المفتاح الذي تساوي قيمته رومنة أحرفه منفردة (مثل 'لا' -> 'lā') لا يغيّر
+        # النتيجة، فلا نحتاج له قاعدة ويبقى الحرف على المسار السريع
+        multi = {}
+        for key, value in letters.items():
+            if len(key) > 1:
+                if any(ch in CONTEXT_CHARS for ch in key):
+                    raise ValueError(f"مفتاح متعدد الأحرف يحتوي حرفاً سياقياً: {key}")
+                per_char = [actions.get(ch, ch) for ch in key]
+                if all(type(part) is str for part in per_char) and "".join(per_char) == value:
+                    continue
+                multi.setdefault(key[0], []).append((key, value))
+        for first, candidates in multi.items():
+            candidates.sort(key=lambda item: len(item[0]), reverse=True)
+            actions[first] = _make_longest_match_rule(candidates, actions.get(first))
+
+        # جدول str.translate للمسار السريع: كل حرف إجراؤه نص ثابت
+        self._translate_table = str.maketrans(
+            {ch: action for ch, action in actions.items() if type(action) is str}
+        )
+        # الأحرف التي تحتاج قاعدة داخل السلسلة العادية (بدايات المفاتيح متعددة الأحرف)
+        self._run_needs_rules = (
+            re.compile('[' + re.escape(''.join(multi)) + ']').search if multi else None
+        )
+        # هل لأحد الأحرف السياقية قاعدة في هذا النظام؟ (في ALA-LC كلها نصوص ثابتة)
+        self._has_context_rules = any(
+            type(actions.get(ch)) not in (str, type(None)) for ch in CONTEXT_CHARS
+        )
+
+        self.actions = actions
+        self.special_words = dict(definition.get('special_words', {}))
+        self.lexicon = definition.get('lexicon')
+        self.sun_letters = frozenset(definition.get('sun_letters', ()))
+        self.sun_prefix, self.moon_prefix = definition.get('article', ('a', 'al-'))
+
+        # ذاكرة الكلمات المؤقتة (الأقدم استخداماً في البداية)
+        self.cache_size = cache_size
+        self._word_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_evictions = 0
+
+    def set_cache_size(self, cache_size):
+        """تغيير حد الذاكرة المؤقتة (0 لتعطيلها)، مع طرد ما يزيد عن الحد الجديد."""
+        with self._cache_lock:
+            self.cache_size = max(0, cache_size)
+            while len(self._word_cache) > self.cache_size:
+                self._word_cache.popitem(last=False)
+                self.cache_evictions += 1
+
+    def set_lexicon(self, lexicon):
+        """ربط معجم رومنات معروفة بالنظام (None لفكّه)، مع تفريغ الذاكرة المؤقتة"""
+        self.lexicon = lexicon
+        self.clear_cache()
+
+    def clear_cache(self):
+        """تفريغ الذاكرة المؤقتة وتصفير العدّادات."""
+        with self._cache_lock:
+            self._word_cache.clear()
+            self.cache_hits = 0
+            self.cache_misses = 0
+            self.cache_evictions = 0
+
+    def cache_info(self):
+        """إحصاءات الذاكرة المؤقتة: الإصابات، الإخفاقات، الطرد، الحجم الحالي والحد."""
+        with self._cache_lock:
+            lookups = self.cache_hits + self.cache_misses
+            return {
+                'hits': self.cache_hits,
+                'misses': self.cache_misses,
+                'evictions': self.cache_evictions,
+                'size': len(self._word_cache),
+                'maxsize': self.cache_size,
+                'hit_rate': self.cache_hits / lookups if lookups else 0.0,
+            }
+
+    def _cache_get(self, word):
+        """البحث في الذاكرة المؤقتة (None عند الإخفاق أو إن كانت معطّلة)."""
+        if self.cache_size <= 0:
+            return None
+        cache = self._word_cache
+        with self._cache_lock:
+            romanized = cache.get(word)
+            if romanized is not None:
+                cache.move_to_end(word)
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+        return romanized
+
+    def _cache_put(self, word, romanized):
+        """حفظ رومنة كلمة مع طرد الأقدم استخداماً عند تجاوز الحد."""
+        if self.cache_size <= 0:
+            return
+        cache = self._word_cache
+        with self._cache_lock:
+            cache[word] = romanized
+            if len(cache) > self.cache_size:
+                cache.popitem(last=False)
+                self.cache_evictions += 1
+
+    def _romanize_run(self, run):
+        """
+        تحويل سلسلة أحرف بلا قواعد سياقية.
+        المسار السريع: str.translate على مستوى C إن لم تحتوِ السلسلة بداية مفتاح
+        متعدد الأحرف؛ وإلا الحلقة عبر جدول الإجراءات (والنتيجة متطابقة).
+        """
+        needs_rules = self._run_needs_rules
+        if needs_rules is None or needs_rules(run) is None:
+            return run.translate(self._translate_table)
+
+        actions = self.actions
+        romanized = []
+        append = romanized.append
+        n = len(run)
+        i = 0
+        while i < n:
+            ch = run[i]
+            action = actions.get(ch)
+            if action is None:
+                # حرف غير معروف يبقى كما هو
+                append(ch)
+                i += 1
+            elif type(action) is str:
+                append(action)
+                i += 1
+            else:
+                text, i = action(run, i)
+                append(text)
+        return "".join(romanized)
+
+    def _romanize_segments(self, stem, segments):
+        """
+        تحويل الجذع مقطعاً مقطعاً: السلاسل العادية عبر الجدول،
+        والأحرف السياقية عبر قواعدها مع موقعها في الجذع.
+        """
+        # لا أحرف سياقية، أو كلها نصوص ثابتة في هذا النظام: الجذع كله سلسلة عادية
+        if len(segments) == 1 or not self._has_context_rules:
+            return self._romanize_run(stem)
+
+        actions = self.actions
+        romanize_run = self._romanize_run
+        romanized = []
+        append = romanized.append
+        i = 0
+        is_context = False
+        for segment in segments:
+            if is_context:
+                action = actions.get(segment)
+                if action is None:
+                    append(segment)
+                elif type(action) is str:
+                    append(action)
+                else:
+                    append(action(stem, i)[0])
+                i += 1
+            elif segment:
+                append(romanize_run(segment))
+                i += len(segment)
+            is_context = not is_context
+        return "".join(romanized)
+
+    def romanize_stem(self, stem):
+        """تحويل جذع الكلمة (بعد فصل "ال") عبر جدول الإجراءات."""
+        return self._romanize_segments(stem, CONTEXT_SPLIT_PATTERN.split(stem))
+
+    def romanize_analyzed(self, analysis):
+        """
+        رومنة كلمة من تحليلها المشترك (analyze_word):
+          - الكلمات الخاصة أولاً، ثم المعجم إن وُجد.
+          - "ال" التعريف: شمسية -> بادئة الشمسية، قمرية -> بادئة القمرية.
+          - ثم مقاطع الجذع.
+        """
+        word, has_article, stem, segments = analysis
+        special = self.special_words.get(word)
+        if special is not None:
+            return special
+        if self.lexicon is not None:
+            known = self.lexicon.get(word)
+            if known is not None:
+                return known
+
+        romanized = self._romanize_segments(stem, segments)
+        if has_article:
+            if stem[0] in self.sun_letters:
+                return self.sun_prefix + romanized
+            return self.moon_prefix + romanized
+        return romanized
+
+    def romanize_word(self, word):
+        """تُعالِج كلمة عربية واحدة، مع المرور أولاً بالذاكرة المؤقتة."""
+        romanized = self._cache_get(word)
+        if romanized is None:
+            romanized = self.romanize_analyzed(analyze_word(word))
+            self._cache_put(word, romanized)
+        return romanized
+
+    def romanize_text(self, text):
+        """
+        تطبّع النص (normalize_text) ثم تقسمه إلى tokens وتعالج كل token عربي بـ romanize_word،
+        وتترك غير العربي (علامات ترقيم، مسافات، كلمات لاتينية) كما هو.
+        """
+        if _profiler is not None:
+            return self._romanize_text_profiled(text, _profiler)
+
+        text = normalize_text(text)
+        romanize_word = self.romanize_word
+        romanized = []
+        append = romanized.append
+        pos = 0
+        for match in TOKEN_PATTERN.finditer(text):
+            if match.lastgroup == 'latin':
+                continue
+            start, end = match.span()
+            if start > pos:
+                append(text[pos:start])
+            append(romanize_word(match.group()))
+            pos = end
+        append(text[pos:])
+        return "".join(romanized)
+
+    def romanize_text_aligned(self, text):
+        """
+        مثل romanize_text، مع بناء محاذاة (Alignment) في المرور نفسه:
+        لكل token (بداية الأصل، نهاية الأصل، بداية الرومنة).
+        تُرجع (النص المرومن، المحاذاة)، ومواضع الأصل فيها على النص قبل التطبيع.
+        """
+        normalized, runs = normalize_text_with_offsets(text)
+        romanize_word = self.romanize_word
+        romanized = []
+        append = romanized.append
+        source_starts = array('I')
+        source_ends = array('I')
+        output_starts = array('I')
+        add_start = source_starts.append
+        add_end = source_ends.append
+        add_output = output_starts.append
+        pos = 0
+        output_pos = 0
+        for match in TOKEN_PATTERN.finditer(normalized):
+            if match.lastgroup == 'latin':
+                continue
+            start, end = match.span()
+            if start > pos:
+                add_start(pos)
+                add_end(start)
+                add_output(output_pos)
+                append(normalized[pos:start])
+                output_pos += start - pos
+            word = romanize_word(match.group())
+            add_start(start)
+            add_end(end)
+            add_output(output_pos)
+            append(word)
+            output_pos += len(word)
+            pos = end
+        if pos < len(normalized):
+            add_start(pos)
+            add_end(len(normalized))
+            add_output(output_pos)
+            append(normalized[pos:])
+            output_pos += len(normalized) - pos
+
+        if runs:
+            _restore_source_offsets(source_starts, runs)
+            _restore_source_offsets(source_ends, runs)
+        alignment = Alignment(source_starts, source_ends, output_starts, len(text), output_pos)
+        return "".join(romanized), alignment
+
+    def _romanize_text_profiled(self, text, profiler):
+        """نسخة romanize_text مع قياس كل مرحلة (لا تُستخدم إلا عند تفعيل القياس)."""
+        clock = time.perf_counter
+        started = clock()
+        text = normalize_text(text)
+        normalized = clock()
+        profiler.add('normalize', normalized - started)
+        matches = list(TOKEN_PATTERN.finditer(text))
+        profiler.add('tokenize', clock() - normalized)
+
+        romanized = []
+        append = romanized.append
+        pos = 0
+        for match in matches:
+            if match.lastgroup == 'latin':
+                profiler.count('passthrough')
+                continue
+            start, end = match.span()
+            if start > pos:
+                append(text[pos:start])
+                profiler.count('passthrough')
+            append(self._romanize_word_profiled(match.group(), profiler))
+            pos = end
+        append(text[pos:])
+
+        assembling = clock()
+        result = "".join(romanized)
+        finished = clock()
+        profiler.add('assembly', finished - assembling)
+        profiler.add('romanize_text', finished - started)
+        return result
+
+    def _romanize_word_profiled(self, word, profiler):
+        """نسخة romanize_word مع قياس الذاكرة المؤقتة والتحليل والقواعد وعدّ الفروع."""
+        clock = time.perf_counter
+        started = clock()
+        romanized = self._cache_get(word)
+        looked_up = clock()
+        profiler.add('cache_lookup', looked_up - started)
+        if romanized is not None:
+            profiler.count('cache_hit')
+            profiler.add('word', looked_up - started)
+            return romanized
+
+        analysis = analyze_word(word)
+        analyzed = clock()
+        profiler.add('analysis', analyzed - looked_up)
+
+        special = self.special_words.get(word)
+        checked = clock()
+        profiler.add('special_words', checked - analyzed)
+
+        known = None
+        if special is None and self.lexicon is not None:
+            known = self.lexicon.get(word)
+            looked_up_lexicon = clock()
+            profiler.add('lexicon', looked_up_lexicon - checked)
+            checked = looked_up_lexicon
+
+        if special is not None:
+            romanized = special
+        elif known is not None:
+            romanized = known
+        else:
+            romanized = self.romanize_analyzed(analysis)
+        ruled = clock()
+        profiler.add('rules', ruled - checked)
+
+        self._cache_put(word, romanized)
+        profiler.add('word', clock() - started)
+
+        # عدّ الفروع خارج الأزمنة المقيسة
+        if special is not None:
+            profiler.count('special_word')
+            return romanized
+        if known is not None:
+            profiler.count('lexicon')
+            return romanized
+        _, has_article, stem, segments = analysis
+        if has_article:
+            profiler.count('article')
+        for branch, ch in (('shadda', 'ّ'), ('ta_marbuta', 'ة'), ('alif_madda', 'آ')):
+            n = stem.count(ch)
+            if n:
+                profiler.count(branch, n)
+        tanween = sum(stem.count(ch) for ch in 'ًٌٍ')
+        if tanween:
+            profiler.count('tanween', tanween)
+        if len(segments) == 1 or not self._has_context_rules:
+            needs_rules = self._run_needs_rules
+            if needs_rules is None or needs_rules(stem) is None:
+                profiler.count('translate')
+                return romanized
+        profiler.count('rule_loop')
+        return romanized
+
+    def stream_romanizer(self):
+        """مُرومن تزايدي جديد (StreamRomanizer) بهذا النظام"""
+        return StreamRomanizer(self)
+
+    def romanize_stream(self, chunks):
+        """
+        رومنة تدفقية: تستقبل أي iterable من الأجزاء (أسطر، كتل...) وتُنتج
+        الأجزاء المرومنة تباعاً، فتبقى الذاكرة ثابتة مهما كبر النص.
+        """
+        stream = self.stream_romanizer()
+        for chunk in chunks:
+            romanized = stream.feed(chunk)
+            if romanized:
+                yield romanized
+        romanized = stream.flush()
+        if romanized:
+            yield romanized
+
+
+def romanize_text_multi(text, systems):
+    """
+    رومنة النص بعدة أنظمة في مرور واحد:
+    يُقسم النص إلى tokens مرة واحدة، ولكل كلمة عربية يُحسب التحليل المشترك
+    (أداة التعريف، الجذع، مواقع الشدة والتاء المربوطة والألف الممدودة) مرة واحدة
+    عند أول إخفاق في الذاكرة المؤقتة، ثم يُخرج كل نظام رومنته منه.
+    تُرجع قائمة المخرجات بنفس ترتيب systems.
+    """
+    text = normalize_text(text)
+    outputs = [[] for _ in systems]
+    pairs = [(system, output.append) for system, output in zip(systems, outputs)]
+
+    pos = 0
+    for match in TOKEN_PATTERN.finditer(text):
+        if match.lastgroup == 'latin':
+            continue
+        start, end = match.span()
+        if start > pos:
+            gap = text[pos:start]
+            for _, append in pairs:
+                append(gap)
+        pos = end
+
+        token = match.group()
+        analysis = None
+        for system, append in pairs:
+            romanized = system._cache_get(token)
+            if romanized is None:
+                if analysis is None:
+                    analysis = analyze_word(token)
+                romanized = system.romanize_analyzed(analysis)
+                system._cache_put(token, romanized)
+            append(romanized)
+
+    gap = text[pos:]
+    for _, append in pairs:
+        append(gap)
+    return ["".join(output) for output in outputs]
+
+
+def _is_plain_word_char(ch):
+    return '\u0600' <= ch <= '\u06FF' or ch.isalnum() or ch == '_'
+
+
+def _is_word_char(ch):
+    """
+    حرف قد يمتد به token الكلمة: حرف عربي أو حرف \\w، أو حرف يحذفه التطبيع
+    (فلا يُقطع النص عند علامة اتجاه داخل كلمة ستلتئم بعد حذفها)،
+    أو شكل عرض يُطبَّع إلى حروف كلمة (﷼).
+    """
+    if _is_plain_word_char(ch) or ch in IGNORABLE_CHARS:
+        return True
+    if '\ufb50' <= ch <= '\ufeff':
+        if _word_forms is None:
+            _load_normalization_table()
+        return ch in _word_forms
+    return False
+
+
+class StreamRomanizer:
+    """
+    رومنة تزايدية لنص يصل على أجزاء.
+    الكلمة التي تنتهي عند حد الجزء قد تكتمل في الجزء التالي، لذا نحتفظ بها
+    معلّقة ولا نرومنها إلا بعد وصول فاصل (مسافة أو علامة ترقيم) أو عند flush.
+    بهذا تكون النتيجة مطابقة تماماً لرومنة النص كاملاً دفعة واحدة.
+    """
+
+    def __init__(self, system):
+        self.system = system
+        self._pending = ''
+
+    def feed(self, chunk):
+        """إضافة جزء جديد وإرجاع رومنة ما اكتمل منه."""
+        text = self._pending + chunk if self._pending else chunk
+
+        # نرجع من النهاية إلى بداية آخر سلسلة كلمات متصلة
+        cut = len(text)
+        while cut > 0 and _is_word_char(text[cut - 1]):
+            cut -= 1
+
+        if cut == 0:
+            self._pending = text
+            return ''
+        self._pending = text[cut:]
+        return self.system.romanize_text(text[:cut])
+
+    def flush(self):
+        """رومنة الجزء المعلّق المتبقي في نهاية التدفق."""
+        text, self._pending = self._pending, ''
+        return self.system.romanize_text(text) if text else ''
+
+
+def chunk_spans(text, chunk_size):
+    """
+    تقسيم النص إلى مجالات (بداية، نهاية) بطول chunk_size تقريباً عند حدود آمنة،
+    فرومنة كل جزء على حدة ثم وصل النتائج تطابق رومنة النص كاملاً.
+    يُفضَّل القطع بعد آخر سطر جديد في النصف الثاني من الجزء، ثم بعد آخر فاصل
+    (مسافة أو علامة ترقيم)؛ والكلمة الأطول من الجزء تبقى كاملة في جزء واحد.
+    """
+    spans = []
+    n = len(text)
+    start = 0
+    while n - start > chunk_size:
+        end = start + chunk_size
+        cut = text.rfind('\n', start + chunk_size // 2, end) + 1
+        if not cut:
+            cut = end
+            while cut > start and _is_word_char(text[cut - 1]):
+                cut -= 1
+            if cut == start:
+                cut = end
+                while cut < n and _is_word_char(text[cut - 1]):
+                    cut += 1
+        spans.append((start, cut))
+        start = cut
+    if start < n or not spans:
+        spans.append((start, n))
+    return spans
+
+
+def compile_system(definition, cache_size=DEFAULT_WORD_CACHE_SIZE):
+    """ترجمة تعريف نظام (قاموس بيانات) إلى نظام جاهز للاستخدام."""
+    return CompiledSystem(definition, cache_size)
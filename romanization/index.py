@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+فهرس مقلوب للبحث في الفهارس المرومنة والعودة إلى الأصول العربية.
+
+كل سجل يُرومن مرة واحدة بكل الأنظمة (romanize_all)، ثم تُطوى رومنته
+(حذف العلامات المركبة وعلامات العين والهمزة، وتوحيد حالة الأحرف) وتُقسم إلى كلمات،
+وتُحذف من كل كلمة حروف العلة (a e i o u) و y و w: النص العربي غير المشكول لا يكتب
+الحركات القصيرة ولا الشدة، ويُرومن المد فيه ياءً وواواً ('الغزالي' -> 'al-ghzāly')،
+فيبقى من الكلمة هيكلها (ويُكتب الحرف المكرر مرة واحدة).
+ويُربط كل مفتاح بالسجلات التي ظهر فيها مع الأنظمة التي أنتجته.
+الاستعلام يُطوى بالطريقة نفسها، فـ 'al-Ghazali' و 'al-Ghazālī' و 'al-ghzaly' كلها 'l ghzl'،
+و 'al-Ġazālī' و 'al-Ġzāly' كلاهما 'l gzl'؛
+ويصير الاستعلام بحثاً في قاموس وتقاطع قوائم، لا رومنة ولا مسحاً للمدونة.
+الرومنة المفهرسة هي ما تُنتجه الأنظمة، بما فيها المعجم المربوط بها (set_lexicon).
+
+    from romanization.index import RomanizedIndex
+    index = RomanizedIndex()
+    index.add('الغزالي', record={'id': 17})
+    index.search('al-Ghazali')   # [(0, {'id': 17}, ['النظام الحالي', 'ALA-LC (مكتبة الكونغرس)', 'IJMES (المجلة الدولية)'])]
+    index.search('al-Ġazālī')    # [(0, {'id': 17}, ['DMG (الجمعية الألمانية)', 'ISO 233 (المعيار الدولي)'])]
+"""
+
+import re
+import threading
+import unicodedata
+
+from .systems import ROMANIZATION_SYSTEMS, resolve_system_name, romanize_all
+
+# علامات العين والهمزة وما يُكتب بدلها: تُحذف عند الطي
+# فتتطابق 'ʿAlī' و 'ʻAli' و 'Ali'
+_DROPPED_MARKS = "ʾʿʻʼʽ'‘’`´"
+
+# كلمة بعد الطي: حروف وأرقام (الواصلة والمسافة وعلامات الترقيم فواصل)
+TERM_PATTERN = re.compile(r'[^\W_]+')
+
+# ما يُحذف من الكلمة المطوية لتصير مفتاحاً: حروف العلة، و y و w التي يُرومن بها المد
+# في النص غير المشكول (فلا يُعرف من الرومنة أهي مد أم حرف)
+_VOWEL_TABLE = str.maketrans('', '', 'aeiouwy')
+
+# الحرف المكرر (الشدة في النص المشكول أو في الاستعلام) يُكتب مرة واحدة: 'mhmmd' -> 'mhmd'
+_DOUBLED_PATTERN = re.compile(r'(.)\1+')
+
+
+class _FoldTable(dict):
+    """
+    جدول str.translate يُبنى كسولاً حرفاً حرفاً: كل حرف يُحسب طيّه مرة واحدة
+    (NFD، حذف العلامات المركبة، casefold)، ثم يصير الطي مروراً واحداً بـ translate.
+    """
+
+    def __missing__(self, code):
+        ch = chr(code)
+        if ch in _DROPPED_MARKS:
+            folded = ''
+        else:
+            folded = ''.join(
+                c for c in unicodedata.normalize('NFD', ch.casefold())
+                if not unicodedata.combining(c)
+            )
+        self[code] = folded
+        return folded
+
+
+_FOLD_TABLE = _FoldTable()
+
+
+def fold(text):
+    """طي النص المرومن للبحث: 'al-Ġazālī' -> 'al-gazali'"""
+    return text.translate(_FOLD_TABLE)
+
+
+def fold_terms(text):
+    """مفاتيح كلمات النص: بعد الطي وحذف حروف العلة والتكرار، بلا تكرار وبترتيب ظهورها"""
+    keys = dict.fromkeys(
+        _DOUBLED_PATTERN.sub(r'\1', term.translate(_VOWEL_TABLE))
+        for term in TERM_PATTERN.findall(fold(text))
+    )
+    keys.pop('', None)
+    return list(keys)
+
+
+class RomanizedIndex:
+    """
+    فهرس مقلوب في الذاكرة: مفتاح مطوي -> {رقم السجل: قناع الأنظمة التي أنتجته}.
+    قناع الأنظمة عدد صحيح، بت لكل نظام، فيتطلب التطابق أن تأتي كلمات الاستعلام
+    كلها من نظام واحد على الأقل في السجل نفسه.
+    الإضافة تدريجية (add و add_many)، والبحث والإضافة آمنان من عدة خيوط.
+    """
+
+    def __init__(self, system_names=None):
+        names = system_names or list(ROMANIZATION_SYSTEMS)
+        self.system_names = [resolve_system_name(name) for name in names]
+        self._sources = []
+        self._records = []
+        self._postings = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._records)
+
+    def add(self, text, record=None):
+        """
+        فهرسة نص عربي واحد (عنوان، اسم، رأس موضوع...) وإرجاع رقم سجله.
+        record: ما يُعاد في نتائج البحث (رقم في الفهرس الأصلي، قاموس...)، والنص نفسه افتراضياً.
+        """
+        romanized = romanize_all(text, self.system_names)
+        terms = {}
+        for bit, name in enumerate(self.system_names):
+            mask = 1 << bit
+            for term in fold_terms(romanized[name]):
+                terms[term] = terms.get(term, 0) | mask
+
+        with self._lock:
+            record_id = len(self._records)
+            self._sources.append(text)
+            self._records.append(text if record is None else record)
+            postings = self._postings
+            for term, mask in terms.items():
+                posting = postings.get(term)
+                if posting is None:
+                    postings[term] = {record_id: mask}
+                else:
+                    posting[record_id] = mask
+        return record_id
+
+    def add_many(self, items):
+        """فهرسة عدة سجلات: نصوص، أو أزواج (النص، السجل)؛ تُرجع أرقامها"""
+        ids = []
+        for item in items:
+            if isinstance(item, str):
+                ids.append(self.add(item))
+            else:
+                ids.append(self.add(*item))
+        return ids
+
+    def source(self, record_id):
+        """النص العربي الأصلي لسجل"""
+        return self._sources[record_id]
+
+    def search(self, query, limit=None):
+        """
+        السجلات التي تحتوي رومنتها كل كلمات الاستعلام (بعد الطي) في نظام واحد على الأقل.
+        تُرجع [(رقم السجل، السجل، [أسماء الأنظمة المطابقة])] بترتيب الإضافة.
+        """
+        terms = fold_terms(query)
+        if not terms:
+            return []
+        with self._lock:
+            postings = []
+            for term in terms:
+                posting = self._postings.get(term)
+                if posting is None:
+                    return []
+                postings.append(posting)
+            # التقاطع يبدأ من أقصر قائمة
+            postings.sort(key=len)
+            matches = dict(postings[0])
+            for posting in postings[1:]:
+                narrowed = {}
+                for record_id, mask in matches.items():
+                    mask &= posting.get(record_id, 0)
+                    if mask:
+                        narrowed[record_id] = mask
+                matches = narrowed
+                if not matches:
+                    return []
+            records = self._records
+
+        names = self.system_names
+        results = []
+        for record_id in sorted(matches):
+            mask = matches[record_id]
+            systems = [name for bit, name in enumerate(names) if mask >> bit & 1]
+            results.append((record_id, records[record_id], systems))
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+    def stats(self):
+        """عدد السجلات والمفاتيح ومجموع المداخل في القوائم"""
+        with self._lock:
+            return {
+                'records': len(self._records),
+                'terms': len(self._postings),
+                'postings': sum(map(len, self._postings.values())),
+            }
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+معجم الرومنات المعروفة على القرص (أسماء الأعلام، رؤوس الموضوعات المقننة...)
+
+صيغة ثنائية مبنية مسبقاً (امتداد الملف .rlex) تُربط بالذاكرة (mmap) عند الفتح ولا تُحلَّل إلى قاموس Python:
+  - الترويسة (32 بايت): 'RLEX'، الإصدار، عدد المداخل، عدد الخانات، موضع الجدول
+  - جدول تجزئة بعنونة مفتوحة (مسبار خطي، نسبة امتلاء ≤ 0.5):
+    لكل خانة (crc32 المفتاح، موضع المفتاح، طوله، موضع القيمة، طولها)؛ الخانة الفارغة طول مفتاحها 0
+  - كتلة النصوص: المفاتيح والقيم بترميز UTF-8
+البحث عن كلمة: crc32 واحد ثم خانة أو خانتان في المتوسط، فالفتح بالميلي ثانية مهما كبر المعجم.
+
+ملف المصدر TSV: سطر لكل مدخل «الكلمة<TAB>الرومنة»، والأسطر الفارغة أو التي تبدأ بـ # تُتجاهل.
+"""
+
+import mmap
+import os
+import struct
+from zlib import crc32
+
+from .engine import TOKEN_PATTERN, normalize_text
+
+MAGIC = b'RLEX'
+VERSION = 1
+HEADER = struct.Struct('<4sIIII12x')
+SLOT = struct.Struct('<IIIII')
+
+
+def _bucket_count(count):
+    """أصغر قوة للعدد 2 تُبقي نسبة الامتلاء ≤ 0.5"""
+    buckets = 2
+    while buckets < count * 2:
+        buckets *= 2
+    return buckets
+
+
+def read_tsv(path):
+    """
+    قراءة مداخل ملف TSV: (الكلمة، الرومنة) لكل سطر، مع التحقق من أن الكلمة token واحد.
+    الكلمة تُطبَّع كما يُطبَّع النص قبل الرومنة (normalize_text) حتى تطابقه.
+    """
+    with open(path, encoding='utf-8-sig') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.rstrip('\r\n')
+            if not line.strip() or line.startswith('#'):
+                continue
+            fields = line.split('\t')
+            if len(fields) != 2:
+                raise ValueError(f"{path}:{line_number}: يُتوقع عمودان مفصولان بـ TAB")
+            word, romanized = normalize_text(fields[0]).strip(), fields[1].strip()
+            match = TOKEN_PATTERN.fullmatch(word)
+            if match is None or match.lastgroup == 'latin':
+                raise ValueError(f"{path}:{line_number}: المفتاح ليس كلمة عربية واحدة: {word!r}")
+            yield word, romanized
+
+
+def build_lexicon(entries, path):
+    """
+    بناء ملف معجم من مداخل (الكلمة، الرومنة)؛ المفتاح المكرر تبقى آخر قيمه.
+    يُكتب الملف في مسار مؤقت ثم يُستبدل بالهدف دفعة واحدة. تُرجع عدد المداخل.
+    """
+    lexicon = {}
+    for word, romanized in entries:
+        lexicon[word] = romanized
+
+    buckets = _bucket_count(len(lexicon))
+    mask = buckets - 1
+    table_offset = HEADER.size
+    blob_offset = table_offset + buckets * SLOT.size
+
+    slots = [None] * buckets
+    blob = bytearray()
+    for word, romanized in lexicon.items():
+        key = word.encode('utf-8')
+        value = romanized.encode('utf-8')
+        key_hash = crc32(key)
+        key_offset = blob_offset + len(blob)
+        blob += key
+        value_offset = blob_offset + len(blob)
+        blob += value
+        i = key_hash & mask
+        while slots[i] is not None:
+            i = (i + 1) & mask
+        slots[i] = (key_hash, key_offset, len(key), value_offset, len(value))
+
+    empty = SLOT.pack(0, 0, 0, 0, 0)
+    temporary = path + '.tmp'
+    with open(temporary, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(lexicon), buckets, table_offset))
+        f.write(b''.join(empty if slot is None else SLOT.pack(*slot) for slot in slots))
+        f.write(blob)
+    os.replace(temporary, path)
+    return len(lexicon)
+
+
+def build_lexicon_from_tsv(tsv_path, path):
+    """تجميع ملف TSV إلى ملف معجم؛ تُرجع عدد المداخل"""
+    return build_lexicon(read_tsv(tsv_path), path)
+
+
+class Lexicon:
+    """
+    معجم للقراءة فقط مربوط بالذاكرة: lexicon.get(word) تُرجع الرومنة أو None.
+    يصلح استخدامه من عدة خيوط (القراءة فقط من الذاكرة المربوطة).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(self._map) < HEADER.size:
+                raise ValueError(f"ملف معجم غير صالح: {path}")
+            magic, version, count, buckets, table_offset = HEADER.unpack_from(self._map, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"ملف معجم غير صالح أو بإصدار غير مدعوم: {path}")
+            if buckets & (buckets - 1) or table_offset + buckets * SLOT.size > len(self._map):
+                raise ValueError(f"ملف معجم تالف: {path}")
+        except Exception:
+            self._map.close()
+            raise
+        self._count = count
+        self._mask = buckets - 1
+        self._table_offset = table_offset
+
+    def get(self, word, default=None):
+        """رومنة الكلمة من المعجم، أو default إن لم تكن فيه"""
+        key = word.encode('utf-8')
+        key_hash = crc32(key)
+        data = self._map
+        unpack_slot = SLOT.unpack_from
+        table_offset = self._table_offset
+        mask = self._mask
+        i = key_hash & mask
+        while True:
+            slot_hash, key_offset, key_length, value_offset, value_length = unpack_slot(
+                data, table_offset + i * SLOT.size
+            )
+            if key_length == 0:
+                return default
+            if (slot_hash == key_hash and key_length == len(key)
+                    and data[key_offset:key_offset + key_length] == key):
+                return data[value_offset:value_offset + value_length].decode('utf-8')
+            i = (i + 1) & mask
+
+    def __contains__(self, word):
+        return self.get(word) is not None
+
+    def __len__(self):
+        return self._count
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return f"Lexicon({self.path!r}, {self._count} مدخل)"
+
+
+def open_lexicon(lexicon):
+    """قبول مسار ملف معجم أو كائن له get (Lexicon أو قاموس) وإرجاع ما يُبحث فيه"""
+    if lexicon is None or hasattr(lexicon, 'get'):
+        return lexicon
+    return Lexicon(os.fspath(lexicon))
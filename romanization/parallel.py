@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+رومنة مستند واحد ضخم على عدة عمليات:
+يُقسم النص عند حدود آمنة (chunk_spans) إلى قطع، وتُرومن كل قطعة في عملية عاملة،
+ثم تُعاد النتائج بترتيب القطع، فتطابق النتيجة الرومنة التسلسلية حرفاً بحرف.
+
+النص يُرمَّز UTF-8 مرة واحدة في ذاكرة مشتركة (multiprocessing.shared_memory)،
+ولا يُرسل إلى العامل إلا اسم الكتلة ومجال القطعة بالبايت؛ فيفك العامل قطعته
+من الذاكرة المشتركة مباشرة بدل نسخة منقولة (pickle) من النص.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .engine import chunk_spans
+from .systems import get_compiled_system, resolve_system_name
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    # Python 3.7: لا ذاكرة مشتركة، فتُرسل القطع نصاً إلى العمال
+    shared_memory = None
+
+# أصغر قطعة (بالأحرف): ما دونها لا تستحق كلفة الإرسال إلى عملية أخرى
+MIN_SHARD_CHARS = 1 << 18
+
+# عدد القطع لكل عامل (أكثر من قطعة حتى يتوازن الحمل بين العمال)
+SHARDS_PER_WORKER = 4
+
+
+def _romanize_shared_shard(shm_name, start, end, system_name):
+    """رومنة قطعة من الذاكرة المشتركة بمجالها بالبايت (تُنفَّذ داخل عملية عاملة)"""
+    block = shared_memory.SharedMemory(name=shm_name)
+    try:
+        text = str(block.buf[start:end], 'utf-8')
+    finally:
+        block.close()
+    return get_compiled_system(system_name).romanize_text(text)
+
+
+def _romanize_shard(text, system_name):
+    """رومنة قطعة مُرسلة نصاً (عند غياب الذاكرة المشتركة)"""
+    return get_compiled_system(system_name).romanize_text(text)
+
+
+def shard_size_for(text_length, workers):
+    """حجم القطعة: SHARDS_PER_WORKER قطع لكل عامل، ولا تقل عن MIN_SHARD_CHARS"""
+    return max(MIN_SHARD_CHARS, -(-text_length // (workers * SHARDS_PER_WORKER)))
+
+
+def iter_romanize_parallel(text, system='current', workers=None, shard_size=None, executor=None):
+    """
+    رومنة نص ضخم على مجموعة عمليات، وإنتاج رومنة القطع بترتيبها فور جاهزية كل منها
+    (مناسب للكتابة إلى ملف دون جمع النتيجة كلها في الذاكرة).
+      - workers: عدد العمليات (الافتراضي: عدد المعالجات)
+      - shard_size: حجم القطعة بالأحرف (الافتراضي: shard_size_for)
+      - executor: مجموعة عمليات جاهزة بدل إنشاء واحدة لهذا الاستدعاء
+    النص الأقصر من قطعتين، أو عامل واحد، يُرومن تسلسلياً في العملية نفسها.
+    """
+    system_name = resolve_system_name(system)
+    workers = workers or os.cpu_count() or 1
+    shard_size = shard_size or shard_size_for(len(text), workers)
+    spans = chunk_spans(text, shard_size)
+    if len(spans) == 1 or (workers == 1 and executor is None):
+        yield get_compiled_system(system_name).romanize_text(text)
+        return
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=min(workers, len(spans)))
+    block = None
+    futures = []
+    try:
+        if shared_memory is None:
+            futures = [
+                executor.submit(_romanize_shard, text[start:end], system_name)
+                for start, end in spans
+            ]
+        else:
+            # ترميز القطع واحدة واحدة في الكتلة المشتركة: مرور ترميز واحد يعطي مجالات البايت أيضاً
+            pieces = [text[start:end].encode('utf-8') for start, end in spans]
+            block = shared_memory.SharedMemory(create=True, size=max(1, sum(map(len, pieces))))
+            offset = 0
+            for piece in pieces:
+                size = len(piece)
+                block.buf[offset:offset + size] = piece
+                futures.append(executor.submit(
+                    _romanize_shared_shard, block.name, offset, offset + size, system_name
+                ))
+                offset += size
+            del pieces
+
+        for future in futures:
+            yield future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+        if own_executor:
+            executor.shutdown(wait=True)
+        if block is not None:
+            block.close()
+            block.unlink()
+
+
+def romanize_parallel(text, system='current', workers=None, shard_size=None, executor=None):
+    """رومنة نص ضخم على مجموعة عمليات؛ النتيجة مطابقة للرومنة التسلسلية"""
+    return "".join(iter_romanize_parallel(text, system, workers, shard_size, executor))
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+سجل أنظمة الرومنة: الأسماء، والتحميل الكسول للجداول، والأنظمة المترجمة.
+جداول كل نظام لا تُستورد ولا تُترجم إلا عند أول طلب لذلك النظام.
+"""
+
+import importlib
+import threading
+from collections.abc import Mapping
+
+from . import engine
+from .lexicon import open_lexicon
+
+# ============================================
+# السجل: اسم النظام -> وحدة جداوله في romanization.tables
+# ============================================
+
+CURRENT_SYSTEM_NAME = 'النظام الحالي'
+
+SYSTEM_TABLES = {
+    'النظام الحالي': 'current',
+    'ALA-LC (مكتبة الكونغرس)': 'ala_lc',
+    'DMG (الجمعية الألمانية)': 'dmg',
+    'ISO 233 (المعيار الدولي)': 'iso233',
+    'IJMES (المجلة الدولية)': 'ijmes',
+}
+
+# أسماء مختصرة بالإنجليزية للأنظمة (لسطر الأوامر وغيره)
+SYSTEM_KEYS = {
+    'current': 'النظام الحالي',
+    'ala-lc': 'ALA-LC (مكتبة الكونغرس)',
+    'dmg': 'DMG (الجمعية الألمانية)',
+    'iso233': 'ISO 233 (المعيار الدولي)',
+    'ijmes': 'IJMES (المجلة الدولية)',
+}
+
+
+def get_definition(system_name):
+    """تعريف النظام (قاموس البيانات)، مع استيراد وحدة جداوله عند أول طلب فقط"""
+    module = importlib.import_module('.tables.' + SYSTEM_TABLES[system_name], __package__)
+    return module.DEFINITION
+
+
+class _LazyDefinitions(Mapping):
+    """
+    قاموس {اسم النظام: التعريف} للقراءة فقط؛ المفاتيح متاحة دائماً،
+    ولا تُحمَّل جداول نظام إلا عند قراءة قيمته.
+    """
+
+    def __getitem__(self, system_name):
+        return get_definition(system_name)
+
+    def __iter__(self):
+        return iter(SYSTEM_TABLES)
+
+    def __len__(self):
+        return len(SYSTEM_TABLES)
+
+
+SYSTEM_DEFINITIONS = _LazyDefinitions()
+
+# الأنظمة المترجمة: كل نظام يُترجم مرة واحدة عند أول استخدام ثم يبقى مقيماً
+_compiled_systems = {}
+_compile_lock = threading.Lock()
+
+
+def get_compiled_system(system_name):
+    """إرجاع النظام المترجم حسب اسمه (يُحمَّل ويُترجم عند أول طلب فقط)"""
+    compiled = _compiled_systems.get(system_name)
+    if compiled is None:
+        if system_name not in SYSTEM_TABLES:
+            return get_compiled_system(CURRENT_SYSTEM_NAME)
+        with _compile_lock:
+            compiled = _compiled_systems.get(system_name)
+            if compiled is None:
+                compiled = engine.compile_system(get_definition(system_name))
+                _compiled_systems[system_name] = compiled
+    return compiled
+
+
+def resolve_system_name(name):
+    """تحويل اسم مختصر (مثل ala-lc) أو اسم كامل إلى اسم النظام في ROMANIZATION_SYSTEMS"""
+    if name in SYSTEM_TABLES:
+        return name
+    key = name.strip().lower()
+    if key in SYSTEM_KEYS:
+        return SYSTEM_KEYS[key]
+    raise KeyError(f"نظام رومنة غير معروف: {name}")
+
+
+# ============================================
+# دوال الرومنة لكل نظام
+# ============================================
+
+def romanize_current(text):
+    """النظام الحالي (القواعد الأصلية للأداة)"""
+    return get_compiled_system('النظام الحالي').romanize_text(text)
+
+
+def romanize_ala_lc(text):
+    """
+    نظام ALA-LC - مكتبة الكونغرس الأمريكية
+    يستخدم رموز خاصة مثل ḥ, ṣ, ṭ, ẓ, ʿ
+    """
+    return get_compiled_system('ALA-LC (مكتبة الكونغرس)').romanize_text(text)
+
+
+def romanize_dmg(text):
+    """
+    نظام DMG - الجمعية الألمانية للدراسات الشرقية
+    يستخدم رموز خاصة مثل ḥ, ṣ, ṭ, ẓ, ʿ, ġ
+    """
+    return get_compiled_system('DMG (الجمعية الألمانية)').romanize_text(text)
+
+
+def romanize_iso233(text):
+    """
+    نظام ISO 233 - المعيار الدولي
+    """
+    return get_compiled_system('ISO 233 (المعيار الدولي)').romanize_text(text)
+
+
+def romanize_ijmes(text):
+    """
+    نظام IJMES - المجلة الدولية لدراسات الشرق الأوسط
+    مشابه لـ ALA-LC مع بعض الاختلافات
+    """
+    return get_compiled_system('IJMES (المجلة الدولية)').romanize_text(text)
+
+
+ROMANIZATION_SYSTEMS = {
+    'النظام الحالي': romanize_current,
+    'ALA-LC (مكتبة الكونغرس)': romanize_ala_lc,
+    'DMG (الجمعية الألمانية)': romanize_dmg,
+    'ISO 233 (المعيار الدولي)': romanize_iso233,
+    'IJMES (المجلة الدولية)': romanize_ijmes,
+}
+
+
+def get_romanization_system(system_name):
+    """إرجاع دالة الرومنة حسب اسم النظام"""
+    return ROMANIZATION_SYSTEMS.get(system_name, romanize_current)
+
+
+# ============================================
+# الرومنة التدفقية والمتعددة والذاكرة المؤقتة
+# ============================================
+
+def romanize_stream(chunks, system_name='النظام الحالي'):
+    """
+    رومنة تدفقية بالنظام المختار: تستقبل iterable من الأجزاء أو الأسطر
+    وتُنتج الأجزاء المرومنة تباعاً (الكلمات المقسومة بين جزأين تُعالج صحيحة).
+    """
+    return get_compiled_system(system_name).romanize_stream(chunks)
+
+
+def romanize_all(text, system_names=None):
+    """
+    رومنة النص بعدة أنظمة في مرور واحد (الكل افتراضياً).
+    يُقسم النص ويُحلَّل كل كلمة مرة واحدة، وتُرجع {اسم النظام: النص المرومن}.
+    """
+    names = list(system_names) if system_names else list(ROMANIZATION_SYSTEMS)
+    systems = [get_compiled_system(name) for name in names]
+    return dict(zip(names, engine.romanize_text_multi(text, systems)))
+
+
+def set_word_cache_size(cache_size, system_name=None):
+    """
+    تغيير حد ذاكرة الكلمات المؤقتة لنظام واحد، أو لكل الأنظمة إذا لم يُحدَّد اسم.
+    القيمة 0 تعطّل الذاكرة المؤقتة.
+    """
+    names = [system_name] if system_name else list(SYSTEM_TABLES)
+    for name in names:
+        get_compiled_system(name).set_cache_size(cache_size)
+
+
+def set_lexicon(system_name, lexicon):
+    """
+    ربط معجم رومنات معروفة بنظام (اسم مختصر أو كامل): مسار ملف معجم (يُربط بالذاكرة)،
+    أو كائن Lexicon، أو قاموس؛ و None لفكّه. يُبحث فيه بعد الكلمات الخاصة وقبل القواعد.
+    يُرجع المعجم المربوط.
+    """
+    system_name = resolve_system_name(system_name)
+    lexicon = open_lexicon(lexicon)
+    get_compiled_system(system_name).set_lexicon(lexicon)
+    return lexicon
+
+
+def get_cache_info(system_name=None):
+    """
+    إحصاءات ذاكرة الكلمات المؤقتة (hits, misses, evictions, size, maxsize, hit_rate)
+    لنظام واحد، أو قاموس {اسم النظام: إحصاءات} للأنظمة المترجمة حتى الآن.
+    """
+    if system_name:
+        return get_compiled_system(system_name).cache_info()
+    return {name: compiled.cache_info() for name, compiled in list(_compiled_systems.items())}
+
+
+def loaded_systems():
+    """أسماء الأنظمة التي حُمّلت جداولها وتُرجمت حتى الآن"""
+    return list(_compiled_systems)
+
+
+# قياس مراحل الرومنة (اختياري، معطّل افتراضياً) - انظر Profiler في engine.py
+enable_profiling = engine.enable_profiling
+disable_profiling = engine.disable_profiling
+get_profiler = engine.get_profiler
@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+"""
+جداول أنظمة الرومنة: وحدة لكل نظام تعرّف DEFINITION (قاموس بيانات يترجمه المحرك).
+لا تُستورد وحدة النظام إلا عند أول طلب له (انظر romanization.systems).
+"""
+
+# الحروف الشمسية (مشتركة بين كل الأنظمة)
+SUN_LETTERS = frozenset(['ت','ث','د','ذ','ر','ز','س','ش','ص','ض','ط','ظ','ل','ن'])
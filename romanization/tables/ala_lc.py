@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+نظام ALA-LC (مكتبة الكونغرس الأمريكية)
+"""
+
+from ..engine import SHADDA_DROP
+from . import SUN_LETTERS
+
+DEFINITION = {
+    'letters': {
+        'أ': 'ʾ', 'إ': 'ʾ', 'آ': 'ʾā', 'ء': 'ʾ',
+        'ا': 'ā', 'ى': 'á', 'ئ': 'ʾ',
+        'ب': 'b', 'ت': 't', 'ث': 'th',
+        'ج': 'j', 'ح': 'ḥ', 'خ': 'kh',
+        'د': 'd', 'ذ': 'dh', 'ر': 'r',
+        'ز': 'z', 'س': 's', 'ش': 'sh',
+        'ص': 'ṣ', 'ض': 'ḍ', 'ط': 'ṭ',
+        'ظ': 'ẓ', 'ع': 'ʻ', 'غ': 'gh',
+        'ف': 'f', 'ق': 'q', 'ك': 'k',
+        'ل': 'l', 'م': 'm', 'ن': 'n',
+        'ه': 'h', 'و': 'w', 'ي': 'y',
+        'ة': 'h', 'ؤ': 'ʾ', 'لا': 'lā'
+    },
+    'vowels': {
+        'َ': 'a', 'ُ': 'u', 'ِ': 'i',
+        'ً': 'an', 'ٌ': 'un', 'ٍ': 'in'
+    },
+    'special_words': {
+        'الله': 'Allāh',
+        'ابن': 'ibn',
+        'بن': 'ibn'
+    },
+    'sun_letters': SUN_LETTERS,
+    'article': ('a', 'al-'),
+    'shadda': SHADDA_DROP,
+}
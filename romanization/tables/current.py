@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+النظام الحالي (القواعد الأصلية للأداة)
+"""
+
+from ..engine import SHADDA_REPEAT
+from . import SUN_LETTERS
+
+# حروف عربية إلى رومنة أساسية (قصيرة)
+# لاحظ أننا أضفنا همزة 'أ' كرمز 'ʾ' (أو يُمكن استخدام ('))
+basic_letters_map = {
+    'أ': 'ʾ',  # يمكن اختيار "'" بدل "ʾ" لو أحببت
+    'إ': 'ʾ',
+    'ؤ': 'ʾ',
+    'ئ': 'ʾ',
+    'ء': 'ʾ',  # الهمزة المنفصلة
+    'ا': '',   # الألف إذا لم تكن ممدودة أو ظاهرة
+    'ب': 'b',
+    'ت': 't',
+    'ث': 'th',
+    'ج': 'j',
+    'ح': 'ḥ',
+    'خ': 'kh',
+    'د': 'd',
+    'ذ': 'dh',
+    'ر': 'r',
+    'ز': 'z',
+    'س': 's',
+    'ش': 'sh',
+    'ص': 'ṣ',
+    'ض': 'ḍ',
+    'ط': 'ṭ',
+    'ظ': 'ẓ',
+    'ع': '‘',
+    'غ': 'gh',
+    'ف': 'f',
+    'ق': 'q',
+    'ك': 'k',
+    'ل': 'l',
+    'م': 'm',
+    'ن': 'n',
+    'ه': 'h',
+    'و': 'w',   # لاحقًا نحدد إن كانت 'ū'
+    'ي': 'y'    # لاحقًا نحدد إن كانت 'ī'
+}
+
+# الحركات القصيرة
+short_vowels_map = {
+    'َ': 'a',
+    'ُ': 'u',
+    'ِ': 'i'
+}
+
+# حركات طويلة/مدّ
+long_vowels_map = {
+    'ا': 'ā',  # مد بالألف
+    'و': 'ū',  # مد بالواو
+    'ي': 'ī'   # مد بالياء
+}
+
+# تنوين
+tanween_map = {
+    'ً': 'an',
+    'ٌ': 'un',
+    'ٍ': 'in'
+}
+
+# الحروف الشمسية
+sun_letters = set(SUN_LETTERS)
+
+# كلمات خاصة exceptions
+special_words = {
+    'الله': 'Allāh',
+    'طه': 'Ṭāhā',
+    'يس': 'Yāsīn',
+    'ابن': 'ibn',
+    'بن': 'ibn'
+}
+
+# تعريف النظام كبيانات يترجمها المحرك المشترك
+DEFINITION = {
+    'letters': basic_letters_map,
+    'vowels': {**short_vowels_map, **tanween_map},
+    'special_words': special_words,
+    'sun_letters': sun_letters,
+    'article': ('a', 'al-'),
+    'shadda': SHADDA_REPEAT,
+    'ta_marbuta': ('h', 't'),
+    'alif_madda': ('Ā', "'ā"),
+}
+
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+نظام ISO 233 (المعيار الدولي)
+"""
+
+from ..engine import SHADDA_DOUBLE
+from . import SUN_LETTERS
+
+DEFINITION = {
+    'letters': {
+        'أ': 'ʾ', 'إ': 'ʾ', 'آ': 'ʾā', 'ء': 'ʾ',
+        'ا': 'ā', 'ى': 'á', 'ئ': 'ʾ',
+        'ب': 'b', 'ت': 't', 'ث': 'ṯ',
+        'ج': 'j', 'ح': 'ḥ', 'خ': 'ḵ',
+        'د': 'd', 'ذ': 'ḏ', 'ر': 'r',
+        'ز': 'z', 'س': 's', 'ش': 'š',
+        'ص': 'ṣ', 'ض': 'ḍ', 'ط': 'ṭ',
+        'ظ': 'ẓ', 'ع': 'ʿ', 'غ': 'ġ',
+        'ف': 'f', 'ق': 'q', 'ك': 'k',
+        'ل': 'l', 'م': 'm', 'ن': 'n',
+        'ه': 'h', 'و': 'w', 'ي': 'y',
+        'ة': 'ẗ', 'ؤ': 'ʾ'
+    },
+    'vowels': {
+        'َ': 'a', 'ُ': 'u', 'ِ': 'i',
+        'ً': 'an', 'ٌ': 'un', 'ٍ': 'in'
+    },
+    'sun_letters': SUN_LETTERS,
+    'article': ('a', 'al-'),
+    'shadda': SHADDA_DOUBLE,
+}
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""
+أدوات مشتركة بين الاختبارات: إضافة جذر المشروع إلى المسار، ونص عربي عشوائي قابل لإعادة الإنتاج.
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import romanization
+
+# كلمات النص العشوائي: مشكولة وغير مشكولة، لاتينية وأرقام، وتشويه يطويه التطبيع
+# (أشكال العرض ومنها ﷼ الذي يُطوى إلى حروف، والتطويل، وعلامات الاتجاه، وZWNJ)
+WORDS = [
+    'الشَّمْس', 'كتاب', 'مدرسة', 'قرآن', 'مُحَمَّد', 'الغزالي', 'إحياء', 'علوم', 'الدين',
+    'abc', '2024', 'ﻻ', 'ﷲ', '﷼', 'ﺑﺴﻢ', 'كـتـاب', 'ك‏تاب', '‌مي', '﻿قلم',
+]
+SEPARATORS = [' ', ' ', ' ', '\n', '، ', '. ', '\t', '', '-']
+
+
+def random_text(rng, words=200):
+    """نص عشوائي يُلصق فيه أحياناً كلمتان بلا فاصل"""
+    return ''.join(rng.choice(WORDS) + rng.choice(SEPARATORS) for _ in range(words))
+
+
+def system_names():
+    return list(romanization.ROMANIZATION_SYSTEMS)
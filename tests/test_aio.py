@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""
+الواجهة غير المتزامنة: romanize و iter_romanize على أجزاء صغيرة ومتزامنة تطابق رومنة النص كاملاً.
+"""
+
+import asyncio
+import random
+import unittest
+
+from support import random_text
+
+import romanization
+from romanization import aio
+
+
+class AsyncRomanizerTest(unittest.TestCase):
+
+    def test_matches_whole_text(self):
+        rng = random.Random(4)
+        text = random_text(rng, 300)
+        romanizer = aio.AsyncRomanizer(chunk_size=5, max_concurrency=3)
+
+        async def run():
+            whole = await romanizer.romanize(text, 'ala-lc')
+            parts = [part async for part in romanizer.iter_romanize(text, 'ala-lc')]
+            return whole, ''.join(parts)
+
+        whole, streamed = asyncio.run(run())
+        expected = romanization.romanize(text, 'ala-lc')
+        self.assertEqual(whole, expected)
+        self.assertEqual(streamed, expected)
+
+    def test_romanize_all(self):
+        text = 'الشَّمْس مشرقة\nكتاب'
+        self.assertEqual(asyncio.run(aio.romanize_all(text)), romanization.romanize_all(text))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+قراءة DOCX بالمحلل التدفقي (نص فقرات الجسم المباشرة كما في python-docx)،
+ورومنة DOCX إلى DOCX: نص الفقرات مرومن، والتشغيلات وبقية الأجزاء كما هي.
+"""
+
+import importlib
+import os
+import tempfile
+import unittest
+import zipfile
+
+from support import system_names
+
+import romanization
+
+files = importlib.import_module('ملفات_الرومنة')
+
+W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+
+def docx_paragraph(*runs):
+    xml = []
+    for text, bold in runs:
+        props = '<w:rPr><w:b/></w:rPr>' if bold else ''
+        xml.append(f'<w:r>{props}<w:t xml:space="preserve">{text}</w:t></w:r>')
+    return '<w:p>' + ''.join(xml) + '</w:p>'
+
+
+def make_docx(path, body=None):
+    """مستند Word صغير مبني يدوياً: جسم وترويسة وأنماط"""
+    if body is None:
+        body = ''.join([
+            # كلمة مقسومة بين تشغيلين بتنسيقين مختلفين
+            docx_paragraph(('الشم', False), ('س مشرقة', True)),
+            docx_paragraph(('مدرسة &amp; &lt;كتاب&gt;', False)),
+            '<w:tbl><w:tr><w:tc>' + docx_paragraph(('جدول', False)) + '</w:tc></w:tr></w:tbl>',
+            docx_paragraph(('abc ', False), ('قلم', False)),
+        ])
+    parts = {
+        '[Content_Types].xml': '<?xml version="1.0"?><Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types"/>',
+        'word/document.xml': f'<?xml version="1.0" encoding="UTF-8"?><w:document {W}><w:body>{body}</w:body></w:document>',
+        'word/header1.xml': f'<?xml version="1.0" encoding="UTF-8"?><w:hdr {W}>{docx_paragraph(("ترويسة", False))}</w:hdr>',
+        'word/styles.xml': f'<?xml version="1.0" encoding="UTF-8"?><w:styles {W}/>',
+    }
+    with zipfile.ZipFile(path, 'w') as archive:
+        for name, xml in parts.items():
+            archive.writestr(name, xml.encode('utf-8'))
+
+
+class DocxReaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, 'source.docx')
+
+    def test_body_paragraphs(self):
+        make_docx(self.path)
+        # فقرات الجدول والترويسة ليست من فقرات الجسم المباشرة
+        self.assertEqual(list(files.iter_docx_paragraphs(self.path)),
+                         ['الشمس مشرقة', 'مدرسة & <كتاب>', 'abc قلم'])
+        self.assertEqual(files.read_docx_text(self.path), 'الشمس مشرقة\nمدرسة & <كتاب>\nabc قلم')
+
+    def test_run_content(self):
+        make_docx(self.path, body=(
+            '<w:p><w:r><w:t>كتاب</w:t><w:tab/><w:t>قلم</w:t><w:br/><w:t>سطر</w:t>'
+            '<w:br w:type="page"/></w:r>'
+            '<w:hyperlink><w:r><w:t> رابط</w:t></w:r></w:hyperlink></w:p><w:p/>'
+        ))
+        self.assertEqual(list(files.iter_docx_paragraphs(self.path)), ['كتاب\tقلم\nسطر رابط', ''])
+
+
+class DocxRewriteTest(unittest.TestCase):
+
+    def test_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, 'source.docx')
+            target = os.path.join(directory, 'target.docx')
+            make_docx(source)
+            for name in system_names():
+                system = romanization.get_compiled_system(name)
+                files.romanize_docx(source, target, system)
+                self.assertEqual(
+                    list(files.iter_docx_paragraphs(target)),
+                    [system.romanize_text(p) for p in files.iter_docx_paragraphs(source)],
+                )
+                with zipfile.ZipFile(source) as src, zipfile.ZipFile(target) as out:
+                    self.assertEqual(src.namelist(), out.namelist())
+                    self.assertEqual(src.read('word/styles.xml'), out.read('word/styles.xml'))
+                    for part in ('word/document.xml', 'word/header1.xml'):
+                        self.assertEqual(src.read(part).count(b'<w:r>'), out.read(part).count(b'<w:r>'))
+                    self.assertIn(system.romanize_text('ترويسة').encode('utf-8'), out.read('word/header1.xml'))
+
+    def test_refuses_to_overwrite_source(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, 'source.docx')
+            make_docx(source)
+            with self.assertRaises(ValueError):
+                files.romanize_docx(source, source, romanization.get_compiled_system('النظام الحالي'))
+
+
+if __name__ == '__main__':
+    unittest.main()
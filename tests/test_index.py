@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+الفهرس المقلوب: استعلامات المستفيد بأي نظام وبأي تشكيل تجد السجل العربي غير المشكول.
+"""
+
+import threading
+import unittest
+
+import support  # يضيف جذر المشروع إلى المسار
+
+from romanization.index import RomanizedIndex, fold, fold_terms
+
+ENGLISH_STYLE = ['النظام الحالي', 'ALA-LC (مكتبة الكونغرس)', 'IJMES (المجلة الدولية)']
+GERMAN_STYLE = ['DMG (الجمعية الألمانية)', 'ISO 233 (المعيار الدولي)']
+
+
+class RomanizedIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.index = RomanizedIndex()
+        self.index.add_many([
+            ('الغزالي', {'id': 17}),
+            ('إحياء علوم الدين', {'id': 18}),
+            'ابن خلدون',
+            'محمد بن علي',
+        ])
+
+    def test_example_queries(self):
+        # الاستعلامات كما يكتبها المستفيد: بالمد أو بدونه، وبـ gh أو ġ
+        for query, systems in (('al-Ghazali', ENGLISH_STYLE),
+                               ('al-Ghazālī', ENGLISH_STYLE),
+                               ('al-Ġazālī', GERMAN_STYLE),
+                               ('AL-GHAZALI', ENGLISH_STYLE),
+                               ('ghazali', ENGLISH_STYLE)):
+            self.assertEqual(self.index.search(query), [(0, {'id': 17}, systems)], query)
+
+    def test_folding(self):
+        self.assertEqual(fold('al-Ġazālī'), 'al-gazali')
+        self.assertEqual(fold_terms('al-Ghazālī'), fold_terms('al-ghzāly'))
+        self.assertEqual(fold_terms('Muḥammad ibn ʿAlī'), ['mhmd', 'bn', 'l'])
+        self.assertEqual(fold_terms('a, ā!'), [])
+
+    def test_multi_word_queries(self):
+        self.assertEqual([hit[0] for hit in self.index.search('Ibn Khaldūn')], [2])
+        self.assertEqual([hit[0] for hit in self.index.search('Muhammad ibn Ali')], [3])
+        self.assertEqual([hit[0] for hit in self.index.search('khaldun')], [2])
+        self.assertEqual(self.index.search('Ghazali Khaldun'), [])
+        self.assertEqual(self.index.search(''), [])
+
+    def test_source_and_incremental_add(self):
+        self.assertEqual(self.index.source(1), 'إحياء علوم الدين')
+        self.assertEqual(self.index.search('Ibn Khaldun')[0][1], 'ابن خلدون')
+        threads = [threading.Thread(target=self.index.add, args=('الغزالي',)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(self.index), 12)
+        self.assertEqual([hit[0] for hit in self.index.search('al-Ghazali')], [0] + list(range(4, 12)))
+        self.assertEqual([hit[0] for hit in self.index.search('al-Ghazali', limit=2)], [0, 4])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+معجم الرومنات المعروفة: بناؤه من TSV، ثم فتحه والبحث فيه، وربطه بنظام (set_lexicon).
+"""
+
+import os
+import tempfile
+import unittest
+
+import support  # يضيف جذر المشروع إلى المسار
+
+import romanization
+from romanization.lexicon import Lexicon, build_lexicon_from_tsv
+
+
+class LexiconTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def build(self, lines):
+        tsv = os.path.join(self.directory.name, 'lexicon.tsv')
+        with open(tsv, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+        path = os.path.join(self.directory.name, 'lexicon.rlex')
+        return build_lexicon_from_tsv(tsv, path), path
+
+    def test_round_trip(self):
+        letters = 'بتثجحخدذرزسشصضطظعغفقكلمنهوي'
+        entries = {'ا' + letters[i // 27] + letters[i % 27]: f'kalima-{i}' for i in range(500)}
+        lines = ['# تعليق', ''] + [f'{word}\t{value}' for word, value in entries.items()]
+        lines += ['ﻻمع\tlamaʿ', 'ابت\tlast-wins']
+        count, path = self.build(lines)
+        self.assertEqual(count, 501)
+        with Lexicon(path) as lexicon:
+            self.assertEqual(len(lexicon), 501)
+            for word, value in entries.items():
+                if word != 'ابت':
+                    self.assertEqual(lexicon.get(word), value)
+            self.assertEqual(lexicon.get('ابت'), 'last-wins')
+            # المفتاح يُطبَّع عند البناء كما يُطبَّع النص قبل الرومنة
+            self.assertEqual(lexicon.get('لامع'), 'lamaʿ')
+            self.assertIsNone(lexicon.get('غائبة'))
+            self.assertNotIn('غائبة', lexicon)
+
+    def test_invalid_key(self):
+        with self.assertRaises(ValueError):
+            self.build(['كلمتان هنا\tx'])
+
+    def test_set_lexicon(self):
+        _, path = self.build(['الغزالي\tal-Ghazālī'])
+        before = romanization.romanize('الغزالي وكتاب', 'ala-lc')
+        romanization.set_lexicon('ala-lc', path)
+        try:
+            self.assertEqual(romanization.romanize('الغزالي وكتاب', 'ala-lc'),
+                             'al-Ghazālī ' + romanization.romanize('وكتاب', 'ala-lc'))
+        finally:
+            lexicon = romanization.get_compiled_system(romanization.resolve_system_name('ala-lc')).lexicon
+            romanization.set_lexicon('ala-lc', None)
+            lexicon.close()
+        self.assertEqual(romanization.romanize('الغزالي وكتاب', 'ala-lc'), before)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+التطبيع قبل التقسيم: طي أشكال العرض وحذف التطويل وعلامات الاتجاه، دون أن يتغير موضع حدود الكلمات.
+"""
+
+import unittest
+
+import support  # يضيف جذر المشروع إلى المسار
+
+import romanization
+from romanization.engine import StreamRomanizer, chunk_spans, normalize_text
+
+
+class NormalizationTest(unittest.TestCase):
+
+    def test_normalize_text(self):
+        self.assertEqual(normalize_text('ﻻ ﷲ كـتـاب‏'), 'لا الله كتاب')
+        self.assertEqual(normalize_text('﷼'), 'ریال')
+        clean = 'نص نظيف'
+        self.assertIs(normalize_text(clean), clean)
+
+    def test_rial_sign_is_not_a_boundary(self):
+        # ﷼ يُطوى إلى 'ریال' فلا يُقطع النص بعده
+        system = romanization.get_compiled_system('النظام الحالي')
+        text = '﷼الكتاب'
+        expected = system.romanize_text(text)
+        self.assertNotEqual(expected, system.romanize_text('﷼') + system.romanize_text('الكتاب'))
+        self.assertEqual(''.join(system.romanize_text(text[a:b]) for a, b in chunk_spans(text, 1)), expected)
+        stream = StreamRomanizer(system)
+        self.assertEqual(stream.feed('﷼') + stream.feed('الكتاب') + stream.flush(), expected)
+
+    def test_romanize_normalizes(self):
+        system = romanization.get_compiled_system('ALA-LC (مكتبة الكونغرس)')
+        self.assertEqual(system.romanize_text('ﺑﺴﻢ كـتـاب‏'), system.romanize_text('بسم كتاب'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+رومنة مستند واحد على عدة عمليات (romanize_parallel) تطابق الرومنة التسلسلية، مهما صغرت القطع.
+"""
+
+import random
+import unittest
+
+from support import random_text
+
+import romanization
+from romanization.parallel import romanize_parallel
+
+
+class ParallelIdentityTest(unittest.TestCase):
+
+    def test_parallel_matches_serial(self):
+        rng = random.Random(5)
+        text = random_text(rng, 400)
+        for name in ('النظام الحالي', 'ISO 233 (المعيار الدولي)'):
+            expected = romanization.romanize(text, name)
+            for shard_size in (1, 7, 50):
+                self.assertEqual(romanize_parallel(text, name, workers=2, shard_size=shard_size),
+                                 expected, (name, shard_size))
+
+    def test_parallel_short_text(self):
+        self.assertEqual(romanize_parallel('', 'ala-lc', workers=2, shard_size=1), '')
+        self.assertEqual(romanize_parallel('كتاب', 'ala-lc', workers=2, shard_size=1),
+                         romanization.romanize('كتاب', 'ala-lc'))
+
+
+if __name__ == '__main__':
+    unittest.main()
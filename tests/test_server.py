@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+خادم الرومنة على منفذ يختاره النظام بعمليتين عاملتين: نقاط النهاية، وإغلاق الاتصال فعلاً
+بعد Connection: close، ورفض الأسطر الطويلة، واستبدال العمال إن مات أحدهم.
+"""
+
+import asyncio
+import importlib
+import json
+import os
+import signal
+import unittest
+
+import support  # يضيف جذر المشروع إلى المسار
+
+import romanization
+
+server = importlib.import_module('خادم_الرومنة')
+
+
+class ServerTest(unittest.TestCase):
+
+    def run_with_server(self, check):
+        async def run():
+            instance = self.server = server.RomanizationServer(port=0, workers=2)
+            await instance.start()
+            try:
+                await check(instance.port)
+            finally:
+                await instance.close()
+
+        asyncio.run(run())
+
+    async def exchange(self, port, raw):
+        """إرسال طلب خام وقراءة الاستجابة حتى نهاية الاتصال (EOF)"""
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        try:
+            writer.write(raw)
+            await writer.drain()
+            data = await asyncio.wait_for(reader.read(), 10)
+        finally:
+            writer.close()
+        head, _, body = data.partition(b'\r\n\r\n')
+        status = int(head.split(b' ', 2)[1])
+        return status, head.decode('latin-1'), json.loads(body) if body else None
+
+    def request(self, method, path, payload=None, version='HTTP/1.1'):
+        body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+        return (f'{method} {path} {version}\r\nHost: localhost\r\nConnection: close\r\n'
+                f'Content-Length: {len(body)}\r\n\r\n').encode('latin-1') + body
+
+    def test_endpoints(self):
+        async def check(port):
+            status, head, payload = await self.exchange(
+                port, self.request('POST', '/romanize', {'text': 'الشَّمْس', 'system': 'ala-lc'}))
+            self.assertEqual(status, 200)
+            self.assertIn('Connection: close', head)
+            self.assertEqual(payload['result'], romanization.romanize('الشَّمْس', 'ala-lc'))
+
+            texts = ['كتاب', 'قلم', '']
+            status, _, payload = await self.exchange(
+                port, self.request('POST', '/romanize/batch', {'texts': texts, 'system': 'dmg'}))
+            self.assertEqual(status, 200)
+            self.assertEqual(payload['results'], [romanization.romanize(t, 'dmg') for t in texts])
+
+            status, _, payload = await self.exchange(port, self.request('GET', '/systems'))
+            self.assertEqual(status, 200)
+
+            status, _, payload = await self.exchange(port, self.request('GET', '/health', version='HTTP/1.0'))
+            self.assertEqual((status, payload['status'], payload['workers']), (200, 'ok', 2))
+
+            status, _, _ = await self.exchange(port, self.request('GET', '/missing'))
+            self.assertEqual(status, 404)
+            status, _, _ = await self.exchange(port, self.request('GET', '/romanize'))
+            self.assertEqual(status, 405)
+            status, _, _ = await self.exchange(port, self.request('POST', '/romanize', {'text': 1}))
+            self.assertEqual(status, 400)
+
+        self.run_with_server(check)
+
+    def test_keep_alive_then_close(self):
+        async def check(port):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            try:
+                body = json.dumps({'text': 'كتاب'}).encode('utf-8')
+                for connection in ('keep-alive', 'close'):
+                    writer.write((f'POST /romanize HTTP/1.1\r\nConnection: {connection}\r\n'
+                                  f'Content-Length: {len(body)}\r\n\r\n').encode('latin-1') + body)
+                    await writer.drain()
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), 10)
+                    length = int(head.split(b'Content-Length: ')[1].split(b'\r\n')[0])
+                    await reader.readexactly(length)
+                # بعد Connection: close يصل EOF (لا تحتفظ العمليات العاملة بالمقبس)
+                self.assertEqual(await asyncio.wait_for(reader.read(), 10), b'')
+            finally:
+                writer.close()
+
+        self.run_with_server(check)
+
+    def test_oversized_lines(self):
+        async def check(port):
+            status, _, _ = await self.exchange(port, b'GET /' + b'a' * 100000 + b' HTTP/1.1\r\n\r\n')
+            self.assertEqual(status, 414)
+            status, _, _ = await self.exchange(port, b'GET /health HTTP/1.1\r\nX: ' + b'a' * 100000 + b'\r\n\r\n')
+            self.assertEqual(status, 431)
+
+        self.run_with_server(check)
+
+    def test_worker_death(self):
+        async def check(port):
+            loop = asyncio.get_running_loop()
+            pid = await loop.run_in_executor(self.server.executor, server.warm_up)
+            os.kill(pid, signal.SIGKILL)
+            # حتى تكتشف المجموعة موت العامل قد تنجح طلبات؛ بعده تُرد الدفعة بـ 503 وتُستبدل المجموعة
+            for _ in range(100):
+                status, head, _ = await self.exchange(port, self.request('POST', '/romanize', {'text': 'كتاب'}))
+                if status != 200:
+                    break
+                await asyncio.sleep(0.05)
+            self.assertEqual(status, 503)
+            self.assertIn('Retry-After: 1', head)
+
+            status, _, payload = await self.exchange(port, self.request('POST', '/romanize', {'text': 'كتاب'}))
+            self.assertEqual((status, payload['result']), (200, romanization.romanize('كتاب', 'current')))
+            status, _, payload = await self.exchange(port, self.request('GET', '/health'))
+            self.assertEqual((status, payload['status'], payload['restarts']), (200, 'ok', 1))
+
+        self.run_with_server(check)
+
+
+if __name__ == '__main__':
+    unittest.main()
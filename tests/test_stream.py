@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+الرومنة على أجزاء (StreamRomanizer، chunk_spans، romanize_stream) تطابق رومنة النص كاملاً،
+مهما وقعت حدود الأجزاء داخل الكلمات.
+"""
+
+import random
+import unittest
+
+from support import random_text, system_names
+
+import romanization
+from romanization.engine import StreamRomanizer, chunk_spans
+
+
+class StreamingIdentityTest(unittest.TestCase):
+
+    def test_stream_romanizer(self):
+        rng = random.Random(1)
+        for name in system_names():
+            system = romanization.get_compiled_system(name)
+            for _ in range(50):
+                text = random_text(rng, rng.randint(0, 40))
+                expected = system.romanize_text(text)
+                for size in (1, 2, 3, 7, 64):
+                    stream = StreamRomanizer(system)
+                    parts = [stream.feed(text[i:i + size]) for i in range(0, len(text), size)]
+                    parts.append(stream.flush())
+                    self.assertEqual(''.join(parts), expected, (name, size, text))
+
+    def test_chunk_spans(self):
+        rng = random.Random(2)
+        system = romanization.get_compiled_system('النظام الحالي')
+        for _ in range(200):
+            text = random_text(rng, rng.randint(0, 40))
+            expected = system.romanize_text(text)
+            for size in (1, 2, 5, 13, 100):
+                spans = chunk_spans(text, size)
+                self.assertEqual(''.join(text[a:b] for a, b in spans), text)
+                got = ''.join(system.romanize_text(text[a:b]) for a, b in spans)
+                self.assertEqual(got, expected, (size, text))
+
+    def test_romanize_stream(self):
+        rng = random.Random(3)
+        text = random_text(rng, 500)
+        chunks = [text[i:i + 11] for i in range(0, len(text), 11)]
+        for name in system_names():
+            self.assertEqual(''.join(romanization.romanize_stream(chunks, name)),
+                             romanization.romanize(text, name))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+قارئ الملفات النصية: اكتشاف الترميز، وفك الترميز التدريجي مهما صغرت الأجزاء، وتوحيد نهايات الأسطر.
+"""
+
+import importlib
+import os
+import tempfile
+import unittest
+
+import support  # يضيف جذر المشروع إلى المسار
+
+files = importlib.import_module('ملفات_الرومنة')
+
+
+class TextFileReaderTest(unittest.TestCase):
+
+    def test_encodings(self):
+        text = 'الشمس مشرقة\r\nكتاب\rقلم abc\n' * 300
+        expected = text.replace('\r\n', '\n').replace('\r', '\n')
+        with tempfile.TemporaryDirectory() as directory:
+            for encoding in ('utf-8', 'utf-8-sig', 'utf-16', 'utf-16-le', 'windows-1256'):
+                path = os.path.join(directory, encoding)
+                with open(path, 'wb') as f:
+                    f.write(text.encode(encoding))
+                for chunk_size in (1, 3, 4096):
+                    reader = files.TextFileReader(path, chunk_size=chunk_size, normalize_newlines=True)
+                    self.assertEqual(''.join(reader), expected, (encoding, chunk_size))
+                    self.assertEqual(reader.position, reader.size)
+                self.assertEqual(files.read_text_file(path), (expected, reader.encoding))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,516 @@
+# -*- coding: utf-8 -*-
+"""
+خادم HTTP محلي للرومنة (asyncio، بلا اعتماديات خارجية ولا واجهة رسومية)
+
+أمثلة:
+    python خادم_الرومنة.py --port 8765 --workers 4
+    curl -s localhost:8765/romanize -d '{"text": "الشَّمْس", "system": "ala-lc"}'
+    curl -s localhost:8765/romanize/batch -d '{"texts": ["كتاب", "قلم"], "system": "dmg"}'
+
+الطلبات الصغيرة المتزامنة تُجمع في دفعات صغيرة (micro-batching) تُنفَّذ على مجموعة عمليات،
+وعند امتلاء الطابور يرد الخادم فوراً بـ 503 مع Retry-After بدل تكديس الطلبات.
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+
+# المحرك وسجل الأنظمة (الحزمة romanization في مجلد الأداة)
+import romanization
+
+ROMANIZATION_SYSTEMS = romanization.ROMANIZATION_SYSTEMS
+SYSTEM_KEYS = romanization.SYSTEM_KEYS
+resolve_system_name = romanization.resolve_system_name
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# حد الطابور (عدد الطلبات المنتظرة)؛ ما زاد عنه يُرفض بـ 503
+QUEUE_SIZE = 1024
+
+# حدود الدفعة الواحدة: عدد النصوص ومجموع أحرفها
+BATCH_MAX_TEXTS = 256
+BATCH_MAX_CHARS = 1 << 18
+
+# مهلة تجميع الدفعة بعد أول طلب (بالميلي ثانية)
+BATCH_DELAY_MS = 1
+
+# مهلة الاتصال الخامل بين طلبين (keep-alive) بالثواني
+KEEPALIVE_TIMEOUT = 15
+
+# الحد الأقصى لحجم جسم الطلب
+MAX_BODY_BYTES = 16 << 20
+
+
+class HTTPError(Exception):
+    """خطأ يُرد على العميل برمز الحالة ورسالة JSON"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+########################################
+# تنفيذ الدفعات (داخل العمليات العاملة)
+########################################
+
+def warm_up():
+    """مهمة فارغة لتشغيل العمليات العاملة مسبقاً"""
+    return os.getpid()
+
+
+def romanize_many(system_name, texts):
+    """رومنة قائمة نصوص بنظام واحد (تُنفَّذ داخل عملية عاملة)"""
+    romanize = ROMANIZATION_SYSTEMS[system_name]
+    return [romanize(text) for text in texts]
+
+
+class MicroBatcher:
+    """
+    تجميع الطلبات المتزامنة في دفعات صغيرة:
+      - كل طلب (نظام، نصوص) يدخل طابوراً محدوداً، ويُرفض فوراً (QueueFull) إن كان ممتلئاً.
+      - المُجمِّع ينتظر عاملاً متاحاً (max_in_flight دفعة على الأكثر قيد التنفيذ)،
+        ثم يسحب ما تراكم في الطابور خلال مهلة قصيرة حتى حدود الدفعة.
+      - طلبات الدفعة تُقسم حسب النظام، وكل مجموعة مهمة واحدة على المنفِّذ،
+        ثم تُوزَّع النتائج على طلباتها.
+    عند الحمل الخفيف تُرسل الدفعة فوراً، وتكبر الدفعات تلقائياً حين يزدحم العمال.
+    إن مات أحد العمال تفشل طلبات الدفعة بـ BrokenProcessPool ويُستدعى on_broken(المنفِّذ)
+    ليستبدله، فالمنفِّذ المعطوب لا يقبل مهاماً بعدها.
+    """
+
+    def __init__(self, executor, max_in_flight, queue_size=QUEUE_SIZE,
+                 batch_delay=BATCH_DELAY_MS / 1000, batch_max_texts=BATCH_MAX_TEXTS,
+                 batch_max_chars=BATCH_MAX_CHARS, on_broken=None):
+        self.executor = executor
+        self.on_broken = on_broken
+        self.batch_delay = batch_delay
+        self.batch_max_texts = batch_max_texts
+        self.batch_max_chars = batch_max_chars
+        self._queue = asyncio.Queue(queue_size)
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._task = None
+        self.in_flight = 0
+        self.batches = 0
+        self.requests = 0
+
+    @property
+    def queued(self):
+        """عدد الطلبات المنتظرة في الطابور"""
+        return self._queue.qsize()
+
+    def start(self):
+        """تشغيل المُجمِّع في الحلقة الحالية"""
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """إيقاف المُجمِّع وإلغاء الطلبات التي لم تُرسل بعد"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        while not self._queue.empty():
+            _, _, future = self._queue.get_nowait()
+            future.cancel()
+
+    def submit(self, system_name, texts):
+        """
+        إضافة طلب إلى الطابور وإرجاع future بقائمة النتائج.
+        يرفع asyncio.QueueFull إن كان الطابور ممتلئاً (الضغط العكسي).
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((system_name, texts, future))
+        return future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                await self._slots.acquire()
+                # عمال آخرون مشغولون: مهلة قصيرة لتتراكم طلبات أكثر في الدفعة
+                if self.in_flight and self.batch_delay > 0:
+                    await asyncio.sleep(self.batch_delay)
+            except asyncio.CancelledError:
+                batch[0][2].cancel()
+                raise
+
+            texts = len(batch[0][1])
+            chars = sum(map(len, batch[0][1]))
+            while texts < self.batch_max_texts and chars < self.batch_max_chars:
+                try:
+                    item = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                batch.append(item)
+                texts += len(item[1])
+                chars += sum(map(len, item[1]))
+
+            self.in_flight += 1
+            loop.create_task(self._dispatch(loop, batch))
+
+    async def _dispatch(self, loop, batch):
+        """تنفيذ دفعة: مهمة واحدة لكل نظام، ثم توزيع النتائج على الطلبات"""
+        try:
+            groups = {}
+            for item in batch:
+                groups.setdefault(item[0], []).append(item)
+            await asyncio.gather(*(
+                self._dispatch_group(loop, system_name, items)
+                for system_name, items in groups.items()
+            ))
+            self.batches += 1
+            self.requests += len(batch)
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+
+    async def _dispatch_group(self, loop, system_name, items):
+        texts = [text for _, item_texts, _ in items for text in item_texts]
+        executor = self.executor
+        try:
+            results = await loop.run_in_executor(executor, romanize_many, system_name, texts)
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool) and self.on_broken is not None:
+                self.on_broken(executor)
+            for _, _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        start = 0
+        for _, item_texts, future in items:
+            end = start + len(item_texts)
+            if not future.done():
+                future.set_result(results[start:end])
+            start = end
+
+
+########################################
+# بروتوكول HTTP/1.1 (الحد الأدنى اللازم)
+########################################
+
+async def read_line(reader, status, message):
+    """قراءة سطر واحد؛ السطر الأطول من حد القارئ يُرد بـ status بدل استثناء غير معالج"""
+    try:
+        return await reader.readline()
+    except (ValueError, asyncio.LimitOverrunError):
+        raise HTTPError(status, message)
+
+
+async def read_request(reader):
+    """
+    قراءة طلب HTTP واحد من الاتصال.
+    تُرجع (الطريقة، المسار، الرؤوس، الجسم، إبقاء الاتصال) أو None عند إغلاق العميل للاتصال.
+    """
+    request_line = await read_line(reader, 414, "سطر الطلب أطول من الحد المسموح")
+    if not request_line:
+        return None
+    try:
+        method, target, version = request_line.decode('latin-1').split()
+    except ValueError:
+        raise HTTPError(400, "سطر طلب غير صالح")
+
+    headers = {}
+    while True:
+        line = await read_line(reader, 431, "سطر رأس أطول من الحد المسموح")
+        if line in (b'\r\n', b'\n'):
+            break
+        if not line:
+            return None
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    connection = headers.get('connection', '').lower()
+    if version == 'HTTP/1.1':
+        keep_alive = connection != 'close'
+    else:
+        keep_alive = connection == 'keep-alive'
+
+    if 'transfer-encoding' in headers:
+        raise HTTPError(411, "يلزم Content-Length (لا يُدعم الترميز المجزأ)")
+    try:
+        length = int(headers.get('content-length', 0))
+    except ValueError:
+        raise HTTPError(400, "Content-Length غير صالح")
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(413, f"جسم الطلب أكبر من {MAX_BODY_BYTES} بايت")
+    body = await reader.readexactly(length) if length else b''
+
+    path = target.split('?', 1)[0]
+    return method.upper(), path, headers, body, keep_alive
+
+
+def build_response(status, payload, keep_alive, extra_headers=()):
+    """بناء استجابة JSON كاملة (الرؤوس والجسم) كبايتات"""
+    body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    lines = [
+        f"HTTP/1.1 {status} {HTTPStatus(status).phrase}",
+        "Content-Type: application/json; charset=utf-8",
+        f"Content-Length: {len(body)}",
+        "Connection: " + ("keep-alive" if keep_alive else "close"),
+    ]
+    lines.extend(f"{name}: {value}" for name, value in extra_headers)
+    return ("\r\n".join(lines) + "\r\n\r\n").encode('latin-1') + body
+
+
+def _parse_json(body):
+    """فك جسم الطلب كـ JSON كائن"""
+    try:
+        payload = json.loads(body.decode('utf-8'))
+    except (UnicodeDecodeError, ValueError):
+        raise HTTPError(400, "جسم الطلب ليس JSON صالحاً")
+    if not isinstance(payload, dict):
+        raise HTTPError(400, "جسم الطلب يجب أن يكون كائن JSON")
+    return payload
+
+
+def _resolve_system(payload):
+    """اسم النظام من حقل system (اسم مختصر أو كامل، الحالي افتراضياً)"""
+    system = payload.get('system', 'current')
+    if not isinstance(system, str):
+        raise HTTPError(400, "الحقل system يجب أن يكون نصاً")
+    try:
+        return resolve_system_name(system)
+    except KeyError as e:
+        raise HTTPError(400, e.args[0])
+
+
+########################################
+# الخادم
+########################################
+
+class RomanizationServer:
+    """
+    خادم asyncio بنقاط النهاية:
+      POST /romanize        {"text": "...", "system": "ala-lc"}  -> {"result": "...", "system": ...}
+      POST /romanize/batch  {"texts": [...], "system": "dmg"}    -> {"results": [...], "system": ...}
+      GET  /systems         الأسماء المختصرة والكاملة للأنظمة
+      GET  /health          حالة الطابور والدفعات وعدد مرات استبدال العمال
+    الاتصالات تبقى مفتوحة (keep-alive) حتى يطلب العميل الإغلاق أو تنقضي مهلة الخمول.
+    """
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, workers=None,
+                 queue_size=QUEUE_SIZE, batch_delay_ms=BATCH_DELAY_MS,
+                 keepalive_timeout=KEEPALIVE_TIMEOUT):
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.batch_delay = batch_delay_ms / 1000
+        self.keepalive_timeout = keepalive_timeout
+        self.executor = None
+        self.batcher = None
+        self.restarts = 0
+        self._server = None
+        self._connections = {}
+
+    async def start(self):
+        """تشغيل المنفِّذ والمُجمِّع والاستماع (المنفذ 0 يختار منفذاً متاحاً)"""
+        # عامل واحد يعمل في خيط داخل العملية نفسها دون كلفة نقل بين العمليات
+        if self.workers == 1:
+            self.executor = ThreadPoolExecutor(max_workers=1)
+        else:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+            # العمليات تُنشأ (fork) عند أول مهمة؛ لو أُنشئت بعد فتح المنفذ لورثت مقبس الاستماع
+            # ومقابس العملاء، فلا يصل إغلاق الاتصال (FIN) إلى العميل. لذا تُشغَّل كلها قبل الاستماع:
+            # مهمة فارغة لكل عامل تُرسل دفعة واحدة فتُنشئ كل مهمة عملية جديدة
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(*[
+                loop.run_in_executor(self.executor, warm_up) for _ in range(self.workers)
+            ])
+        self.batcher = MicroBatcher(
+            self.executor, self.workers, queue_size=self.queue_size, batch_delay=self.batch_delay,
+            on_broken=self.restart_workers
+        )
+        self.batcher.start()
+        self._server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    def restart_workers(self, broken):
+        """
+        استبدال مجموعة عمليات معطوبة (مات أحد عمالها) بمجموعة جديدة.
+        الخادم يستمع الآن فلا تُنشأ العمليات الجديدة بـ fork (لورثت المقابس المفتوحة)،
+        بل من خادم عمليات نظيف (forkserver)، أو بـ spawn حيث لا يتوفر.
+        """
+        if broken is not self.executor:
+            return
+        broken.shutdown(wait=False)
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+        self.batcher.executor = self.executor
+        self.restarts += 1
+
+    async def serve_forever(self):
+        await self._server.serve_forever()
+
+    async def close(self):
+        """إيقاف الاستماع، وإغلاق الاتصالات المفتوحة بعد إتمام طلباتها، ثم المُجمِّع والعمال"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for writer in self._connections.values():
+            writer.close()
+        if self._connections:
+            await asyncio.gather(*self._connections, return_exceptions=True)
+        if self.batcher is not None:
+            await self.batcher.stop()
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    async def handle_connection(self, reader, writer):
+        """خدمة اتصال واحد: طلب تلو طلب ما دام الاتصال مفتوحاً"""
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(read_request(reader), self.keepalive_timeout)
+                except asyncio.TimeoutError:
+                    break
+                except HTTPError as e:
+                    # طلب غير قابل للتحليل: لا يمكن معرفة بداية الطلب التالي فيُغلق الاتصال
+                    writer.write(build_response(e.status, {'error': e.message}, keep_alive=False))
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+
+                method, path, headers, body, keep_alive = request
+                status, payload, extra_headers = await self.dispatch(method, path, body)
+                writer.write(build_response(status, payload, keep_alive, extra_headers))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            del self._connections[task]
+            writer.close()
+
+    async def dispatch(self, method, path, body):
+        """توجيه الطلب إلى نقطة النهاية؛ تُرجع (رمز الحالة، الحمولة، رؤوس إضافية)"""
+        routes = {
+            '/romanize': ('POST', self.romanize_single),
+            '/romanize/batch': ('POST', self.romanize_batch),
+            '/systems': ('GET', self.list_systems),
+            '/health': ('GET', self.health),
+        }
+        route = routes.get(path.rstrip('/') or '/')
+        if route is None:
+            return 404, {'error': f"مسار غير معروف: {path}"}, ()
+        expected_method, handler = route
+        if method != expected_method:
+            return 405, {'error': f"الطريقة المسموحة: {expected_method}"}, (('Allow', expected_method),)
+
+        try:
+            return 200, await handler(body), ()
+        except HTTPError as e:
+            return e.status, {'error': e.message}, ()
+        except asyncio.QueueFull:
+            return 503, {'error': "الخادم مشغول، أعد المحاولة لاحقاً"}, (('Retry-After', '1'),)
+        except BrokenProcessPool:
+            return 503, {'error': "أُعيد تشغيل العمليات العاملة، أعد المحاولة"}, (('Retry-After', '1'),)
+        except Exception as e:
+            return 500, {'error': f"{type(e).__name__}: {e}"}, ()
+
+    async def romanize_single(self, body):
+        payload = _parse_json(body)
+        text = payload.get('text')
+        if not isinstance(text, str):
+            raise HTTPError(400, "الحقل text مطلوب ويجب أن يكون نصاً")
+        system_name = _resolve_system(payload)
+        results = await self.batcher.submit(system_name, [text])
+        return {'result': results[0], 'system': system_name}
+
+    async def romanize_batch(self, body):
+        payload = _parse_json(body)
+        texts = payload.get('texts')
+        if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+            raise HTTPError(400, "الحقل texts مطلوب ويجب أن يكون قائمة نصوص")
+        system_name = _resolve_system(payload)
+        results = await self.batcher.submit(system_name, texts) if texts else []
+        return {'results': results, 'system': system_name}
+
+    async def list_systems(self, body):
+        return {'systems': [
+            {'key': key, 'name': name} for key, name in SYSTEM_KEYS.items()
+        ]}
+
+    async def health(self, body):
+        batcher = self.batcher
+        return {
+            'status': 'ok',
+            'workers': self.workers,
+            'queued': batcher.queued,
+            'queue_size': self.queue_size,
+            'in_flight': batcher.in_flight,
+            'batches': batcher.batches,
+            'requests': batcher.requests,
+            'restarts': self.restarts,
+        }
+
+
+########################################
+# نقطة الدخول
+########################################
+
+def build_parser():
+    """بناء محلل المعاملات."""
+    parser = argparse.ArgumentParser(description="خادم HTTP محلي للرومنة")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"عنوان الاستماع (الافتراضي: {DEFAULT_HOST})")
+    parser.add_argument(
+        "--port", type=int, default=DEFAULT_PORT,
+        help=f"منفذ الاستماع (الافتراضي: {DEFAULT_PORT}، و0 لمنفذ متاح)"
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, default=None,
+        help="عدد العمليات العاملة (الافتراضي: عدد المعالجات؛ 1 = خيط داخل الخادم)"
+    )
+    parser.add_argument(
+        "--queue-size", type=int, default=QUEUE_SIZE,
+        help=f"حد الطلبات المنتظرة قبل الرد بـ 503 (الافتراضي: {QUEUE_SIZE})"
+    )
+    parser.add_argument(
+        "--batch-delay-ms", type=float, default=BATCH_DELAY_MS,
+        help=f"مهلة تجميع الدفعة بالميلي ثانية (الافتراضي: {BATCH_DELAY_MS})"
+    )
+    return parser
+
+
+async def serve(args):
+    server = RomanizationServer(
+        host=args.host, port=args.port, workers=args.workers,
+        queue_size=args.queue_size, batch_delay_ms=args.batch_delay_ms,
+    )
+    await server.start()
+    print(f"خادم الرومنة يستمع على http://{server.host}:{server.port} ({server.workers} عامل)", flush=True)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
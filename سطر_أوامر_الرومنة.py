@@ -0,0 +1,417 @@
+# -*- coding: utf-8 -*-
+"""
+واجهة سطر الأوامر لأداة الرومنة (بدون واجهة رسومية)
+
+أمثلة:
+    cat نص.txt | python سطر_أوامر_الرومنة.py pipe --system ala-lc > نتيجة.txt
+    python سطر_أوامر_الرومنة.py pipe --line-buffered < /dev/stdin
+    python سطر_أوامر_الرومنة.py batch المصادر/ --output النتائج/ --system dmg --workers 8
+    python سطر_أوامر_الرومنة.py batch المصادر/ --output النتائج/ --docx
+    python سطر_أوامر_الرومنة.py shard المدونة.txt --output النتيجة.txt --system dmg --workers 8
+    python سطر_أوامر_الرومنة.py lexicon الأعلام.tsv --output الأعلام.rlex
+    python سطر_أوامر_الرومنة.py pipe --system ala-lc --lexicon الأعلام.rlex < نص.txt
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# المحرك وسجل الأنظمة (الحزمة romanization في مجلد الأداة)
+import romanization
+from romanization.lexicon import build_lexicon_from_tsv
+from romanization.parallel import iter_romanize_parallel
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+
+# قارئ الملفات (اكتشاف الترميز وفك الترميز التدريجي)
+romanization_files_module = sys.modules.get("ملفات_الرومنة")
+if romanization_files_module is None:
+    spec = importlib.util.spec_from_file_location(
+        "ملفات_الرومنة", os.path.join(current_dir, "ملفات_الرومنة.py")
+    )
+    romanization_files_module = importlib.util.module_from_spec(spec)
+    sys.modules["ملفات_الرومنة"] = romanization_files_module
+    spec.loader.exec_module(romanization_files_module)
+
+ROMANIZATION_SYSTEMS = romanization.ROMANIZATION_SYSTEMS
+TextFileReader = romanization_files_module.TextFileReader
+LEGACY_ENCODING = romanization_files_module.LEGACY_ENCODING
+iter_docx_paragraphs = romanization_files_module.iter_docx_paragraphs
+read_text_file = romanization_files_module.read_text_file
+romanize_docx = romanization_files_module.romanize_docx
+get_compiled_system = romanization.get_compiled_system
+SYSTEM_KEYS = romanization.SYSTEM_KEYS
+resolve_system_name = romanization.resolve_system_name
+romanize_stream = romanization.romanize_stream
+
+# حجم القراءة الأقصى في كل مرة (بالأحرف) حتى تبقى الذاكرة ثابتة
+# حتى مع الأسطر الطويلة جداً
+READ_CHUNK_SIZE = 1 << 16
+
+
+def worker_pool(workers, system_name, lexicon=None):
+    """
+    مجموعة عمليات عاملة؛ مع معجم يُربط في كل عملية عند بدئها
+    (لا يُورث ربط المعجم في أنظمة التشغيل التي تبدأ العمليات بـ spawn).
+    """
+    if lexicon:
+        return ProcessPoolExecutor(
+            max_workers=workers, initializer=romanization.set_lexicon, initargs=(system_name, lexicon)
+        )
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+########################################
+# وضع الأنبوب (stdin -> stdout)
+########################################
+
+def iter_input_chunks(stream, line_buffered=False, chunk_size=READ_CHUNK_SIZE):
+    """
+    قراءة المدخل على أجزاء محدودة الحجم:
+      - في الوضع السطري: سطراً سطراً (مع حد أقصى لطول الجزء)
+      - وإلا: كتلاً بحجم chunk_size
+    """
+    read = stream.readline if line_buffered else stream.read
+    while True:
+        chunk = read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+def run_pipe(system_name, line_buffered=False, stdin=None, stdout=None):
+    """رومنة المدخل القياسي وكتابة النتيجة إلى المخرج القياسي بذاكرة ثابتة."""
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+
+    for romanized in romanize_stream(iter_input_chunks(stdin, line_buffered), system_name):
+        stdout.write(romanized)
+        if line_buffered:
+            stdout.flush()
+    stdout.flush()
+    return 0
+
+
+########################################
+# وضع الدفعة (مجلدات TXT و DOCX)
+########################################
+
+# امتدادات الملفات المدعومة في وضع الدفعة
+BATCH_EXTENSIONS = ('.txt', '.docx')
+
+
+def collect_batch_files(input_dirs, output_dir, keep_docx=False):
+    """
+    جمع ملفات TXT و DOCX من المجلدات المدخلة مع مسار المخرج المقابل لكل ملف.
+    المخرجات تعكس شجرة المدخل؛ ومع أكثر من مجلد يوضع كل مجلد تحت اسمه.
+    ملفات DOCX تُكتب نصاً باسم <الملف>.docx.txt، أو مستند Word بالاسم نفسه
+    مع keep_docx (رومنة في المكان مع الحفاظ على التنسيق).
+    """
+    jobs = []
+    for input_dir in input_dirs:
+        input_dir = os.path.abspath(input_dir)
+        target_root = output_dir
+        if len(input_dirs) > 1:
+            target_root = os.path.join(output_dir, os.path.basename(input_dir.rstrip(os.sep)))
+
+        for root, dirs, files in os.walk(input_dir):
+            dirs.sort()
+            for name in sorted(files):
+                if not name.lower().endswith(BATCH_EXTENSIONS):
+                    continue
+                source = os.path.join(root, name)
+                relative = os.path.relpath(source, input_dir)
+                if name.lower().endswith('.docx') and not keep_docx:
+                    relative += '.txt'
+                jobs.append((source, os.path.join(target_root, relative)))
+    return jobs
+
+
+def _romanize_txt_file(source, target, system_name):
+    """
+    رومنة ملف نصي في مرور واحد: يُكتشف الترميز من عينة ويُفك تدريجياً من mmap
+    إلى الرومنة التدفقية مباشرة. تُرجع عدد الأحرف.
+    """
+    encoding = None
+    while True:
+        reader = TextFileReader(source, encoding)
+        chars = [0]
+
+        def counted_chunks():
+            for chunk in reader:
+                chars[0] += len(chunk)
+                yield chunk
+
+        try:
+            with open(target, 'w', encoding='utf-8', newline='') as dst:
+                for romanized in romanize_stream(counted_chunks(), system_name):
+                    dst.write(romanized)
+            return chars[0]
+        except UnicodeDecodeError:
+            # بايت غير صالح في UTF-8 خارج عينات الاكتشاف (ملف مختلط): إعادة بالترميز القديم
+            if reader.encoding != 'utf-8':
+                raise
+            encoding = LEGACY_ENCODING
+
+
+def _romanize_docx_file(source, target, system_name):
+    """رومنة فقرات ملف Word فقرةً فقرة (تحليل تدفقي) وكتابتها نصاً، وإرجاع عدد الأحرف."""
+    romanize = ROMANIZATION_SYSTEMS[system_name]
+    chars = 0
+    separator = ''
+    with open(target, 'w', encoding='utf-8', newline='') as dst:
+        for paragraph in iter_docx_paragraphs(source):
+            dst.write(separator)
+            dst.write(romanize(paragraph))
+            chars += len(separator) + len(paragraph)
+            separator = '\n'
+    return chars
+
+
+def romanize_file(job):
+    """
+    رومنة ملف واحد (تُنفَّذ داخل عملية عاملة).
+    تُرجع (المصدر، المخرج، عدد الأحرف، الزمن بالثواني، رسالة الخطأ أو None).
+    """
+    source, target, system_name = job
+    started = time.perf_counter()
+    try:
+        os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+        if target.lower().endswith('.docx'):
+            chars = romanize_docx(source, target, get_compiled_system(system_name))
+        elif source.lower().endswith('.docx'):
+            chars = _romanize_docx_file(source, target, system_name)
+        else:
+            chars = _romanize_txt_file(source, target, system_name)
+        return source, target, chars, time.perf_counter() - started, None
+    except Exception as e:
+        return source, target, 0, time.perf_counter() - started, f"{type(e).__name__}: {e}"
+
+
+def run_batch(input_dirs, output_dir, system_name, workers=None, out=None, keep_docx=False,
+              lexicon=None):
+    """
+    رومنة كل ملفات TXT و DOCX في المجلدات عبر مجموعة عمليات متوازية،
+    مع طباعة زمن كل ملف ومعدل الإنجاز الإجمالي (حرف/ثانية).
+    """
+    out = out or sys.stdout
+    jobs = [(source, target, system_name)
+            for source, target in collect_batch_files(input_dirs, output_dir, keep_docx)]
+    if not jobs:
+        print("لا توجد ملفات TXT أو DOCX في المدخلات", file=out)
+        return 1
+
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+    total_chars = 0
+    failures = 0
+
+    executor = None
+    if workers == 1:
+        results = map(romanize_file, jobs)
+    else:
+        executor = worker_pool(workers, system_name, lexicon)
+        results = executor.map(romanize_file, jobs)
+
+    try:
+        for source, target, chars, seconds, error in results:
+            if error:
+                failures += 1
+                print(f"[فشل] {source}: {error}", file=out)
+                continue
+            total_chars += chars
+            rate = chars / seconds if seconds > 0 else 0.0
+            print(f"[تم] {source} -> {target}  {chars} حرف  {seconds:.3f} ث  ({rate:,.0f} حرف/ث)", file=out)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    elapsed = time.perf_counter() - started
+    throughput = total_chars / elapsed if elapsed > 0 else 0.0
+    print(
+        f"المجموع: {len(jobs) - failures}/{len(jobs)} ملف، {total_chars} حرف في {elapsed:.2f} ث "
+        f"({throughput:,.0f} حرف/ث، {workers} عملية)",
+        file=out
+    )
+    return 1 if failures else 0
+
+
+########################################
+# وضع التقسيم (مستند واحد ضخم)
+########################################
+
+def run_shard(source, target, system_name, workers=None, out=None, lexicon=None):
+    """
+    رومنة ملف نصي واحد ضخم بتقسيمه إلى قطع عند حدود آمنة تُرومن على عدة عمليات،
+    وكتابة النتائج بترتيبها فور جاهزيتها (مطابقة للرومنة التسلسلية).
+    """
+    out = out or sys.stdout
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+    text, encoding = read_text_file(source)
+    read_seconds = time.perf_counter() - started
+
+    os.makedirs(os.path.dirname(os.path.abspath(target)), exist_ok=True)
+    executor = worker_pool(workers, system_name, lexicon) if workers > 1 else None
+    try:
+        with open(target, 'w', encoding='utf-8', newline='') as dst:
+            for romanized in iter_romanize_parallel(text, system_name, workers=workers, executor=executor):
+                dst.write(romanized)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    elapsed = time.perf_counter() - started
+    throughput = len(text) / elapsed if elapsed > 0 else 0.0
+    print(
+        f"[تم] {source} ({encoding}) -> {target}  {len(text)} حرف في {elapsed:.2f} ث "
+        f"(القراءة {read_seconds:.2f} ث، {throughput:,.0f} حرف/ث، {workers} عملية)",
+        file=out
+    )
+    return 0
+
+
+########################################
+# بناء معجم الرومنات المعروفة
+########################################
+
+def run_lexicon(source, target, out=None):
+    """تجميع ملف TSV (الكلمة<TAB>الرومنة) إلى ملف معجم مربوط بالذاكرة"""
+    out = out or sys.stdout
+    started = time.perf_counter()
+    count = build_lexicon_from_tsv(source, target)
+    print(
+        f"[تم] {source} -> {target}  {count} مدخل، {os.path.getsize(target)} بايت "
+        f"في {time.perf_counter() - started:.2f} ث",
+        file=out
+    )
+    return 0
+
+
+########################################
+# نقطة الدخول
+########################################
+
+def build_parser():
+    """بناء محلل المعاملات."""
+    parser = argparse.ArgumentParser(
+        description="أداة الرومنة من سطر الأوامر"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    pipe_parser = subparsers.add_parser(
+        "pipe", help="رومنة stdin إلى stdout بشكل تدفقي"
+    )
+    pipe_parser.add_argument(
+        "--system", default="current",
+        help="نظام الرومنة: " + ", ".join(SYSTEM_KEYS) + " (أو الاسم الكامل)"
+    )
+    pipe_parser.add_argument(
+        "--lexicon", default=None,
+        help="ملف معجم رومنات معروفة (.rlex) يُبحث فيه قبل القواعد"
+    )
+    pipe_parser.add_argument(
+        "--line-buffered", action="store_true",
+        help="إخراج كل سطر فور رومنته (مناسب لخطوط الأنابيب التفاعلية)"
+    )
+
+    batch_parser = subparsers.add_parser(
+        "batch", help="رومنة كل ملفات TXT و DOCX في مجلد أو أكثر"
+    )
+    batch_parser.add_argument("inputs", nargs="+", help="مجلدات المدخلات")
+    batch_parser.add_argument(
+        "-o", "--output", required=True, help="مجلد المخرجات (يعكس شجرة المدخلات)"
+    )
+    batch_parser.add_argument(
+        "--system", default="current",
+        help="نظام الرومنة: " + ", ".join(SYSTEM_KEYS) + " (أو الاسم الكامل)"
+    )
+    batch_parser.add_argument(
+        "--lexicon", default=None,
+        help="ملف معجم رومنات معروفة (.rlex) يُبحث فيه قبل القواعد"
+    )
+    batch_parser.add_argument(
+        "-j", "--workers", type=int, default=None,
+        help="عدد العمليات المتوازية (الافتراضي: عدد المعالجات)"
+    )
+    batch_parser.add_argument(
+        "--docx", action="store_true",
+        help="كتابة ملفات DOCX مرومنة بتنسيقها الأصلي بدلاً من نص عادي"
+    )
+
+    shard_parser = subparsers.add_parser(
+        "shard", help="رومنة ملف نصي واحد ضخم على عدة عمليات (تقسيم المستند)"
+    )
+    shard_parser.add_argument("input", help="الملف النصي المدخل")
+    shard_parser.add_argument("-o", "--output", required=True, help="ملف المخرج")
+    shard_parser.add_argument(
+        "--system", default="current",
+        help="نظام الرومنة: " + ", ".join(SYSTEM_KEYS) + " (أو الاسم الكامل)"
+    )
+    shard_parser.add_argument(
+        "--lexicon", default=None,
+        help="ملف معجم رومنات معروفة (.rlex) يُبحث فيه قبل القواعد"
+    )
+    shard_parser.add_argument(
+        "-j", "--workers", type=int, default=None,
+        help="عدد العمليات المتوازية (الافتراضي: عدد المعالجات)"
+    )
+
+    lexicon_parser = subparsers.add_parser(
+        "lexicon", help="بناء ملف معجم رومنات معروفة من ملف TSV (الكلمة<TAB>الرومنة)"
+    )
+    lexicon_parser.add_argument("input", help="ملف TSV المصدر")
+    lexicon_parser.add_argument("-o", "--output", required=True, help="ملف المعجم الناتج (.rlex)")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "lexicon":
+        if not os.path.isfile(args.input):
+            parser.error(f"ليس ملفاً: {args.input}")
+        try:
+            return run_lexicon(args.input, args.output)
+        except ValueError as e:
+            parser.error(str(e))
+
+    try:
+        system_name = resolve_system_name(args.system)
+    except KeyError as e:
+        parser.error(e.args[0])
+
+    if args.lexicon:
+        try:
+            romanization.set_lexicon(system_name, args.lexicon)
+        except (OSError, ValueError) as e:
+            parser.error(f"تعذر فتح المعجم: {e}")
+
+    if args.command == "pipe":
+        # قراءة وكتابة UTF-8 دون تحويل نهايات الأسطر
+        sys.stdin.reconfigure(encoding="utf-8", newline="")
+        sys.stdout.reconfigure(encoding="utf-8", newline="")
+        return run_pipe(system_name, line_buffered=args.line_buffered)
+
+    if args.command == "batch":
+        for input_dir in args.inputs:
+            if not os.path.isdir(input_dir):
+                parser.error(f"ليس مجلداً: {input_dir}")
+        return run_batch(args.inputs, args.output, system_name,
+                         workers=args.workers, keep_docx=args.docx, lexicon=args.lexicon)
+
+    if args.command == "shard":
+        if not os.path.isfile(args.input):
+            parser.error(f"ليس ملفاً: {args.input}")
+        return run_shard(args.input, args.output, system_name, workers=args.workers,
+                         lexicon=args.lexicon)
+
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
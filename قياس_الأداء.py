@@ -0,0 +1,487 @@
+# -*- coding: utf-8 -*-
+"""
+قياس أداء الرومنة على نصوص عربية اصطناعية قابلة لإعادة الإنتاج
+
+يولّد نصاً بحجم وكثافة تشكيل ونسبة كلمات لاتينية وانحراف تكرار (Zipf) محددة،
+ثم يقيس مرحلة التطبيع (normalize_text) و romanize_text وكل نظام في ROMANIZATION_SYSTEMS:
+حرف/ثانية، كلمة/ثانية، ومئينات زمن معالجة السطر الواحد.
+
+أمثلة:
+    python قياس_الأداء.py --size 2000000 --vocalization 0.3
+    python قياس_الأداء.py --noise 0.05
+    python قياس_الأداء.py --save-baseline خط_الأساس.json
+    python قياس_الأداء.py --compare خط_الأساس.json --threshold 0.10
+    python قياس_الأداء.py --startup --startup-budget 1000
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import unicodedata
+
+# المحرك وسجل الأنظمة (الحزمة romanization في مجلد الأداة)
+import romanization
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+
+ROMANIZATION_SYSTEMS = romanization.ROMANIZATION_SYSTEMS
+get_compiled_system = romanization.get_compiled_system
+enable_profiling = romanization.enable_profiling
+disable_profiling = romanization.disable_profiling
+romanize_text = romanization.get_compiled_system('النظام الحالي').romanize_text
+normalize_text = romanization.normalize_text
+
+
+########################################
+# 1) توليد النصوص الاصطناعية
+########################################
+
+# حروف الجذور (بلا الأحرف السياقية، تُضاف تلك بنسب محددة أدناه)
+ROOT_LETTERS = 'بتثجحخدذرزسشصضطظعغفقكلمنهوي'
+LONG_VOWELS = 'اوي'
+SHORT_VOWELS = 'َُِ'
+TANWEEN = 'ًٌٍ'
+SHADDA = 'ّ'
+
+# كلمات وظيفية شائعة تتصدر توزيع التكرار كما في النصوص الحقيقية
+FUNCTION_WORDS = ['في', 'من', 'على', 'إلى', 'الله', 'عن', 'أن', 'التي', 'الذي', 'هذا', 'ابن', 'بن']
+
+LATIN_WORDS = ['ibid', 'vol', 'ed', 'pp', 'Beirut', 'Cairo', 'Dar', 'press', '1999', '2004']
+
+
+def _make_word(rng):
+    """كلمة عربية اصطناعية: جذر ثلاثي أو رباعي مع زوائد شائعة."""
+    letters = [rng.choice(ROOT_LETTERS) for _ in range(rng.choice((3, 3, 3, 4)))]
+    if rng.random() < 0.4:
+        letters.insert(rng.randint(1, len(letters) - 1), rng.choice(LONG_VOWELS))
+    if rng.random() < 0.35:
+        letters.insert(0, 'ال')
+    if rng.random() < 0.2:
+        letters.append('ة')
+    if rng.random() < 0.03:
+        letters.insert(0, 'آ')
+    return ''.join(letters)
+
+
+def _vocalize(word, density, rng):
+    """إضافة حركات (وشدّات وتنوين أحياناً) بعد كل حرف باحتمال density."""
+    if density <= 0:
+        return word
+    out = []
+    # "ال" التعريف تبقى بلا تشكيل كما في أغلب النصوص المشكّلة
+    skip = 2 if word.startswith('ال') else 0
+    for i, ch in enumerate(word):
+        out.append(ch)
+        if i < skip or ch in LONG_VOWELS or ch == 'آ' or rng.random() >= density:
+            continue
+        if i > 0 and rng.random() < 0.1:
+            out.append(SHADDA)
+        if i == len(word) - 1 and rng.random() < 0.2:
+            out.append(rng.choice(TANWEEN))
+        else:
+            out.append(rng.choice(SHORT_VOWELS))
+    return ''.join(out)
+
+
+# ضجيج النصوص المنسوخة من PDF وملفات Word القديمة: التطويل وعلامات الاتجاه،
+# وأشكال العرض (الشكل المعزول لكل حرف من Presentation Forms-B)
+TATWEEL = '\u0640'
+BIDI_MARKS = ('\u200f', '\u200e', '\u061c')
+PRESENTATION_LETTERS = {}
+for _code in range(0xFE70, 0xFEFF):
+    PRESENTATION_LETTERS.setdefault(unicodedata.normalize('NFKC', chr(_code)), chr(_code))
+
+
+def _add_noise(word, rng):
+    """تشويه كلمة بأحد أشكال الضجيج: تطويل، أو علامة اتجاه، أو أشكال عرض."""
+    kind = rng.random()
+    if kind < 0.4 and len(word) > 1:
+        i = rng.randint(1, len(word) - 1)
+        return word[:i] + TATWEEL * rng.randint(1, 3) + word[i:]
+    if kind < 0.7:
+        return rng.choice(BIDI_MARKS) + word
+    return ''.join(PRESENTATION_LETTERS.get(ch, ch) for ch in word)
+
+
+def generate_corpus(size=1000000, vocalization=0.0, latin=0.05, skew=1.1,
+                    vocabulary=20000, words_per_line=12, seed=0, noise=0.0):
+    """
+    توليد نص اصطناعي بطول size حرفاً تقريباً (النتيجة نفسها لنفس المعاملات):
+      - vocalization: نسبة الحروف المشكّلة (0 = غير مشكّل، 1 = مشكّل بالكامل)
+      - latin: نسبة الكلمات اللاتينية والأرقام
+      - skew: أُس توزيع Zipf لتكرار الكلمات (أكبر = تكرار أشد)
+      - vocabulary: عدد الكلمات المختلفة
+      - noise: نسبة الكلمات المشوَّهة بالتطويل أو علامات الاتجاه أو أشكال العرض
+    """
+    rng = random.Random(seed)
+    vocab = FUNCTION_WORDS + [_make_word(rng) for _ in range(vocabulary - len(FUNCTION_WORDS))]
+    vocab = [_vocalize(word, vocalization, rng) for word in vocab]
+    weights = [1.0 / (rank ** skew) for rank in range(1, len(vocab) + 1)]
+
+    lines = []
+    total = 0
+    while total < size:
+        words = rng.choices(vocab, weights=weights, k=words_per_line)
+        for i in range(len(words)):
+            if rng.random() < latin:
+                words[i] = rng.choice(LATIN_WORDS)
+            elif noise > 0 and rng.random() < noise:
+                words[i] = _add_noise(words[i], rng)
+        line = ' '.join(words) + rng.choice(('.', '،', '', '')) + '\n'
+        lines.append(line)
+        total += len(line)
+    return ''.join(lines)
+
+
+########################################
+# 2) القياس
+########################################
+
+def _percentile(sorted_values, fraction):
+    """المئين من قائمة مرتبة (أقرب رتبة)."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def benchmark_function(func, corpus, repeat=3, reset=None):
+    """
+    قياس دالة رومنة على النص:
+      - معدل الإنجاز: أفضل زمن من repeat مرات على النص كاملاً
+      - زمن السطر: كل سطر يُرومن على حدة لحساب المئينات (بالميكروثانية)
+    reset: دالة تُستدعى (خارج التوقيت) قبل كل تكرار وقبل قياس زمن السطر، كتفريغ الذاكرة المؤقتة.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        if reset:
+            reset()
+        started = time.perf_counter()
+        func(corpus)
+        best = min(best, time.perf_counter() - started)
+
+    if reset:
+        reset()
+    latencies = []
+    for line in corpus.splitlines(True):
+        started = time.perf_counter()
+        func(line)
+        latencies.append((time.perf_counter() - started) * 1e6)
+    latencies.sort()
+
+    words = len(corpus.split())
+    return {
+        'seconds': best,
+        'chars_per_s': len(corpus) / best if best > 0 else 0.0,
+        'words_per_s': words / best if best > 0 else 0.0,
+        'latency_us': {
+            'p50': _percentile(latencies, 0.50),
+            'p90': _percentile(latencies, 0.90),
+            'p99': _percentile(latencies, 0.99),
+            'max': latencies[-1] if latencies else 0.0,
+        },
+    }
+
+
+def run_benchmarks(corpus, repeat=3, cold_cache=True):
+    """
+    قياس مرحلة التطبيع وحدها (normalize_text)، ثم romanize_text وكل نظام في ROMANIZATION_SYSTEMS.
+    مع cold_cache تُفرَّغ ذاكرة الكلمات المؤقتة قبل كل تكرار مقيس، فتكون كل الأرقام بذاكرة باردة.
+    """
+    targets = [('normalize_text', normalize_text, None)]
+    targets += [('romanize_text', romanize_text, 'النظام الحالي')]
+    targets += [(name, func, name) for name, func in ROMANIZATION_SYSTEMS.items()]
+
+    results = {}
+    for label, func, system_name in targets:
+        reset = None
+        if cold_cache and system_name:
+            reset = get_compiled_system(system_name).clear_cache
+        results[label] = benchmark_function(func, corpus, repeat, reset)
+    return results
+
+
+def profile_systems(corpus):
+    """
+    تمرير واحد لكل نظام مع تفعيل قياس المراحل (بذاكرة مؤقتة فارغة)،
+    وإرجاع {اسم النظام: بيانات المقياس}.
+    """
+    profiles = {}
+    for name, func in ROMANIZATION_SYSTEMS.items():
+        get_compiled_system(name).clear_cache()
+        profiler = enable_profiling()
+        try:
+            func(corpus)
+        finally:
+            disable_profiling()
+        profiles[name] = profiler
+    return profiles
+
+
+########################################
+# 3) خطوط الأساس والمقارنة
+########################################
+
+def compare_with_baseline(results, baseline, threshold=0.10):
+    """
+    مقارنة النتائج بخط أساس محفوظ.
+    تُرجع قائمة (الهدف، المعدل السابق، المعدل الحالي، نسبة التغير) لكل تراجع
+    في حرف/ثانية يتجاوز threshold.
+    """
+    regressions = []
+    for label, current in results.items():
+        previous = baseline.get('results', {}).get(label)
+        if not previous or not previous.get('chars_per_s'):
+            continue
+        change = current['chars_per_s'] / previous['chars_per_s'] - 1.0
+        if change < -threshold:
+            regressions.append((label, previous['chars_per_s'], current['chars_per_s'], change))
+    return regressions
+
+
+def format_report(results):
+    """تقرير نصي مختصر بالنتائج."""
+    lines = [f"{'الهدف':<28} {'حرف/ث':>12} {'كلمة/ث':>10} {'p50 µs':>8} {'p90 µs':>8} {'p99 µs':>8}"]
+    for label, result in results.items():
+        latency = result['latency_us']
+        lines.append(
+            f"{label:<28} {result['chars_per_s']:>12,.0f} {result['words_per_s']:>10,.0f} "
+            f"{latency['p50']:>8.1f} {latency['p90']:>8.1f} {latency['p99']:>8.1f}"
+        )
+    return '\n'.join(lines)
+
+
+########################################
+# 4) زمن بدء تشغيل الواجهة
+########################################
+
+# ميزانية زمن أول رسم للواجهة من بدء العملية (بالميلي ثانية)
+STARTUP_BUDGET_MS = 1000
+
+GUI_FILE = os.path.join(current_dir, "واجهة_الرومنة.py")
+
+# يُشغَّل في عملية مستقلة: يحمّل الواجهة وينشئ النافذة ويطبع الأزمنة عند أول رسم
+STARTUP_PROBE = r"""
+import json, os, sys, time
+started = time.perf_counter()
+import importlib.util
+spec = importlib.util.spec_from_file_location("romanization_gui", sys.argv[1])
+gui = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(gui)
+imported = time.perf_counter()
+app = gui.QApplication(sys.argv[:1])
+app.setStyle('Fusion')
+created_app = time.perf_counter()
+window = gui.RomanizationApp()
+created_window = time.perf_counter()
+
+from PyQt6.QtCore import QObject, QEvent
+PAINT = QEvent.Type.Paint
+
+class FirstPaint(QObject):
+    def eventFilter(self, obj, event):
+        if event.type() == PAINT:
+            painted = time.perf_counter()
+            print(json.dumps({
+                'wall_time': time.time(),
+                'import_ms': (imported - started) * 1000,
+                'app_ms': (created_app - imported) * 1000,
+                'window_ms': (created_window - created_app) * 1000,
+                'show_to_paint_ms': (painted - created_window) * 1000,
+            }))
+            sys.stdout.flush()
+            os._exit(0)
+        return False
+
+first_paint = FirstPaint()
+app.installEventFilter(first_paint)
+window.show()
+app.exec()
+"""
+
+
+def _gui_environment():
+    """بيئة العملية الفرعية: بلا شاشة افتراضياً حتى تكون القياسات قابلة للمقارنة"""
+    env = dict(os.environ)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    return env
+
+
+def measure_startup(runs=5):
+    """
+    قياس زمن بدء الواجهة في runs عمليات مستقلة وإرجاع الوسيط لكل مرحلة:
+    time_to_first_paint_ms من إطلاق العملية حتى أول حدث رسم (يشمل بدء المفسِّر).
+    """
+    samples = []
+    for _ in range(runs):
+        launched = time.time()
+        output = subprocess.run(
+            [sys.executable, '-c', STARTUP_PROBE, GUI_FILE],
+            capture_output=True, text=True, env=_gui_environment(), check=True
+        ).stdout
+        sample = json.loads(output.strip().splitlines()[-1])
+        sample['time_to_first_paint_ms'] = (sample.pop('wall_time') - launched) * 1000
+        samples.append(sample)
+    return {key: statistics.median(sample[key] for sample in samples) for key in samples[0]}
+
+
+def importtime_breakdown(top=10):
+    """
+    تفصيل -X importtime لتحميل وحدة الواجهة: أثقل الوحدات المستوردة مباشرة
+    (الزمن التراكمي بالميلي ثانية).
+    """
+    code = (
+        "import importlib.util, sys\n"
+        "spec = importlib.util.spec_from_file_location('romanization_gui', sys.argv[1])\n"
+        "spec.loader.exec_module(importlib.util.module_from_spec(spec))\n"
+    )
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code, GUI_FILE],
+        capture_output=True, text=True, env=_gui_environment(), check=True
+    ).stderr
+
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # الوحدات المستوردة مباشرة فقط (بلا إزاحة إضافية)
+        if name.startswith('  '):
+            continue
+        modules.append((name.strip(), int(cumulative) / 1000))
+    modules.sort(key=lambda item: item[1], reverse=True)
+    return modules[:top]
+
+
+def run_startup_check(args):
+    """قياس بدء الواجهة ومقارنته بالميزانية وبخط الأساس إن وُجد"""
+    startup = measure_startup(runs=max(args.repeat, 3))
+    print(f"{'المرحلة':<28} {'ms':>8}")
+    for key in ('import_ms', 'app_ms', 'window_ms', 'show_to_paint_ms', 'time_to_first_paint_ms'):
+        print(f"{key:<28} {startup[key]:>8.1f}")
+
+    print("\nأثقل الوحدات المستوردة (-X importtime، تراكمي):")
+    breakdown = importtime_breakdown()
+    for name, milliseconds in breakdown:
+        print(f"  {name:<36} {milliseconds:>8.1f} ms")
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'startup': startup,
+        'importtime': breakdown,
+    }
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\nتم حفظ خط الأساس في {args.save_baseline}")
+
+    status = 0
+    paint_ms = startup['time_to_first_paint_ms']
+    if paint_ms > args.startup_budget:
+        print(f"\nزمن أول رسم {paint_ms:.0f} ms يتجاوز الميزانية {args.startup_budget:.0f} ms")
+        status = 1
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            previous = json.load(f).get('startup', {}).get('time_to_first_paint_ms')
+        if previous:
+            change = paint_ms / previous - 1.0
+            if change > args.threshold:
+                print(f"\nتراجع في زمن أول رسم: {previous:.0f} -> {paint_ms:.0f} ms ({change:+.1%})")
+                status = 1
+            else:
+                print(f"\nلا تراجع يتجاوز {args.threshold:.0%} في زمن أول رسم ({change:+.1%})")
+    return status
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="قياس أداء أنظمة الرومنة")
+    parser.add_argument("--size", type=int, default=1000000, help="حجم النص بالأحرف")
+    parser.add_argument("--vocalization", type=float, default=0.0, help="كثافة التشكيل (0-1)")
+    parser.add_argument("--latin", type=float, default=0.05, help="نسبة الكلمات اللاتينية (0-1)")
+    parser.add_argument("--noise", type=float, default=0.0,
+                        help="نسبة الكلمات المشوَّهة بالتطويل وعلامات الاتجاه وأشكال العرض (0-1)")
+    parser.add_argument("--skew", type=float, default=1.1, help="أُس Zipf لتكرار الكلمات")
+    parser.add_argument("--vocabulary", type=int, default=20000, help="عدد الكلمات المختلفة")
+    parser.add_argument("--seed", type=int, default=0, help="بذرة التوليد")
+    parser.add_argument("--repeat", type=int, default=3, help="عدد التكرارات (يؤخذ الأفضل)")
+    parser.add_argument("--warm-cache", action="store_true", help="عدم تفريغ ذاكرة الكلمات قبل كل تكرار مقيس")
+    parser.add_argument("--profile", action="store_true", help="طباعة قياس المراحل والفروع لكل نظام")
+    parser.add_argument("--save-baseline", metavar="PATH", help="حفظ النتائج كخط أساس JSON")
+    parser.add_argument("--compare", metavar="PATH", help="مقارنة النتائج بخط أساس JSON")
+    parser.add_argument("--threshold", type=float, default=0.10, help="نسبة التراجع المسموحة (0.10 = 10%%)")
+    parser.add_argument("--startup", action="store_true",
+                        help="قياس زمن بدء الواجهة (importtime وزمن أول رسم) بدلاً من الرومنة")
+    parser.add_argument("--startup-budget", type=float, default=STARTUP_BUDGET_MS,
+                        help="ميزانية زمن أول رسم بالميلي ثانية (الافتراضي: %(default)s)")
+    args = parser.parse_args(argv)
+
+    if args.startup:
+        return run_startup_check(args)
+
+    corpus_params = {
+        'size': args.size,
+        'vocalization': args.vocalization,
+        'latin': args.latin,
+        'noise': args.noise,
+        'skew': args.skew,
+        'vocabulary': args.vocabulary,
+        'seed': args.seed,
+    }
+    corpus = generate_corpus(**corpus_params)
+    results = run_benchmarks(corpus, repeat=args.repeat, cold_cache=not args.warm_cache)
+    print(format_report(results))
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'corpus': corpus_params,
+            'cold_cache': not args.warm_cache,
+        },
+        'results': results,
+    }
+
+    if args.profile:
+        profiles = profile_systems(corpus)
+        for name, profiler in profiles.items():
+            print(f"\n=== {name} ===")
+            print(profiler.report())
+        report['profiles'] = {name: profiler.as_dict() for name, profiler in profiles.items()}
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\nتم حفظ خط الأساس في {args.save_baseline}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('meta', {}).get('corpus') != corpus_params:
+            print("\nتحذير: معاملات النص تختلف عن خط الأساس، المقارنة غير دقيقة")
+        regressions = compare_with_baseline(results, baseline, args.threshold)
+        if regressions:
+            print(f"\nتراجع في الأداء يتجاوز {args.threshold:.0%}:")
+            for label, before, after, change in regressions:
+                print(f"  {label}: {before:,.0f} -> {after:,.0f} حرف/ث ({change:+.1%})")
+            return 1
+        print(f"\nلا تراجع يتجاوز {args.threshold:.0%} مقارنة بخط الأساس")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
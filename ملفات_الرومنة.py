@@ -0,0 +1,471 @@
+# -*- coding: utf-8 -*-
+"""
+قراءة ملفات المدخلات لأداة الرومنة
+
+- ملفات TXT: اكتشاف الترميز من عينة محدودة (UTF-8، UTF-8 مع BOM، UTF-16، windows-1256)
+  ثم فك الترميز تدريجياً من ملف مربوط بالذاكرة (mmap) في مرور واحد،
+  فتُغذّى الأجزاء مباشرة إلى الرومنة التدفقية (romanize_stream).
+- ملفات DOCX: تحليل تدفقي لجزء المستند داخل الملف المضغوط (iterparse)
+  يُخرج نص الفقرات واحدة واحدة دون بناء نموذج المستند كاملاً، ودون python-docx.
+- DOCX إلى DOCX: إعادة كتابة عقد النص (w:t) برومنتها جزءاً جزءاً داخل الملف المضغوط
+  مع الحفاظ على التشغيلات والتنسيق والجداول والحواشي كما هي.
+"""
+
+import codecs
+import mmap
+import os
+import posixpath
+import re
+import shutil
+import zipfile
+from xml.etree import ElementTree
+
+# حجم العينة المستخدمة لاكتشاف الترميز (من بداية الملف)،
+# ومعها عينتان أصغر من الوسط والنهاية للملفات الكبيرة
+ENCODING_SAMPLE_SIZE = 64 * 1024
+ENCODING_PROBE_SIZE = 16 * 1024
+
+# حجم كل جزء يُفك ترميزه (بالبايت)
+DECODE_CHUNK_SIZE = 1 << 20
+
+# الترميز البديل للملفات العربية القديمة (يعرّف كل البايتات الـ 256)
+LEGACY_ENCODING = 'windows-1256'
+
+
+########################################
+# 1) اكتشاف الترميز
+########################################
+
+def _is_utf8(sample, at_start=True):
+    """
+    هل العينة UTF-8 صالح؟ الحرف المقطوع في آخر العينة مقبول،
+    وكذلك في أولها إن لم تكن العينة من بداية الملف.
+    """
+    if not at_start:
+        # تخطي بايتات التتمة (10xxxxxx) لحرف بدأ قبل العينة
+        skip = 0
+        while skip < 3 and skip < len(sample) and 0x80 <= sample[skip] <= 0xBF:
+            skip += 1
+        sample = sample[skip:]
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+        return True
+    except UnicodeDecodeError:
+        return False
+
+
+def _utf16_without_bom(sample):
+    """
+    اكتشاف UTF-16 بلا BOM: النص بـ UTF-8 أو windows-1256 لا يحوي البايت 0x00
+    ولا 0x06 (محرفا تحكم)، أما UTF-16 فتنتجهما المسافات والأرقام (0x00)
+    والحروف العربية U+06xx (0x06) في خانات زوجية فقط أو فردية فقط.
+    """
+    even = sample[0::2]
+    odd = sample[1::2]
+    even_marks = even.count(0) + even.count(6)
+    odd_marks = odd.count(0) + odd.count(6)
+    if odd_marks and even_marks <= odd_marks // 10:
+        return 'utf-16-le'
+    if even_marks and odd_marks <= even_marks // 10:
+        return 'utf-16-be'
+    return None
+
+
+def detect_encoding(data):
+    """
+    اكتشاف ترميز البيانات (bytes أو mmap) من عينات محدودة الحجم.
+    تُرجع اسم الترميز المناسب لـ codecs: 'utf-8-sig' أو 'utf-16' أو 'utf-16-le' أو
+    'utf-16-be' أو 'utf-8' أو 'windows-1256'.
+    """
+    head = data[:ENCODING_SAMPLE_SIZE]
+    if head.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if head.startswith(codecs.BOM_UTF16_LE) or head.startswith(codecs.BOM_UTF16_BE):
+        return 'utf-16'
+
+    utf16 = _utf16_without_bom(head)
+    if utf16:
+        return utf16
+
+    if not _is_utf8(head):
+        return LEGACY_ENCODING
+
+    # عينتان من الوسط والنهاية تكشفان الملفات المختلطة دون قراءتها كاملة
+    size = len(data)
+    if size > ENCODING_SAMPLE_SIZE:
+        middle = size // 2
+        for start in (middle, max(ENCODING_SAMPLE_SIZE, size - ENCODING_PROBE_SIZE)):
+            if not _is_utf8(data[start:start + ENCODING_PROBE_SIZE], at_start=False):
+                return LEGACY_ENCODING
+    return 'utf-8'
+
+
+########################################
+# 2) فك الترميز التدريجي
+########################################
+
+class TextFileReader:
+    """
+    قارئ ملف نصي تدريجي: يكتشف الترميز من عينة، ثم يفك ترميز الملف
+    المربوط بالذاكرة جزءاً جزءاً بمفكك ترميز تدريجي.
+    إن فشل فك UTF-8 المكتشف في الجزء الأول (قبل إخراج أي نص) يُعاد بـ windows-1256.
+    normalize_newlines: توحيد نهايات الأسطر إلى '\\n' أثناء القراءة.
+
+        reader = TextFileReader(path)
+        for chunk in reader: ...
+        reader.encoding   # الترميز المستخدم
+        reader.position   # البايتات المقروءة حتى الآن من reader.size
+    """
+
+    def __init__(self, path, encoding=None, chunk_size=DECODE_CHUNK_SIZE, normalize_newlines=False):
+        self.path = path
+        self.encoding = encoding
+        self.chunk_size = chunk_size
+        self.normalize_newlines = normalize_newlines
+        self.size = os.path.getsize(path)
+        self.position = 0
+
+    def __iter__(self):
+        if not self.normalize_newlines:
+            yield from self._decode()
+            return
+        # '\r' في آخر جزء قد يكون أول '\r\n' فيُؤجل إلى الجزء التالي
+        carry = ''
+        for chunk in self._decode():
+            chunk = carry + chunk
+            carry = ''
+            if chunk.endswith('\r'):
+                carry = '\r'
+                chunk = chunk[:-1]
+            chunk = chunk.replace('\r\n', '\n').replace('\r', '\n')
+            if chunk:
+                yield chunk
+        if carry:
+            yield '\n'
+
+    def _decode(self):
+        if self.size == 0:
+            # ملف فارغ: mmap لا يقبل حجماً صفرياً
+            self.encoding = self.encoding or 'utf-8'
+            return
+
+        with open(self.path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            detected = self.encoding is None
+            if detected:
+                self.encoding = detect_encoding(data)
+            decoder = codecs.getincrementaldecoder(self.encoding)()
+            start = 0
+            while start < self.size:
+                self.position = min(self.size, start + self.chunk_size)
+                try:
+                    chunk = decoder.decode(data[start:self.position])
+                except UnicodeDecodeError:
+                    if not (detected and start == 0 and self.encoding == 'utf-8'):
+                        raise
+                    self.encoding = LEGACY_ENCODING
+                    decoder = codecs.getincrementaldecoder(self.encoding)()
+                    continue
+                start = self.position
+                if chunk:
+                    yield chunk
+            tail = decoder.decode(b'', final=True)
+            if tail:
+                yield tail
+
+
+def read_text_file(path, encoding=None):
+    """
+    قراءة ملف نصي كاملاً بترميزه المكتشف مع توحيد نهايات الأسطر إلى '\\n'.
+    تُرجع (النص، الترميز). إن ظهر بايت غير صالح في UTF-8 خارج العينات
+    يُعاد فك الترميز بـ windows-1256 (حالة نادرة: الملفات المختلطة).
+    """
+    reader = TextFileReader(path, encoding, normalize_newlines=True)
+    try:
+        content = ''.join(reader)
+    except UnicodeDecodeError:
+        if encoding is not None or reader.encoding != 'utf-8':
+            raise
+        reader = TextFileReader(path, LEGACY_ENCODING, normalize_newlines=True)
+        content = ''.join(reader)
+    return content, reader.encoding
+
+
+########################################
+# 3) قراءة DOCX التدفقية
+########################################
+
+# فضاء أسماء WordprocessingML
+W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+RELS_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+OFFICE_DOCUMENT_REL = (
+    'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+)
+DEFAULT_DOCUMENT_PART = 'word/document.xml'
+
+# ما يقابل عناصر التشغيل (w:r) غير النصية، كما في python-docx
+_RUN_TEXT = {
+    W_NS + 'tab': '\t',
+    W_NS + 'ptab': '\t',
+    W_NS + 'cr': '\n',
+    W_NS + 'noBreakHyphen': '-',
+}
+
+
+def find_document_part(archive):
+    """اسم جزء المستند الرئيسي من علاقات الحزمة (عادةً word/document.xml)"""
+    try:
+        rels = ElementTree.fromstring(archive.read('_rels/.rels'))
+    except KeyError:
+        return DEFAULT_DOCUMENT_PART
+    for rel in rels.iter(RELS_NS + 'Relationship'):
+        if rel.get('Type') == OFFICE_DOCUMENT_REL:
+            return posixpath.normpath(rel.get('Target', DEFAULT_DOCUMENT_PART).lstrip('/'))
+    return DEFAULT_DOCUMENT_PART
+
+
+def _run_text(run):
+    """نص تشغيل واحد (w:r): النصوص والجداول وفواصل الأسطر"""
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == W_NS + 't':
+            parts.append(child.text or '')
+        elif tag == W_NS + 'br':
+            # فاصل السطر فقط؛ فواصل الصفحات والأعمدة لا تُنتج نصاً
+            if child.get(W_NS + 'type', 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        elif tag in _RUN_TEXT:
+            parts.append(_RUN_TEXT[tag])
+    return ''.join(parts)
+
+
+def paragraph_text(paragraph):
+    """نص فقرة (w:p) من تشغيلاتها المباشرة وتشغيلات الروابط، كما في python-docx"""
+    parts = []
+    for child in paragraph:
+        if child.tag == W_NS + 'r':
+            parts.append(_run_text(child))
+        elif child.tag == W_NS + 'hyperlink':
+            parts.extend(_run_text(run) for run in child if run.tag == W_NS + 'r')
+    return ''.join(parts)
+
+
+def iter_docx_paragraphs(path):
+    """
+    إخراج نص فقرات جسم مستند Word واحدة واحدة بتحليل تدفقي.
+    تُفرَّغ العناصر بعد معالجتها فتبقى الذاكرة محدودة مهما كبر الملف.
+    الفقرات هي فقرات الجسم المباشرة (مثل doc.paragraphs في python-docx).
+    """
+    with zipfile.ZipFile(path) as archive:
+        with archive.open(find_document_part(archive)) as part:
+            depth = 0
+            body = None
+            for event, element in ElementTree.iterparse(part, events=('start', 'end')):
+                if event == 'start':
+                    depth += 1
+                    if depth == 2 and element.tag == W_NS + 'body':
+                        body = element
+                    continue
+                depth -= 1
+                if depth == 2 and body is not None:
+                    # عنصر مباشر في الجسم (فقرة أو جدول أو غيرهما) اكتمل
+                    if element.tag == W_NS + 'p':
+                        yield paragraph_text(element)
+                    body.clear()
+
+
+def read_docx_text(path):
+    """نص مستند Word كاملاً (فقرة في كل سطر)"""
+    return '\n'.join(iter_docx_paragraphs(path))
+
+
+########################################
+# 4) رومنة DOCX إلى DOCX مع الحفاظ على التنسيق
+########################################
+
+# أجزاء المستند الأخرى التي تحوي نصاً (غير الجزء الرئيسي)
+DOCX_TEXT_PARTS = re.compile(r'^word/(header\d*|footer\d*|footnotes|endnotes|comments)\.xml$')
+
+# حجم القراءة من كل جزء داخل الملف المضغوط (بالبايت)
+DOCX_CHUNK_SIZE = 1 << 16
+
+# الكيانات المعرّفة مسبقاً في XML (و xml.sax.saxutils يستورد urllib فيبطئ بدء الواجهة)
+_XML_ENTITIES = {'lt': '<', 'gt': '>', 'amp': '&', 'quot': '"', 'apos': "'"}
+_XML_ENTITY_PATTERN = re.compile(r'&(#[xX][0-9a-fA-F]+|#[0-9]+|lt|gt|amp|quot|apos);')
+
+
+def _unescape_xml_entity(match):
+    name = match.group(1)
+    if name[0] != '#':
+        return _XML_ENTITIES[name]
+    if name[1] in 'xX':
+        return chr(int(name[2:], 16))
+    return chr(int(name[1:]))
+
+
+def unescape_xml(text):
+    """فك الكيانات في نص عقدة XML"""
+    if '&' not in text:
+        return text
+    return _XML_ENTITY_PATTERN.sub(_unescape_xml_entity, text)
+
+
+def escape_xml(text):
+    """ترميز & و < و > في نص عقدة XML"""
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+_W_PREFIX_PATTERN = re.compile(
+    r'xmlns:(\w+)="http://schemas\.openxmlformats\.org/wordprocessingml/2006/main"'
+)
+
+
+class DocxPartRewriter:
+    """
+    إعادة كتابة جزء XML من مستند Word نصياً (دون إعادة تسلسل XML) فيبقى كل ما عدا
+    محتوى عقد w:t كما هو بايتاً بايتاً.
+
+    الكلمة قد تتوزع على عدة تشغيلات (مثلاً حرف بتنسيق مختلف)، لذا يمر نص عقد
+    الفقرة الواحدة بمُرومن تزايدي واحد: الكلمة المعلّقة عند نهاية عقدة تُرومن كاملةً
+    في العقدة التالية، وتُبقى آخر عقدة معلّقة حتى تنتهي الفقرة أو يأتي فاصل
+    (w:tab، w:br...) فيُضاف إليها ما تبقى.
+    """
+
+    def __init__(self, system, prefix='w'):
+        self.stream = system.stream_romanizer()
+        p = re.escape(prefix)
+        self.pattern = re.compile(
+            r'<{p}:t(?P<attrs>\s[^>]*)?>(?P<text>[^<]*)</{p}:t>'
+            r'|(?P<boundary></?{p}:(?:p|tab|br|cr|ptab|noBreakHyphen|sym)(?=[\s/>]))'.format(p=p)
+        )
+        self.open_text = re.compile(r'<{p}:t(?=[\s>])'.format(p=p))
+        self.chars = 0
+        self._pending = None        # [الوسوم، النص المرومن] لآخر عقدة نص
+        self._pending_tail = []     # XML بعد العقدة المعلّقة
+        self._out = []
+
+    def _write_xml(self, xml):
+        if not xml:
+            return
+        if self._pending is None:
+            self._out.append(xml)
+        else:
+            self._pending_tail.append(xml)
+
+    def _release_pending(self):
+        """كتابة العقدة المعلّقة وما بعدها"""
+        if self._pending is None:
+            return
+        attrs, romanized = self._pending
+        prefix_tag, close_tag = attrs
+        if romanized != romanized.strip() and 'xml:space' not in prefix_tag:
+            prefix_tag = prefix_tag[:-1] + ' xml:space="preserve">'
+        self._out.append(prefix_tag)
+        self._out.append(escape_xml(romanized))
+        self._out.append(close_tag)
+        self._out.extend(self._pending_tail)
+        self._pending = None
+        self._pending_tail = []
+
+    def _handle(self, match):
+        if match.group('boundary'):
+            # نهاية كلمة مؤكدة: ما تبقى معلّقاً يذهب إلى آخر عقدة
+            rest = self.stream.flush()
+            if rest and self._pending is not None:
+                self._pending[1] += rest
+            self._release_pending()
+            self._out.append(match.group(0))
+            return
+
+        text = unescape_xml(match.group('text'))
+        self.chars += len(text)
+        romanized = self.stream.feed(text)
+        self._release_pending()
+        whole = match.group(0)
+        open_end = whole.index('>') + 1
+        close_start = whole.rindex('<')
+        self._pending = [(whole[:open_end], whole[close_start:]), romanized]
+
+    def feed(self, chunk, final=False):
+        """معالجة جزء من XML وإرجاع ما صار جاهزاً للكتابة"""
+        pos = 0
+        for match in self.pattern.finditer(chunk):
+            self._write_xml(chunk[pos:match.start()])
+            self._handle(match)
+            pos = match.end()
+        rest = chunk[pos:]
+
+        if final:
+            self._write_xml(rest)
+            rest = self.stream.flush()
+            if rest and self._pending is not None:
+                self._pending[1] += rest
+            self._release_pending()
+            keep = ''
+        else:
+            # إبقاء ما قد يكون بداية وسم أو عقدة نص لم تكتمل بعد
+            cut = len(rest)
+            lt = rest.rfind('<')
+            if lt != -1 and rest.find('>', lt) == -1:
+                cut = lt
+            match = self.open_text.search(rest)
+            if match:
+                cut = min(cut, match.start())
+            self._write_xml(rest[:cut])
+            keep = rest[cut:]
+
+        out, self._out = ''.join(self._out), []
+        return out, keep
+
+
+def _romanize_docx_part(src, dst, system):
+    """رومنة جزء XML من الملف المضغوط تدفقياً، وإرجاع عدد الأحرف"""
+    head = src.read(DOCX_CHUNK_SIZE)
+    encoding = 'utf-16' if head[:2] in (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE) else 'utf-8'
+    decoder = codecs.getincrementaldecoder(encoding)()
+    encoder = codecs.getincrementalencoder(encoding)()
+
+    final = not head
+    text = decoder.decode(head, final=final)
+    match = _W_PREFIX_PATTERN.search(text)
+    rewriter = DocxPartRewriter(system, match.group(1) if match else 'w')
+
+    keep = ''
+    while True:
+        out, keep = rewriter.feed(keep + text, final=final)
+        if out:
+            dst.write(encoder.encode(out))
+        if final:
+            break
+        data = src.read(DOCX_CHUNK_SIZE)
+        final = not data
+        text = decoder.decode(data, final=final)
+    dst.write(encoder.encode('', final=True))
+    return rewriter.chars
+
+
+def romanize_docx(source, target, system):
+    """
+    نسخ مستند Word إلى target مع رومنة نصوصه في مكانها: جسم المستند والجداول
+    والترويسات والتذييلات والحواشي والتعليقات. بقية أجزاء الملف تُنسخ كما هي.
+    system: نظام مترجم (مثل get_compiled_system(name)).
+    تُرجع عدد الأحرف المرومنة.
+    """
+    if os.path.abspath(source) == os.path.abspath(target):
+        raise ValueError("لا يمكن الكتابة فوق الملف المصدر")
+
+    chars = 0
+    with zipfile.ZipFile(source) as archive, \
+            zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED) as output:
+        document_part = find_document_part(archive)
+        for info in archive.infolist():
+            out_info = zipfile.ZipInfo(info.filename, info.date_time)
+            out_info.compress_type = info.compress_type
+            out_info.external_attr = info.external_attr
+            with archive.open(info) as src, output.open(out_info, 'w') as dst:
+                if info.filename == document_part or DOCX_TEXT_PARTS.match(info.filename):
+                    chars += _romanize_docx_part(src, dst, system)
+                else:
+                    shutil.copyfileobj(src, dst, DOCX_CHUNK_SIZE)
+    return chars
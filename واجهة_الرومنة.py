@@ -2,35 +2,83 @@
 
 import sys
 import os
+import re
 import importlib.util
+from array import array
+from collections import OrderedDict
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QTextEdit, QLabel, QFileDialog, QMessageBox,
-    QSplitter, QToolBar, QStatusBar, QMenuBar, QMenu, QSizePolicy, QComboBox
+    QSplitter, QToolBar, QStatusBar, QMenuBar, QMenu, QSizePolicy, QComboBox,
+    QProgressBar, QScrollBar
 )
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QFont, QColor, QPalette, QAction, QKeySequence
+from PyQt6.QtCore import Qt, QSize, QThread, QTimer, QEvent, QPoint, pyqtSignal
+from PyQt6.QtGui import QFont, QColor, QPalette, QAction, QKeySequence, QTextCursor
 
-# محاولة استيراد مكتبة docx
-try:
-    from docx import Document
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
-
-# استيراد أنظمة الرومنة
+# وحدات الأداة تُحمَّل عند أول استخدام فقط حتى تظهر النافذة بسرعة:
+# حزمة الرومنة بعد أول رسم للنافذة، وقارئ الملفات عند أول استيراد أو تصدير
 current_dir = os.path.dirname(os.path.abspath(__file__))
-try:
-    romanization_systems_file = os.path.join(current_dir, "أنظمة_الرومنة.py")
-    spec = importlib.util.spec_from_file_location("romanization_systems", romanization_systems_file)
-    romanization_systems_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(romanization_systems_module)
-    ROMANIZATION_SYSTEMS = romanization_systems_module.ROMANIZATION_SYSTEMS
-    get_romanization_system = romanization_systems_module.get_romanization_system
-except Exception as e:
-    print(f"خطأ في استيراد أنظمة الرومنة: {e}")
-    sys.exit(1)
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+_loaded_modules = {}
+
+
+def _load_module(module_name, file_name):
+    """تحميل وحدة من مجلد الأداة مرة واحدة"""
+    module = _loaded_modules.get(module_name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(module_name, os.path.join(current_dir, file_name))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _loaded_modules[module_name] = module
+    return module
+
+
+def romanization_systems():
+    """حزمة الرومنة (المحرك وسجل الأنظمة؛ جداول كل نظام تُحمَّل عند أول استخدام له)"""
+    import romanization
+    return romanization
+
+
+def romanization_files():
+    """وحدة قراءة الملفات وكتابتها"""
+    return _load_module("romanization_files", "ملفات_الرومنة.py")
+
+
+def get_romanization_system(system_name):
+    return romanization_systems().get_romanization_system(system_name)
+
+
+def get_compiled_system(system_name):
+    return romanization_systems().get_compiled_system(system_name)
+
+
+def romanize_all(text):
+    return romanization_systems().romanize_all(text)
+
+
+def get_aligned_romanizer(system_name):
+    """دالة ترجع (الرومنة، المحاذاة) للنص بالنظام المختار"""
+    return get_compiled_system(system_name).romanize_text_aligned
+
+
+def read_text_file(path):
+    return romanization_files().read_text_file(path)
+
+
+def open_text_file(path):
+    """قارئ تدريجي للملف النصي بنهايات أسطر موحدة (يُغذّي ConversionWorker مباشرة)"""
+    return romanization_files().TextFileReader(path, normalize_newlines=True)
+
+
+def read_docx_text(path):
+    return romanization_files().read_docx_text(path)
+
+
+def romanize_docx(source, target, system):
+    return romanization_files().romanize_docx(source, target, system)
+
 
 # ألوان Cursor الداكنة
 COLORS = {
@@ -46,12 +94,246 @@ COLORS = {
 }
 
 
+# حجم دفعة التحويل في الخيط الخلفي (بالأحرف، تُقسم عند حدود الفقرات)
+CONVERSION_BATCH_CHARS = 32 * 1024
+
+# التحويل المباشر: مهلة التأخير بعد آخر تعديل، وحد ذاكرة الفقرات المؤقتة
+LIVE_DEBOUNCE_MS = 300
+LIVE_PARAGRAPH_CACHE_SIZE = 50000
+
+# وضع المستند الكبير: الحد الذي يبدأ منه، وحجم الصفحة ونافذة الاستباق (بالفقرات)
+LARGE_DOCUMENT_CHARS = 1000000
+PAGE_PARAGRAPHS = 100
+LOOKAHEAD_PARAGRAPHS = 100
+
+# مواضع Qt بوحدات UTF-16، فالحرف خارج المستوى الأساسي (كالرموز التعبيرية) يُعد فيها موضعين
+ASTRAL_PATTERN = re.compile('[\U00010000-\U0010FFFF]')
+
+NEWLINE_PATTERN = re.compile('\n')
+
+
+def qt_to_index(text, offset):
+    """موضع Qt داخل نص الكتلة -> فهرس Python"""
+    if ASTRAL_PATTERN.search(text) is None:
+        return offset
+    return len(text.encode('utf-16-le')[:offset * 2].decode('utf-16-le', 'ignore'))
+
+
+def index_to_qt(text, index):
+    """فهرس Python داخل نص الكتلة -> موضع Qt"""
+    return index + len(ASTRAL_PATTERN.findall(text, 0, index))
+
+
+class ConversionWorker(QThread):
+    """
+    تحويل النص في خيط خلفي على دفعات من الفقرات، حتى لا تتجمد الواجهة.
+    كل دفعة تُرسل فور رومنتها فتمتلئ النتيجة تدريجياً، ويمكن إلغاء التحويل
+    بين دفعة وأخرى. رقم المهمة job_id يسمح بتجاهل إشارات مهمة أُلغيت.
+    المصدر نص، أو قارئ ملف (TextFileReader) تُرومن أجزاؤه أثناء فك ترميزها
+    وتُرسل فقرات كل دفعة مع رومنتها.
+    """
+    # رقم المهمة، النص المرومن للدفعة، محاذاة كل فقرة، نص المصدر للدفعة (للقارئ فقط، وإلا None)
+    chunk_ready = pyqtSignal(int, str, object, object)
+    progress = pyqtSignal(int, int, int)      # رقم المهمة، الأحرف المنجزة، المجموع
+    failed = pyqtSignal(int, str)             # رقم المهمة، رسالة الخطأ
+    
+    def __init__(self, job_id, source, romanize_func, batch_chars=CONVERSION_BATCH_CHARS, parent=None):
+        # romanize_func(text) -> (الرومنة، المحاذاة)، مثل romanize_text_aligned
+        super().__init__(parent)
+        self.job_id = job_id
+        self.source = source
+        self.romanize_func = romanize_func
+        self.batch_chars = batch_chars
+        self._cancelled = False
+        self.completed = False      # رُومنت كل الدفعات
+        self.error = None           # الاستثناء إن فشل التحويل
+    
+    def cancel(self):
+        """طلب الإلغاء (يُفحص بين الدفعات)"""
+        self._cancelled = True
+    
+    def is_cancelled(self):
+        return self._cancelled
+    
+    def run(self):
+        try:
+            source = self.source
+            reader = None if isinstance(source, str) else source
+            total = len(source) if reader is None else reader.size
+            done = 0
+            pending = ''
+            for chunk in (source,) if reader is None else reader:
+                pending = pending + chunk if pending else chunk
+                # دفعات من الفقرات الكاملة بطول batch_chars تقريباً، تُقتطع دون تقسيم النص كله
+                start = 0
+                while True:
+                    stop = pending.find('\n', start + self.batch_chars - 1)
+                    if stop < 0:
+                        break
+                    done += stop + 1 - start
+                    if not self.process_batch(pending[start:stop], False, reader, done, total):
+                        return
+                    start = stop + 1
+                pending = pending[start:]
+            if self.process_batch(pending, True, reader, total, total):
+                self.completed = True
+        except Exception as e:
+            self.error = e
+            self.failed.emit(self.job_id, str(e))
+    
+    def process_batch(self, batch, last, reader, done, total):
+        """رومنة دفعة وإرسالها؛ تُرجع False إن أُلغي التحويل"""
+        if self._cancelled:
+            return False
+        separator = '' if last else '\n'
+        source = None
+        if reader is not None:
+            source = batch + separator
+            done = reader.position
+        # الفقرات لا تتقاطع مع الكلمات، فكل فقرة تُرومن مع محاذاتها على حدة
+        results = [self.romanize_func(paragraph) for paragraph in batch.split('\n')]
+        romanized = '\n'.join(result[0] for result in results) + separator
+        self.chunk_ready.emit(self.job_id, romanized, [result[1] for result in results], source)
+        self.progress.emit(self.job_id, done, total)
+        return True
+
+
+class BackgroundTask(QThread):
+    """
+    تشغيل عملية واحدة طويلة لا تُقسم إلى دفعات (قراءة ملف، رومنة DOCX) في خيط خلفي.
+    لا يمكن مقاطعتها أثناء تشغيلها، لكن إلغاءها يجعل نتيجتها تُتجاهل عند انتهائها.
+    """
+    
+    def __init__(self, job_id, func, parent=None):
+        super().__init__(parent)
+        self.job_id = job_id
+        self.func = func
+        self._cancelled = False
+        self.completed = False      # انتهت func دون خطأ
+        self.result = None          # ما أرجعته func
+        self.error = None           # الاستثناء إن فشلت
+    
+    def cancel(self):
+        self._cancelled = True
+    
+    def is_cancelled(self):
+        return self._cancelled
+    
+    def run(self):
+        try:
+            self.result = self.func()
+            self.completed = True
+        except Exception as e:
+            self.error = e
+
+
+class PagedDocument:
+    """
+    مستند كبير مقسم إلى صفحات من الفقرات.
+    لا يُحمَّل في مربعي النص كاملاً، بل تُعرض منه نافذة صغيرة،
+    وتُرومن صفحاته عند الحاجة فقط مع الاحتفاظ بها لنظام الرومنة الحالي.
+    """
+    
+    def __init__(self, text, page_paragraphs=PAGE_PARAGRAPHS):
+        # النص نفسه مع بداية كل فقرة فيه، بدل قائمة بسلسلة مستقلة لكل فقرة
+        self._text = text
+        self._starts = array('q', [0])
+        self._starts.extend(match.end() for match in NEWLINE_PATTERN.finditer(text))
+        self.page_paragraphs = page_paragraphs
+        self._pages_system = None
+        self._romanized_pages = {}      # رقم الصفحة -> قائمة الفقرات المرومنة
+        self._page_alignments = {}      # رقم الصفحة -> محاذاة كل فقرة فيها
+    
+    def __len__(self):
+        return len(self._starts)
+    
+    def text(self):
+        return self._text
+    
+    def source_range(self, start, stop):
+        """فقرات المصدر في المدى [start, stop)"""
+        stop = min(stop, len(self))
+        if start >= stop:
+            return []
+        end = self._starts[stop] - 1 if stop < len(self) else len(self._text)
+        return self._text[self._starts[start]:end].split('\n')
+    
+    def romanized_page(self, page, system_name):
+        """رومنة صفحة واحدة (مرة واحدة لكل نظام)"""
+        if system_name != self._pages_system:
+            self._pages_system = system_name
+            self._romanized_pages = {}
+            self._page_alignments = {}
+        romanized = self._romanized_pages.get(page)
+        if romanized is None:
+            start = page * self.page_paragraphs
+            romanize = get_aligned_romanizer(system_name)
+            results = [romanize(paragraph) for paragraph in self.source_range(start, start + self.page_paragraphs)]
+            romanized = [result[0] for result in results]
+            self._romanized_pages[page] = romanized
+            self._page_alignments[page] = [result[1] for result in results]
+        return romanized
+    
+    def romanized_range(self, start, stop, system_name):
+        """الفقرات المرومنة في المدى [start, stop)، برومنة صفحاته فقط"""
+        result = []
+        size = self.page_paragraphs
+        for page in range(start // size, (max(start, stop - 1)) // size + 1):
+            page_start = page * size
+            lines = self.romanized_page(page, system_name)
+            result.extend(lines[max(0, start - page_start):stop - page_start])
+        return result
+    
+    def alignment_range(self, start, stop, system_name):
+        """محاذاة الفقرات في المدى [start, stop) (تُبنى مع رومنة صفحاتها)"""
+        result = []
+        size = self.page_paragraphs
+        for page in range(start // size, (max(start, stop - 1)) // size + 1):
+            page_start = page * size
+            self.romanized_page(page, system_name)
+            result.extend(self._page_alignments[page][max(0, start - page_start):stop - page_start])
+        return result
+
+
 class RomanizationApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.selected_system = 'النظام الحالي'  # النظام الافتراضي
+        self._job_id = 0                        # رقم آخر مهمة تحويل
+        self._workers = set()                   # الخيوط التي لم تنتهِ بعد
+        self.live_mode = False                  # التحويل المباشر أثناء الكتابة
+        self._live_paragraphs = None            # فقرات المدخل الممثلة حالياً في النتيجة
+        self._live_rebuild = None               # فقرات يُعاد بناء النتيجة منها في الخيط الخلفي
+        self._loading_input = None              # قارئ الملف الذي يُملأ منه المدخل تدريجياً
+        self._paragraph_cache = OrderedDict()   # (النظام، الفقرة) -> (الفقرة المرومنة، المحاذاة)
+        self._output_alignments = []            # محاذاة كل كتلة (فقرة) ظاهرة في النتيجة
+        self.sync_enabled = True                # مزامنة التحديد والتمرير بين المربعين
+        self._syncing = False                   # منع ارتداد المزامنة بين المربعين
+        self._job_chunk_handler = None          # معالج دفعات المهمة الخلفية الحالية
+        self._job_label = ''                    # وصف المهمة الحالية في شريط الحالة
+        self.large_doc = None                   # PagedDocument في وضع المستند الكبير
+        self.last_docx_path = None              # آخر ملف Word مستورد (مصدر تصدير DOCX)
         self.init_ui()
         self.setup_dark_theme()
+        # تحميل الأنظمة بعد ظهور النافذة (أول دورة للحلقة الرئيسية)
+        QTimer.singleShot(0, self.load_romanization_systems)
+    
+    def load_romanization_systems(self):
+        """تحميل أنظمة الرومنة وملء قائمة الأنظمة"""
+        try:
+            names = list(romanization_systems().ROMANIZATION_SYSTEMS.keys())
+        except Exception as e:
+            print(f"خطأ في استيراد أنظمة الرومنة: {e}")
+            QMessageBox.critical(self, "خطأ", f"خطأ في استيراد أنظمة الرومنة:\n{str(e)}")
+            self.close()
+            return
+        
+        combo = self.romanization_combo
+        combo.blockSignals(True)
+        combo.clear()
+        combo.addItems(names)
+        combo.setCurrentText(self.selected_system)
+        combo.blockSignals(False)
         
     def init_ui(self):
         """تهيئة الواجهة"""
@@ -67,9 +349,27 @@ class RomanizationApp(QMainWindow):
         # إنشاء المنطقة الرئيسية
         self.create_main_area()
         
-        # إنشاء شريط الحالة
+        # إنشاء شريط الحالة مع شريط تقدم التحويل
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setMaximumWidth(200)
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setVisible(False)
+        self.statusBar().addPermanentWidget(self.progress_bar)
         self.statusBar().showMessage("جاهز")
         
+        # مؤقت التحويل المباشر: يُعاد تشغيله مع كل تعديل
+        self._live_timer = QTimer(self)
+        self._live_timer.setSingleShot(True)
+        self._live_timer.setInterval(LIVE_DEBOUNCE_MS)
+        self._live_timer.timeout.connect(self.live_update)
+        self.text_input.document().contentsChanged.connect(self.on_input_changed)
+        
+        # مزامنة التحديد والتمرير بين المربعين عبر محاذاة الرومنة
+        self.text_output.selectionChanged.connect(lambda: self.sync_selection(self.text_output))
+        self.text_input.selectionChanged.connect(lambda: self.sync_selection(self.text_input))
+        self.text_output.verticalScrollBar().valueChanged.connect(lambda: self.sync_scroll(self.text_output))
+        self.text_input.verticalScrollBar().valueChanged.connect(lambda: self.sync_scroll(self.text_input))
+        
     def setup_dark_theme(self):
         """إعداد الثيم الداكن بألوان Cursor"""
         palette = QPalette()
@@ -105,14 +405,9 @@ class RomanizationApp(QMainWindow):
         file_menu.addAction(import_txt_action)
         
         # استيراد DOCX
-        if DOCX_AVAILABLE:
-            import_docx_action = QAction('استيراد DOCX', self)
-            import_docx_action.triggered.connect(self.import_docx)
-            file_menu.addAction(import_docx_action)
-        else:
-            import_docx_action = QAction('استيراد DOCX (غير متاح)', self)
-            import_docx_action.setEnabled(False)
-            file_menu.addAction(import_docx_action)
+        import_docx_action = QAction('استيراد DOCX', self)
+        import_docx_action.triggered.connect(self.import_docx)
+        file_menu.addAction(import_docx_action)
         
         file_menu.addSeparator()
         
@@ -122,6 +417,16 @@ class RomanizationApp(QMainWindow):
         export_action.triggered.connect(self.export_result)
         file_menu.addAction(export_action)
         
+        # تصدير بكل الأنظمة جنباً إلى جنب
+        export_all_action = QAction('تصدير بكل الأنظمة (جنباً إلى جنب)', self)
+        export_all_action.triggered.connect(self.export_all_systems)
+        file_menu.addAction(export_all_action)
+        
+        # تصدير DOCX مرومن بتنسيق المصدر
+        export_docx_action = QAction('تصدير DOCX مرومن (بتنسيق المصدر)', self)
+        export_docx_action.triggered.connect(self.export_docx)
+        file_menu.addAction(export_docx_action)
+        
         file_menu.addSeparator()
         
         # خروج
@@ -138,6 +443,23 @@ class RomanizationApp(QMainWindow):
         convert_action.triggered.connect(self.convert_text)
         tools_menu.addAction(convert_action)
         
+        stop_action = QAction('إيقاف التحويل', self)
+        stop_action.setShortcut(QKeySequence('Esc'))
+        stop_action.triggered.connect(self.stop_conversion)
+        tools_menu.addAction(stop_action)
+        
+        live_action = QAction('تحويل مباشر أثناء الكتابة', self)
+        live_action.setCheckable(True)
+        live_action.setShortcut(QKeySequence('Ctrl+Shift+L'))
+        live_action.toggled.connect(self.set_live_mode)
+        tools_menu.addAction(live_action)
+        
+        sync_action = QAction('مزامنة التحديد والتمرير بين المربعين', self)
+        sync_action.setCheckable(True)
+        sync_action.setChecked(True)
+        sync_action.toggled.connect(self.set_sync_enabled)
+        tools_menu.addAction(sync_action)
+        
         copy_action = QAction('نسخ النتيجة', self)
         copy_action.setShortcut(QKeySequence('Ctrl+C'))
         copy_action.triggered.connect(self.copy_result)
@@ -153,7 +475,8 @@ class RomanizationApp(QMainWindow):
     def create_toolbar(self):
         """إنشاء شريط الأدوات"""
         toolbar = QToolBar("شريط الأدوات")
-        toolbar.setStyleSheet(f"background-color: {COLORS['toolbar']};")
+        # ورقة أنماط واحدة للشريط وكل عناصره (تُحلَّل مرة واحدة بدل مرة لكل عنصر)
+        toolbar.setStyleSheet(self.get_toolbar_style())
         self.addToolBar(toolbar)
         
         # Spacer على اليسار لتركه فارغاً
@@ -161,42 +484,13 @@ class RomanizationApp(QMainWindow):
         spacer.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
         toolbar.addWidget(spacer)
         
-        # معلومات (إذا لزم الأمر)
-        if not DOCX_AVAILABLE:
-            info_label = QLabel("ملاحظة: تثبيت python-docx لاستيراد DOCX")
-            info_label.setStyleSheet(f"color: {COLORS['fg_secondary']}; padding: 5px; font-size: 9px;")
-            toolbar.addWidget(info_label)
-        
         # قائمة منسدلة لاختيار نوع الرومنة
         romanization_label = QLabel("نوع الرومنة:")
-        romanization_label.setStyleSheet(f"color: {COLORS['fg_secondary']}; padding: 5px;")
         toolbar.addWidget(romanization_label)
         
         self.romanization_combo = QComboBox()
-        self.romanization_combo.addItems(list(ROMANIZATION_SYSTEMS.keys()))
-        self.romanization_combo.setCurrentText(self.selected_system)
-        self.romanization_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: {COLORS['bg_tertiary']};
-                color: {COLORS['fg_primary']};
-                border: 1px solid {COLORS['border']};
-                padding: 5px 10px;
-                border-radius: 3px;
-                min-width: 200px;
-            }}
-            QComboBox:hover {{
-                background-color: {COLORS['hover']};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 20px;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {COLORS['bg_tertiary']};
-                color: {COLORS['fg_primary']};
-                selection-background-color: {COLORS['accent']};
-            }}
-        """)
+        # بقية الأنظمة تُضاف عند تحميلها (load_romanization_systems)
+        self.romanization_combo.addItem(self.selected_system)
         self.romanization_combo.currentTextChanged.connect(self.on_system_changed)
         toolbar.addWidget(self.romanization_combo)
         
@@ -204,21 +498,17 @@ class RomanizationApp(QMainWindow):
         
         # قسم الأدوات (يبدأ من اليمين)
         tools_label = QLabel("الأدوات:")
-        tools_label.setStyleSheet(f"color: {COLORS['fg_secondary']}; padding: 5px;")
         toolbar.addWidget(tools_label)
         
         btn_clear = QPushButton("مسح الكل")
-        btn_clear.setStyleSheet(self.get_button_style())
         btn_clear.clicked.connect(self.clear_all)
         toolbar.addWidget(btn_clear)
         
         btn_copy = QPushButton("نسخ النتيجة")
-        btn_copy.setStyleSheet(self.get_button_style())
         btn_copy.clicked.connect(self.copy_result)
         toolbar.addWidget(btn_copy)
         
         btn_convert = QPushButton("تحويل")
-        btn_convert.setStyleSheet(self.get_button_style())
         btn_convert.clicked.connect(self.convert_text)
         toolbar.addWidget(btn_convert)
         
@@ -226,30 +516,52 @@ class RomanizationApp(QMainWindow):
         
         # قسم الملفات
         btn_export = QPushButton("تصدير النتيجة")
-        btn_export.setStyleSheet(self.get_button_style())
         btn_export.clicked.connect(self.export_result)
         toolbar.addWidget(btn_export)
         
-        if DOCX_AVAILABLE:
-            btn_import_docx = QPushButton("استيراد DOCX")
-            btn_import_docx.setStyleSheet(self.get_button_style())
-            btn_import_docx.clicked.connect(self.import_docx)
-            toolbar.addWidget(btn_import_docx)
-        else:
-            btn_import_docx = QPushButton("استيراد DOCX (غير متاح)")
-            btn_import_docx.setStyleSheet(self.get_button_style())
-            btn_import_docx.setEnabled(False)
-            toolbar.addWidget(btn_import_docx)
+        btn_import_docx = QPushButton("استيراد DOCX")
+        btn_import_docx.clicked.connect(self.import_docx)
+        toolbar.addWidget(btn_import_docx)
         
         btn_import_txt = QPushButton("استيراد TXT")
-        btn_import_txt.setStyleSheet(self.get_button_style())
         btn_import_txt.clicked.connect(self.import_txt)
         toolbar.addWidget(btn_import_txt)
         
         file_label = QLabel("الملفات:")
-        file_label.setStyleSheet(f"color: {COLORS['fg_secondary']}; padding: 5px;")
         toolbar.addWidget(file_label)
     
+    def get_toolbar_style(self):
+        """إرجاع نمط شريط الأدوات (الخلفية والتسميات والقائمة المنسدلة والأزرار)"""
+        return f"""
+            QToolBar {{
+                background-color: {COLORS['toolbar']};
+            }}
+            QLabel {{
+                color: {COLORS['fg_secondary']};
+                padding: 5px;
+            }}
+            QComboBox {{
+                background-color: {COLORS['bg_tertiary']};
+                color: {COLORS['fg_primary']};
+                border: 1px solid {COLORS['border']};
+                padding: 5px 10px;
+                border-radius: 3px;
+                min-width: 200px;
+            }}
+            QComboBox:hover {{
+                background-color: {COLORS['hover']};
+            }}
+            QComboBox::drop-down {{
+                border: none;
+                width: 20px;
+            }}
+            QComboBox QAbstractItemView {{
+                background-color: {COLORS['bg_tertiary']};
+                color: {COLORS['fg_primary']};
+                selection-background-color: {COLORS['accent']};
+            }}
+        """ + self.get_button_style()
+    
     def get_button_style(self):
         """إرجاع نمط الأزرار"""
         return f"""
@@ -281,8 +593,9 @@ class RomanizationApp(QMainWindow):
         main_layout.setSpacing(10)
         main_layout.setContentsMargins(10, 10, 10, 10)
         
-        # Splitter لتقسيم الشاشة
-        splitter = QSplitter(Qt.Orientation.Horizontal)
+        # Splitter لتقسيم الشاشة (أفقي افتراضياً؛ أول وصول إلى تعدادات Qt
+        # يبني كل تعدادات فضاء الأسماء ويكلّف عشرات الميلي ثوانٍ قبل أول رسم)
+        splitter = QSplitter()
         
         # المربع الأول - النص المرومن (على اليسار)
         left_widget = QWidget()
@@ -339,6 +652,20 @@ class RomanizationApp(QMainWindow):
         splitter.setSizes([600, 600])
         
         main_layout.addWidget(splitter)
+        self.main_layout = main_layout
+        # شريط التمرير المشترك لوضع المستند الكبير يُنشأ عند أول استخدام
+        self.large_scrollbar = None
+    
+    def create_large_scrollbar(self):
+        """شريط تمرير مشترك للمربعين في وضع المستند الكبير (بالفقرات)"""
+        self.large_scrollbar = QScrollBar(Qt.Orientation.Vertical)
+        self.large_scrollbar.setVisible(False)
+        self.large_scrollbar.valueChanged.connect(self.render_large_window)
+        self.main_layout.addWidget(self.large_scrollbar)
+        
+        for text_edit in (self.text_input, self.text_output):
+            text_edit.installEventFilter(self)
+            text_edit.viewport().installEventFilter(self)
     
     def import_txt(self):
         """استيراد ملف نصي"""
@@ -351,32 +678,56 @@ class RomanizationApp(QMainWindow):
         
         if file_path:
             try:
-                # محاولة قراءة بترميز UTF-8 أولاً
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                except UnicodeDecodeError:
-                    # إذا فشل، جرب ترميزات أخرى
-                    with open(file_path, 'r', encoding='windows-1256') as f:
-                        content = f.read()
-                
-                self.text_input.setPlainText(content)
-                # تحويل تلقائي بعد الاستيراد
-                self.convert_text()
-                self.statusBar().showMessage("تم استيراد الملف بنجاح", 3000)
+                if os.path.getsize(file_path) < LARGE_DOCUMENT_CHARS:
+                    # عدد الأحرف لا يتجاوز عدد البايتات، فالملف لن يُفتح في وضع المستند الكبير
+                    self.import_txt_stream(file_path)
+                    return
             except Exception as e:
                 QMessageBox.critical(self, "خطأ", f"فشل في قراءة الملف:\n{str(e)}")
+                return
+            
+            # المستند الكبير يُقرأ كاملاً في خيط خلفي ثم يُعرض صفحةً صفحة (تُرومن الصفحات الظاهرة فقط)؛
+            # اكتشاف الترميز من عينة ثم فك ترميزه في مرور واحد
+            def finish(ok, result):
+                if ok:
+                    content, encoding = result
+                    self.load_imported_text(content)
+                    self.statusBar().showMessage(f"تم استيراد الملف بنجاح ({encoding})", 3000)
+            
+            self.start_task(lambda: read_text_file(file_path), finish,
+                            "جارٍ قراءة الملف", "فشل في قراءة الملف")
+    
+    def import_txt_stream(self, file_path):
+        """
+        استيراد ملف نصي مع تحويله في مرور واحد: أجزاء القارئ التدريجي تُغذّي خيط التحويل
+        مباشرة، فتمتلئ فقرات المدخل ورومنتها في المربعين دفعةً دفعة دون تجميع الملف أولاً.
+        """
+        reader = open_text_file(file_path)
+        self.close_large_document()
+        self.cancel_conversion()
+        self._live_paragraphs = None
+        self._output_alignments = []
+        self._loading_input = reader
+        self.text_input.clear()
+        self.text_output.clear()
+        self.text_input.setReadOnly(True)
+        
+        def finish(ok):
+            if self._loading_input is not reader:
+                return
+            self._loading_input = None
+            if self.large_doc is None:
+                self.text_input.setReadOnly(False)
+            if ok:
+                if self.live_mode:
+                    self._live_paragraphs = self.text_input.toPlainText().split('\n')
+                self.statusBar().showMessage(f"تم استيراد الملف بنجاح ({reader.encoding})", 3000)
+        
+        self.start_worker(reader, get_aligned_romanizer(self.selected_system),
+                          self.append_output, finish, f"جارٍ الاستيراد والتحويل ({self.selected_system})")
     
     def import_docx(self):
         """استيراد ملف Word"""
-        if not DOCX_AVAILABLE:
-            QMessageBox.warning(
-                self,
-                "غير متاح",
-                "مكتبة python-docx غير مثبتة.\nقم بتثبيتها باستخدام:\npip install python-docx"
-            )
-            return
-        
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "اختر ملف Word",
@@ -385,25 +736,24 @@ class RomanizationApp(QMainWindow):
         )
         
         if file_path:
-            try:
-                doc = Document(file_path)
-                # استخراج النص من جميع الفقرات
-                content = '\n'.join([paragraph.text for paragraph in doc.paragraphs])
-                
-                self.text_input.setPlainText(content)
-                # تحويل تلقائي بعد الاستيراد
-                self.convert_text()
-                self.statusBar().showMessage("تم استيراد الملف بنجاح", 3000)
-            except Exception as e:
-                QMessageBox.critical(self, "خطأ", f"فشل في قراءة الملف:\n{str(e)}")
+            def finish(ok, content):
+                if ok:
+                    self.last_docx_path = file_path
+                    self.load_imported_text(content)
+                    self.statusBar().showMessage("تم استيراد الملف بنجاح", 3000)
+            
+            # استخراج نص الفقرات بتحليل تدفقي لملف المستند، في خيط خلفي
+            self.start_task(lambda: read_docx_text(file_path), finish,
+                            "جارٍ قراءة الملف", "فشل في قراءة الملف")
     
     def export_result(self):
         """تصدير النتيجة إلى ملف"""
-        result = self.text_output.toPlainText().strip()
-        
-        if not result:
-            QMessageBox.warning(self, "تحذير", "لا يوجد نص للتصدير")
-            return
+        if self.large_doc is None:
+            result = self.text_output.toPlainText().strip()
+            
+            if not result:
+                QMessageBox.warning(self, "تحذير", "لا يوجد نص للتصدير")
+                return
         
         file_path, _ = QFileDialog.getSaveFileName(
             self,
@@ -413,6 +763,9 @@ class RomanizationApp(QMainWindow):
         )
         
         if file_path:
+            if self.large_doc is not None:
+                self.export_large_document(file_path)
+                return
             try:
                 with open(file_path, 'w', encoding='utf-8') as f:
                     f.write(result)
@@ -420,6 +773,123 @@ class RomanizationApp(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, "خطأ", f"فشل في حفظ الملف:\n{str(e)}")
     
+    def export_large_document(self, file_path):
+        """تصدير رومنة المستند الكبير كاملاً دون تجميد الواجهة"""
+        self.write_in_background(
+            file_path, self.large_doc.text(), get_compiled_system(self.selected_system).romanize_text,
+            f"جارٍ تصدير النتيجة ({self.selected_system})"
+        )
+    
+    def write_in_background(self, file_path, text, romanize_func, label, header='', trailer=''):
+        """
+        رومنة text في الخيط الخلفي فقرةً فقرة (romanize_func(فقرة) -> سطر في الملف)،
+        وكتابة كل دفعة فور وصولها إلى ملف مؤقت يحل محل file_path عند الاكتمال
+        (ويُحذف عند الإيقاف أو الخطأ). header و trailer يُكتبان قبل الدفعات وبعدها.
+        """
+        partial = file_path + '.part'
+        try:
+            f = open(partial, 'w', encoding='utf-8')
+            f.write(header)
+        except Exception as e:
+            QMessageBox.critical(self, "خطأ", f"فشل في حفظ الملف:\n{str(e)}")
+            return
+        errors = []
+        
+        def write(romanized, alignments):
+            try:
+                f.write(romanized)
+            except Exception as e:
+                errors.append(e)
+                self.cancel_conversion()
+        
+        def finish(ok):
+            try:
+                if ok:
+                    f.write(trailer)
+                f.close()
+                if ok:
+                    os.replace(partial, file_path)
+                    self.statusBar().showMessage("تم حفظ الملف بنجاح", 3000)
+                    return
+                os.remove(partial)
+            except Exception as e:
+                errors.append(e)
+            if errors:
+                QMessageBox.critical(self, "خطأ", f"فشل في حفظ الملف:\n{str(errors[0])}")
+        
+        self.start_worker(text, lambda paragraph: (romanize_func(paragraph), None), write, finish, label)
+    
+    def export_all_systems(self):
+        """تصدير النص بكل أنظمة الرومنة جنباً إلى جنب (عمود لكل نظام وسطر لكل سطر أصلي)"""
+        input_text = self.current_input_text().strip()
+        
+        if not input_text:
+            QMessageBox.warning(self, "تحذير", "لا يوجد نص للتصدير")
+            return
+        
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "حفظ النتيجة بكل الأنظمة",
+            "",
+            "ملفات TSV (*.tsv);;ملفات نصية (*.txt);;جميع الملفات (*.*)"
+        )
+        
+        if file_path:
+            names = list(romanization_systems().ROMANIZATION_SYSTEMS)
+            
+            def row(paragraph):
+                # مرور واحد على الفقرة لكل الأنظمة
+                results = romanize_all(paragraph)
+                cells = [paragraph] + [results[name] for name in names]
+                return '\t'.join(cell.replace('\t', ' ') for cell in cells)
+            
+            self.write_in_background(
+                file_path, input_text, row, "جارٍ التصدير بكل الأنظمة",
+                header='\t'.join(['النص الأصلي'] + names) + '\n', trailer='\n'
+            )
+    
+    def export_docx(self):
+        """رومنة ملف Word في مكانه (مع الحفاظ على التنسيق والجداول والحواشي) وحفظه"""
+        source = self.last_docx_path
+        if not source or not os.path.exists(source):
+            source, _ = QFileDialog.getOpenFileName(
+                self,
+                "اختر ملف Word المصدر",
+                "",
+                "ملفات Word (*.docx);;جميع الملفات (*.*)"
+            )
+            if not source:
+                return
+        
+        base, _ = os.path.splitext(source)
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "حفظ ملف Word المرومن",
+            base + " - مرومن.docx",
+            "ملفات Word (*.docx)"
+        )
+        
+        if file_path:
+            if os.path.abspath(source) == os.path.abspath(file_path):
+                QMessageBox.critical(self, "خطأ", "فشل في حفظ الملف:\nلا يمكن الكتابة فوق الملف المصدر")
+                return
+            # الرومنة في خيط خلفي إلى ملف مؤقت يحل محل الهدف عند الاكتمال
+            partial = file_path + '.part'
+            system = get_compiled_system(self.selected_system)
+            
+            def finish(ok, _):
+                try:
+                    if ok:
+                        os.replace(partial, file_path)
+                        self.statusBar().showMessage("تم حفظ الملف بنجاح", 3000)
+                    elif os.path.exists(partial):
+                        os.remove(partial)
+                except Exception as e:
+                    QMessageBox.critical(self, "خطأ", f"فشل في حفظ الملف:\n{str(e)}")
+            
+            self.start_task(lambda: romanize_docx(source, partial, system), finish,
+                            f"جارٍ رومنة ملف Word ({self.selected_system})", "فشل في حفظ الملف")
+    
     def clear_all(self):
         """مسح جميع النصوص"""
         reply = QMessageBox.question(
@@ -430,12 +900,29 @@ class RomanizationApp(QMainWindow):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
+            self.cancel_conversion()
+            self.close_large_document()
             self.text_input.clear()
             self.text_output.clear()
+            self._live_paragraphs = None
+            self._output_alignments = []
             self.statusBar().showMessage("تم المسح", 2000)
     
     def copy_result(self):
         """نسخ النتيجة إلى الحافظة"""
+        if self.large_doc is not None:
+            # رومنة المستند الكبير كاملاً في الخيط الخلفي، ثم النسخ عند اكتمالها
+            parts = []
+            
+            def finish(ok):
+                if ok:
+                    QApplication.clipboard().setText(''.join(parts).strip())
+                    self.statusBar().showMessage("تم نسخ النص إلى الحافظة", 2000)
+            
+            self.romanize_large_document(lambda romanized, _: parts.append(romanized), finish,
+                                         "جارٍ رومنة المستند للنسخ")
+            return
+        
         result = self.text_output.toPlainText().strip()
         
         if not result:
@@ -450,27 +937,513 @@ class RomanizationApp(QMainWindow):
         """عند تغيير نظام الرومنة"""
         self.selected_system = system_name
         # تحويل تلقائي عند تغيير النظام
-        if self.text_input.toPlainText().strip():
+        if self.large_doc is not None or self.text_input.toPlainText().strip():
             self.convert_text()
     
     def convert_text(self):
-        """تحويل النص إلى رومنة"""
-        input_text = self.text_input.toPlainText().strip()
+        """تحويل النص إلى رومنة في خيط خلفي (يلغي أي تحويل جارٍ)"""
+        self.cancel_conversion()
+        if self.large_doc is not None:
+            # في وضع المستند الكبير تُرومن النافذة الظاهرة فقط
+            self.render_large_window()
+            self.statusBar().showMessage(f"تم التحويل بنجاح ({self.selected_system})", 2000)
+            return
+        if self.live_mode:
+            # في الوضع المباشر تُعاد بناء النتيجة من ذاكرة الفقرات
+            self._live_paragraphs = None
+            self.live_update()
+            return
+        # النص كاملاً بأسطره الفارغة، فتقابل كل كتلة في النتيجة فقرتها في المدخل
+        input_text = self.text_input.toPlainText()
         
-        if not input_text:
+        self._output_alignments = []
+        if not input_text.strip():
             self.text_output.clear()
             return
         
-        try:
-            # استخدام النظام المختار
-            romanize_func = get_romanization_system(self.selected_system)
-            romanized = romanize_func(input_text)
-            self.text_output.setPlainText(romanized)
-            self.statusBar().showMessage(f"تم التحويل بنجاح ({self.selected_system})", 2000)
-        except Exception as e:
-            QMessageBox.critical(self, "خطأ", f"حدث خطأ أثناء التحويل:\n{str(e)}")
+        self.text_output.clear()
+        self.start_worker(
+            input_text, get_aligned_romanizer(self.selected_system),
+            self.append_output, self.on_conversion_finished,
+            f"جارٍ التحويل ({self.selected_system})"
+        )
+    
+    def start_worker(self, text, romanize_func, on_chunk, on_finish, label):
+        """
+        تشغيل رومنة text في خيط خلفي على دفعات (يلغي أي مهمة جارية).
+        on_chunk(الرومنة، المحاذاة) لكل دفعة من المهمة الحالية، و on_finish(ok) مرة واحدة
+        عند انتهاء الخيط: ok صحيحة إن اكتملت المهمة دون إلغاء أو خطأ.
+        """
+        self.cancel_conversion()
+        self._job_id += 1
+        worker = ConversionWorker(self._job_id, text, romanize_func, parent=self)
+        worker.on_finish = on_finish
+        worker.chunk_ready.connect(self.on_chunk_ready)
+        worker.progress.connect(self.on_conversion_progress)
+        worker.failed.connect(self.on_conversion_failed)
+        worker.finished.connect(lambda w=worker: self.on_worker_finished(w))
+        self._workers.add(worker)
+        self._job_chunk_handler = on_chunk
+        self._job_label = label
+        
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        self.statusBar().showMessage(f"{label}...")
+        worker.start()
+    
+    def start_task(self, func, on_finish, label, error_message):
+        """
+        تشغيل func() في خيط خلفي (يلغي أي مهمة جارية) مع مؤشر انشغال، ويمكن إيقافها بـ Esc.
+        on_finish(ok، النتيجة) مرة واحدة عند انتهاء الخيط؛ وإن فشلت المهمة الحالية
+        يُعرض خطؤها بعد error_message.
+        """
+        self.cancel_conversion()
+        self._job_id += 1
+        worker = BackgroundTask(self._job_id, func, parent=self)
+        
+        def finish(ok):
+            if worker.job_id == self._job_id and worker.error is not None:
+                self.progress_bar.setVisible(False)
+                QMessageBox.critical(self, "خطأ", f"{error_message}:\n{str(worker.error)}")
+            on_finish(ok, worker.result)
+        
+        worker.on_finish = finish
+        worker.finished.connect(lambda w=worker: self.on_worker_finished(w))
+        self._workers.add(worker)
+        
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setVisible(True)
+        self.statusBar().showMessage(f"{label}...")
+        worker.start()
+    
+    def cancel_conversion(self):
+        """إلغاء التحويل الجاري إن وُجد (نتائجه المتأخرة تُتجاهل)"""
+        for worker in self._workers:
+            worker.cancel()
+        self._job_id += 1
+        self._live_rebuild = None
+        self.progress_bar.setVisible(False)
+    
+    def stop_conversion(self):
+        """إيقاف المهمة الجارية بطلب المستخدم"""
+        if any(not worker.is_cancelled() for worker in self._workers):
+            self.cancel_conversion()
+            self.statusBar().showMessage("تم إيقاف المهمة", 2000)
+    
+    def on_chunk_ready(self, job_id, romanized, alignments, source):
+        """
+        تمرير دفعة مرومنة من المهمة الحالية إلى معالجها،
+        بعد إلحاق فقراتها بالمدخل إن كانت من ملف يُستورد.
+        """
+        if job_id != self._job_id:
+            return
+        if source is not None:
+            cursor = QTextCursor(self.text_input.document())
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            cursor.insertText(source)
+        self._job_chunk_handler(romanized, alignments)
+    
+    def append_output(self, romanized, alignments):
+        """إلحاق دفعة مرومنة بنهاية النتيجة، ومحاذاة فقراتها بقائمة المحاذاة"""
+        cursor = QTextCursor(self.text_output.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(romanized)
+        self._output_alignments.extend(alignments)
+    
+    def on_conversion_progress(self, job_id, done, total):
+        """تحديث شريط التقدم"""
+        if job_id != self._job_id:
+            return
+        percent = int(done * 100 / total) if total else 100
+        self.progress_bar.setValue(percent)
+        self.statusBar().showMessage(f"{self._job_label}... {percent}%")
+    
+    def on_conversion_failed(self, job_id, message):
+        if job_id != self._job_id:
+            return
+        self.progress_bar.setVisible(False)
+        QMessageBox.critical(self, "خطأ", f"حدث خطأ أثناء التحويل:\n{message}")
+        if self.large_doc is None:
+            # في وضع المستند الكبير النتيجة الظاهرة ليست من هذه المهمة
             self.text_output.clear()
-
+            self._output_alignments = []
+    
+    def on_conversion_finished(self, ok):
+        if ok:
+            self.statusBar().showMessage(f"تم التحويل بنجاح ({self.selected_system})", 2000)
+    
+    def on_worker_finished(self, worker):
+        """عند انتهاء خيط: تنظيفه، وإبلاغ مهمته بانتهائها (ونجاحها إن كانت الحالية واكتملت)"""
+        self._workers.discard(worker)
+        ok = worker.job_id == self._job_id and worker.completed
+        if ok:
+            self.progress_bar.setVisible(False)
+        worker.on_finish(ok)
+        worker.deleteLater()
+    
+    ########################################
+    # التحويل المباشر (فقرات معدلة فقط)
+    ########################################
+    
+    def set_live_mode(self, enabled):
+        """تفعيل/إيقاف التحويل المباشر أثناء الكتابة"""
+        self.live_mode = enabled
+        self._live_timer.stop()
+        self._live_paragraphs = None
+        if enabled:
+            self.cancel_conversion()
+            self.live_update()
+            self.statusBar().showMessage("التحويل المباشر مفعل", 2000)
+        else:
+            self.statusBar().showMessage("التحويل المباشر متوقف", 2000)
+    
+    def on_input_changed(self):
+        """تأجيل التحديث حتى يتوقف المستخدم عن الكتابة لحظة"""
+        if self._loading_input is not None:
+            return
+        if self.live_mode and self.large_doc is None:
+            self._live_timer.start()
+        elif self.large_doc is None:
+            # النتيجة لم تعد تقابل المدخل حتى التحويل التالي
+            self._output_alignments = []
+    
+    def romanize_paragraph(self, paragraph):
+        """رومنة فقرة واحدة مع محاذاتها: (الرومنة، المحاذاة)، بذاكرة مؤقتة بحسب النظام ونص الفقرة"""
+        key = (self.selected_system, paragraph)
+        cache = self._paragraph_cache
+        result = cache.get(key)
+        if result is not None:
+            cache.move_to_end(key)
+            return result
+        result = get_aligned_romanizer(self.selected_system)(paragraph)
+        self.cache_paragraph(key, result)
+        return result
+    
+    def cache_paragraph(self, key, result):
+        cache = self._paragraph_cache
+        cache[key] = result
+        if len(cache) > LIVE_PARAGRAPH_CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    def rebuild_live_output(self, paragraphs):
+        """
+        إعادة بناء النتيجة كاملة في الوضع المباشر (أول تفعيل، تغيير النظام، التحويل).
+        النص الصغير يُبنى مباشرة من ذاكرة الفقرات، والكبير في الخيط الخلفي على دفعات
+        تملأ النتيجة وذاكرة الفقرات معاً؛ والتعديلات أثناء ذلك تُرقَّع بعد اكتماله.
+        """
+        text = '\n'.join(paragraphs)
+        if len(text) <= CONVERSION_BATCH_CHARS:
+            results = [self.romanize_paragraph(p) for p in paragraphs]
+            self.text_output.setPlainText('\n'.join(result[0] for result in results))
+            self._output_alignments = [result[1] for result in results]
+            self._live_paragraphs = paragraphs
+            return
+        
+        system_name = self.selected_system
+        done = [0]
+        
+        def on_chunk(romanized, alignments):
+            self.append_output(romanized, alignments)
+            start = done[0]
+            done[0] += len(alignments)
+            lines = romanized.split('\n')
+            for paragraph, line, alignment in zip(paragraphs[start:done[0]], lines, alignments):
+                self.cache_paragraph((system_name, paragraph), (line, alignment))
+        
+        def finish(ok):
+            if self._live_rebuild is not paragraphs:
+                return
+            self._live_rebuild = None
+            if ok:
+                self._live_paragraphs = paragraphs
+                self.statusBar().showMessage(f"تم التحويل بنجاح ({system_name})", 2000)
+                self.live_update()
+        
+        self._output_alignments = []
+        self.text_output.clear()
+        self.start_worker(text, get_aligned_romanizer(system_name), on_chunk, finish,
+                          f"جارٍ التحويل ({system_name})")
+        self._live_rebuild = paragraphs
+    
+    def live_update(self):
+        """
+        رومنة الفقرات التي تغيرت فقط، وترقيعها في النتيجة مكانها.
+        كل فقرة في المدخل تقابلها كتلة (سطر) واحدة في النتيجة، فيكفي إيجاد
+        البادئة واللاحقة المشتركتين بين قائمتي الفقرات القديمة والجديدة
+        واستبدال ما بينهما.
+        """
+        if not self.live_mode or self.large_doc is not None or self._live_rebuild is not None:
+            return
+        
+        paragraphs = self.text_input.toPlainText().split('\n')
+        old = self._live_paragraphs
+        if old is None:
+            self.rebuild_live_output(paragraphs)
+            return
+        self._live_paragraphs = paragraphs
+        
+        old_count, new_count = len(old), len(paragraphs)
+        limit = min(old_count, new_count)
+        start = 0
+        while start < limit and old[start] == paragraphs[start]:
+            start += 1
+        limit -= start
+        end = 0
+        while end < limit and old[old_count - 1 - end] == paragraphs[new_count - 1 - end]:
+            end += 1
+        
+        old_stop = old_count - end      # الكتل [start, old_stop) في النتيجة تُستبدل
+        new_stop = new_count - end      # بالفقرات [start, new_stop) من المدخل
+        if start == old_stop and start == new_stop:
+            return
+        
+        results = [self.romanize_paragraph(p) for p in paragraphs[start:new_stop]]
+        replacement = '\n'.join(result[0] for result in results)
+        self._output_alignments[start:old_stop] = [result[1] for result in results]
+        doc = self.text_output.document()
+        cursor = QTextCursor(doc)
+        cursor.beginEditBlock()
+        
+        if start == old_stop:
+            # إدراج فقرات جديدة فقط
+            if start < old_count:
+                cursor.setPosition(doc.findBlockByNumber(start).position())
+                cursor.insertText(replacement + '\n')
+            else:
+                cursor.movePosition(QTextCursor.MoveOperation.End)
+                cursor.insertText('\n' + replacement)
+        elif start == new_stop:
+            # حذف فقرات فقط (مع فاصل سطر واحد)
+            if start > 0:
+                previous = doc.findBlockByNumber(start - 1)
+                cursor.setPosition(previous.position() + previous.length() - 1)
+                last = doc.findBlockByNumber(old_stop - 1)
+                cursor.setPosition(last.position() + last.length() - 1, QTextCursor.MoveMode.KeepAnchor)
+            else:
+                cursor.setPosition(0)
+                cursor.setPosition(doc.findBlockByNumber(old_stop).position(), QTextCursor.MoveMode.KeepAnchor)
+            cursor.removeSelectedText()
+        else:
+            # استبدال الكتل المتغيرة
+            cursor.setPosition(doc.findBlockByNumber(start).position())
+            last = doc.findBlockByNumber(old_stop - 1)
+            cursor.setPosition(last.position() + last.length() - 1, QTextCursor.MoveMode.KeepAnchor)
+            cursor.insertText(replacement)
+        
+        cursor.endEditBlock()
+    
+    ########################################
+    # مزامنة التحديد والتمرير (بمحاذاة الرومنة)
+    ########################################
+    
+    def set_sync_enabled(self, enabled):
+        """تفعيل/إيقاف مزامنة التحديد والتمرير بين المربعين"""
+        self.sync_enabled = enabled
+        if not enabled:
+            for text_edit in (self.text_input, self.text_output):
+                text_edit.setExtraSelections([])
+    
+    def map_position(self, text_edit, position, end=False):
+        """
+        موضع في أحد المربعين -> الموضع المقابل في الآخر، عبر محاذاة كتلته
+        (كل كتلة في النتيجة تقابل الفقرة ذات الرقم نفسه في المدخل). None إن لم تتوفر محاذاة.
+        end: الموضع نهاية مجال، فيُوسَّع إلى نهاية الكلمة المقابلة.
+        """
+        block = text_edit.document().findBlock(position)
+        number = block.blockNumber()
+        if number < 0 or number >= len(self._output_alignments):
+            return None
+        alignment = self._output_alignments[number]
+        from_output = text_edit is self.text_output
+        other = self.text_input if from_output else self.text_output
+        target = other.document().findBlockByNumber(number)
+        if not target.isValid():
+            return None
+        index = qt_to_index(block.text(), position - block.position())
+        to_other = alignment.to_source if from_output else alignment.to_output
+        mapped = to_other(0, index)[1] if end else to_other(index)[0]
+        return target.position() + index_to_qt(target.text(), mapped)
+    
+    def sync_selection(self, text_edit):
+        """تظليل المقابل لتحديد أحد المربعين في الآخر، مع تمريره إليه"""
+        if not self.sync_enabled or self._syncing:
+            return
+        other = self.text_input if text_edit is self.text_output else self.text_output
+        cursor = text_edit.textCursor()
+        if not cursor.hasSelection():
+            other.setExtraSelections([])
+            return
+        start = self.map_position(text_edit, cursor.selectionStart())
+        end = self.map_position(text_edit, cursor.selectionEnd(), end=True)
+        if start is None or end is None:
+            other.setExtraSelections([])
+            return
+        
+        highlight = QTextEdit.ExtraSelection()
+        highlight.format.setBackground(QColor(COLORS['accent']))
+        highlight.cursor = QTextCursor(other.document())
+        highlight.cursor.setPosition(start)
+        highlight.cursor.setPosition(max(start, end), QTextCursor.MoveMode.KeepAnchor)
+        other.setExtraSelections([highlight])
+        
+        # إظهار التظليل دون أن يُرجِع تمريرُه المربعَ الأول
+        self._syncing = True
+        try:
+            rect = other.cursorRect(highlight.cursor)
+            bar = other.verticalScrollBar()
+            if rect.top() < 0 or rect.bottom() > other.viewport().height():
+                bar.setValue(bar.value() + rect.top() - other.viewport().height() // 3)
+        finally:
+            self._syncing = False
+    
+    def sync_scroll(self, text_edit):
+        """تمرير المربع الآخر حتى يبدأ بما يقابل أول ما يظهر في هذا المربع"""
+        if not self.sync_enabled or self._syncing or self.large_doc is not None:
+            return
+        position = text_edit.cursorForPosition(QPoint(0, 0)).position()
+        mapped = self.map_position(text_edit, position)
+        if mapped is None:
+            return
+        other = self.text_input if text_edit is self.text_output else self.text_output
+        cursor = QTextCursor(other.document())
+        cursor.setPosition(mapped)
+        self._syncing = True
+        try:
+            bar = other.verticalScrollBar()
+            bar.setValue(bar.value() + other.cursorRect(cursor).top())
+        finally:
+            self._syncing = False
+    
+    ########################################
+    # وضع المستند الكبير (عرض مُجزّأ عند الطلب)
+    ########################################
+    
+    def load_input_text(self, content):
+        """تحميل نص مستورد: مباشرة إن كان صغيراً، وإلا في وضع المستند الكبير"""
+        if len(content) >= LARGE_DOCUMENT_CHARS:
+            self.open_large_document(content)
+        else:
+            self.close_large_document()
+            self.text_input.setPlainText(content)
+    
+    def load_imported_text(self, content):
+        """تحميل نص ملف مستورد ثم تحويله تلقائياً"""
+        self.load_input_text(content)
+        self.convert_text()
+    
+    def current_input_text(self):
+        """النص الأصلي كاملاً (من المستند الكبير إن كان مفتوحاً)"""
+        if self.large_doc is not None:
+            return self.large_doc.text()
+        return self.text_input.toPlainText()
+    
+    def romanize_large_document(self, on_chunk, on_finish, label):
+        """
+        رومنة المستند الكبير كاملاً (للتصدير والنسخ) في الخيط الخلفي مع التقدم والإيقاف،
+        دون المرور بصفحات العرض ولا الاحتفاظ بالنتيجة فيها.
+        """
+        romanize = get_compiled_system(self.selected_system).romanize_text
+        self.start_worker(
+            self.large_doc.text(), lambda paragraph: (romanize(paragraph), None),
+            on_chunk, on_finish, f"{label} ({self.selected_system})"
+        )
+    
+    def open_large_document(self, content):
+        """فتح نص كبير للعرض المُجزّأ: المربعان للقراءة فقط ويتحركان معاً"""
+        self.cancel_conversion()
+        self._live_paragraphs = None
+        self.large_doc = PagedDocument(content)
+        if self.large_scrollbar is None:
+            self.create_large_scrollbar()
+        for text_edit in (self.text_input, self.text_output):
+            text_edit.setReadOnly(True)
+            text_edit.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        
+        self.large_scrollbar.blockSignals(True)
+        self.large_scrollbar.setRange(0, max(0, len(self.large_doc) - 1))
+        self.large_scrollbar.setValue(0)
+        self.large_scrollbar.blockSignals(False)
+        self.large_scrollbar.setVisible(True)
+        self.statusBar().showMessage(
+            f"وضع المستند الكبير: {len(self.large_doc)} فقرة، تُعرض وتُرومن عند الطلب", 5000
+        )
+        self.render_large_window()
+    
+    def close_large_document(self):
+        """العودة إلى العرض العادي"""
+        if self.large_doc is None:
+            return
+        self.large_doc = None
+        self._output_alignments = []
+        self.large_scrollbar.setVisible(False)
+        self.text_input.setReadOnly(False)
+        for text_edit in (self.text_input, self.text_output):
+            text_edit.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+            text_edit.clear()
+    
+    def visible_paragraphs(self):
+        """تقدير عدد الأسطر الظاهرة في المربع"""
+        line_height = max(1, self.text_input.fontMetrics().lineSpacing())
+        return max(1, self.text_input.viewport().height() // line_height)
+    
+    def render_large_window(self):
+        """
+        عرض النافذة الظاهرة من المستند الكبير في المربعين بدءاً من الفقرة نفسها،
+        مع نافذة استباق تحتها. لا يُرومن إلا صفحات هذه النافذة.
+        """
+        if self.large_doc is None:
+            return
+        visible = self.visible_paragraphs()
+        self.large_scrollbar.setPageStep(visible)
+        start = self.large_scrollbar.value()
+        stop = min(len(self.large_doc), start + visible + LOOKAHEAD_PARAGRAPHS)
+        
+        self.text_input.setPlainText('\n'.join(self.large_doc.source_range(start, stop)))
+        self.text_output.setPlainText(
+            '\n'.join(self.large_doc.romanized_range(start, stop, self.selected_system))
+        )
+        self._output_alignments = self.large_doc.alignment_range(start, stop, self.selected_system)
+    
+    def eventFilter(self, obj, event):
+        """توجيه العجلة ومفاتيح التنقل في المربعين إلى شريط التمرير المشترك"""
+        if self.large_doc is not None:
+            bar = self.large_scrollbar
+            if event.type() == QEvent.Type.Wheel:
+                # ثلاث فقرات لكل درجة من العجلة
+                bar.setValue(bar.value() - event.angleDelta().y() // 40)
+                return True
+            if event.type() == QEvent.Type.KeyPress:
+                key = event.key()
+                actions = {
+                    Qt.Key.Key_PageDown: QScrollBar.SliderAction.SliderPageStepAdd,
+                    Qt.Key.Key_PageUp: QScrollBar.SliderAction.SliderPageStepSub,
+                    Qt.Key.Key_Down: QScrollBar.SliderAction.SliderSingleStepAdd,
+                    Qt.Key.Key_Up: QScrollBar.SliderAction.SliderSingleStepSub,
+                }
+                if key in actions:
+                    bar.triggerAction(actions[key])
+                    return True
+                if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+                    if key == Qt.Key.Key_Home:
+                        bar.setValue(bar.minimum())
+                        return True
+                    if key == Qt.Key.Key_End:
+                        bar.setValue(bar.maximum())
+                        return True
+        return super().eventFilter(obj, event)
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.large_doc is not None:
+            self.render_large_window()
+    
+    def closeEvent(self, event):
+        """إيقاف الخيوط الخلفية قبل إغلاق النافذة"""
+        for worker in list(self._workers):
+            worker.cancel()
+            worker.wait()
+        super().closeEvent(event)
 
 def main():
     app = QApplication(sys.argv)